@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""Compare output size and render time of Unicode box-drawing tables against UnixTable's DEC line drawing.
+
+Usage: python benchmarks/bench_box_drawing.py
+"""
+
+from __future__ import print_function
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# pylint: disable=wrong-import-position
+from terminaltables.other_tables import UnicodeTable, UnicodeTableDouble, UnixTable  # noqa
+
+SHAPES = (('1000x5', 1000, 5, False), ('1000x5 row borders', 1000, 5, True), ('20x40 wide', 20, 40, False))
+TABLE_CLASSES = (UnixTable, UnicodeTable, UnicodeTableDouble)
+WORDS = [u'Avocado', u'green', u'192.168.0.100', u'vegetable', u'', u'42']
+
+
+def main(repeat=5):
+    """Render each shape with each class and print UTF-8 output size and best render time.
+
+    :param int repeat: Number of timed renders, the fastest one is used.
+    """
+    print('{0:<20} {1:<20} {2:>10} {3:>8} {4:>10}'.format('shape', 'class', 'bytes', 'ratio', 'seconds'))
+    for name, rows, columns, row_borders in SHAPES:
+        rng = random.Random(0)
+        table_data = [[rng.choice(WORDS) for _ in range(columns)] for _ in range(rows)]
+        baseline = None
+        for cls in TABLE_CLASSES:
+            table = cls(table_data, 'Title')
+            table.inner_row_border = row_borders
+            size = len(table.table.encode('utf-8'))
+            baseline = baseline or size
+            seconds = min(timeit.repeat(lambda t=table: t.table, number=1, repeat=repeat))
+            print('{0:<20} {1:<20} {2:>10} {3:>7.2f}x {4:>10.6f}'.format(
+                name, cls.__name__, size, size / float(baseline), seconds))
+
+
+if __name__ == '__main__':
+    main()
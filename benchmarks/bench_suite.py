@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""Time every rendering stage on several table shapes and datasets, and compare results between commits.
+
+Usage:
+    python benchmarks/bench_suite.py [--max-cells N] [--filter TEXT] [--save FILE] [--compare FILE] [--threshold X]
+
+Examples:
+    git checkout master && python benchmarks/bench_suite.py --save /tmp/master.json
+    git checkout feature && python benchmarks/bench_suite.py --compare /tmp/master.json
+
+Benchmark names are stage/dataset/shape. Shapes range from 10x3 to 1Mx20 (rows x columns), shapes with more than
+--max-cells cells are skipped (pass --max-cells 0 to run everything, the largest needs several GB of memory).
+
+Every run also times a fixed pure Python loop. Comparisons divide each time by that calibration time, so results from
+slightly faster or slower machines (or a busy laptop) are still comparable. --compare exits with status 1 if any
+benchmark is slower than the baseline by more than --threshold times.
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# pylint: disable=wrong-import-position
+from terminaltables import AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, PorcelainTable, SingleTable  # noqa
+from terminaltables.build import build_border, build_row, combine, flatten  # noqa
+from terminaltables.other_tables import UnicodeTable, UnicodeTableDouble, UnixTable  # noqa
+from terminaltables.width_and_alignment import align_and_pad_cell, max_dimensions, visible_width  # noqa
+
+SHAPES = (('10x3', 10, 3), ('1kx5', 1000, 5), ('10kx10', 10000, 10), ('100kx20', 100000, 20), ('1Mx20', 1000000, 20))
+TABLE_CLASSES = (
+    AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, PorcelainTable, SingleTable, UnicodeTable, UnicodeTableDouble,
+    UnixTable,
+)
+WORDS = {
+    'ascii': [u'Avocado', u'green', u'192.168.0.100', u'vegetable', u'Lettuce is leafy', u'', u'42'],
+    'cjk': [u'世界你好', u'蓝色', u'hello 世界', u'東京都渋谷区', u'다람쥐 헌 쳇바퀴', u'', u'42'],
+    'ansi': [u'\033[32m<10ms\033[39m', u'\033[1;33m10ms <= 100ms\033[0m', u'\033[31m>100ms\033[39m', u'plain'],
+    'multiline': [u'One\nTwo', u'Avocado', u'Three\nlines\nhere', u'', u'green\n'],
+}
+DATASETS = ('ascii', 'cjk', 'ansi', 'multiline', 'title', 'ragged')
+STAGES = ('visible_width', 'max_dimensions', 'align_and_pad_cell', 'build_border', 'build_row', 'combine', 'flatten')
+
+
+def make_table(dataset, rows, columns, seed=0):
+    """Generate the same table data for the same arguments on every run.
+
+    :param str dataset: One of DATASETS.
+    :param int rows: Number of rows.
+    :param int columns: Number of columns (maximum for ragged rows).
+    :param int seed: Random seed.
+
+    :return: Table data and table title.
+    :rtype: tuple
+    """
+    rng = random.Random(seed)
+    words = WORDS.get(dataset, WORDS['ascii'])
+    if dataset == 'ragged':
+        table_data = [[rng.choice(words) for _ in range(rng.randint(1, columns))] for _ in range(rows)]
+    else:
+        table_data = [[rng.choice(words) for _ in range(columns)] for _ in range(rows)]
+    title = u'Quarterly report: {0} rows, 蓝色 and \033[1mbold\033[0m text'.format(rows) if dataset == 'title' else None
+    return table_data, title
+
+
+def stage_benchmarks(table_data, title):
+    """Build one callable for each rendering stage, with everything the stage needs computed beforehand.
+
+    :param list table_data: Table data.
+    :param str title: Table title or None.
+
+    :return: Callables by stage name.
+    :rtype: dict
+    """
+    cells = [c for row in table_data for c in row]
+    inner_widths, inner_heights, outer_widths = max_dimensions(table_data, 1, 1)[:3]
+    columns = len(inner_widths)
+    padded_rows = [list(r) + [u''] * (columns - len(r)) for r in table_data]
+    aligned = [
+        [align_and_pad_cell(c, ('right' if i % 2 else 'left',), (inner_widths[i], h), (1, 1, 0, 0))
+         for i, c in enumerate(row)]
+        for row, h in zip(padded_rows, inner_heights)
+    ]
+    table = AsciiTable(table_data, title)
+    components = [list(line) for line in table.gen_table(inner_widths, inner_heights, outer_widths)]
+
+    def align():
+        """Align and pad every cell."""
+        for row, height in zip(padded_rows, inner_heights):
+            for i, cell in enumerate(row):
+                align_and_pad_cell(cell, ('right' if i % 2 else 'left',), (inner_widths[i], height), (1, 1, 0, 0))
+
+    return dict(
+        visible_width=lambda: [visible_width(c) for c in cells],
+        max_dimensions=lambda: max_dimensions(table_data, 1, 1),
+        align_and_pad_cell=align,
+        build_border=lambda: [''.join(build_border(outer_widths, '-', '+', '+', '+', title)) for _ in aligned],
+        build_row=lambda: [''.join(line) for row in aligned for line in build_row(row, '|', '|', '|')],
+        combine=lambda: [''.join(combine(row, '|', '|', '|')) for row in padded_rows],
+        flatten=lambda: flatten(components),
+    )
+
+
+def render(cls, table_data, title):
+    """Render a table from scratch like most callers do: new instance, measure everything, return one string.
+
+    :param cls: Table class.
+    :param list table_data: Table data.
+    :param str title: Table title or None.
+
+    :return: The table.
+    :rtype: str
+    """
+    table = cls(table_data)
+    table.title = title
+    return table.table
+
+
+def time_it(function, min_time=0.2, repeat=3):
+    """Time a function, running it enough times to get a stable result.
+
+    :param function: Callable to time.
+    :param float min_time: Keep calling the function until this many seconds pass in each repetition.
+    :param int repeat: Number of repetitions, the fastest one is used.
+
+    :return: Seconds per call.
+    :rtype: float
+    """
+    best = None
+    for _ in range(repeat):
+        calls, start = 0, time.time()
+        while True:
+            function()
+            calls += 1
+            elapsed = time.time() - start
+            if elapsed >= min_time:
+                break
+        per_call = elapsed / calls
+        best = per_call if best is None else min(best, per_call)
+    return best
+
+
+def calibrate():
+    """Time a fixed pure Python workload, used to compare results between machines and runs.
+
+    :return: Seconds per call.
+    :rtype: float
+    """
+    def workload():
+        """Mix of loops, string joins, and dict lookups similar to rendering."""
+        lookup = dict()
+        for i in range(20000):
+            lookup[i % 97] = '|'.join(('a' * (i % 7), str(i)))
+    return time_it(workload)
+
+
+def run(max_cells, name_filter, min_time):
+    """Run every benchmark and print the results as they finish.
+
+    :param int max_cells: Skip shapes with more cells than this (0 for no limit).
+    :param str name_filter: Only run benchmarks whose name contains this text.
+    :param float min_time: Minimum seconds per repetition.
+
+    :return: Results by benchmark name (seconds per call).
+    :rtype: dict
+    """
+    results = dict()
+    for shape, rows, columns in SHAPES:
+        if max_cells and rows * columns > max_cells:
+            continue
+        for dataset in DATASETS:
+            suffix = '/{0}/{1}'.format(dataset, shape)
+            names = [n + suffix for n in STAGES] + ['table.{0}{1}'.format(c.__name__, suffix) for c in TABLE_CLASSES]
+            if not any(name_filter in n for n in names):
+                continue
+            table_data, title = make_table(dataset, rows, columns)
+            stages = stage_benchmarks(table_data, title)
+            functions = [stages[n] for n in STAGES]
+            functions.extend(lambda c=c: render(c, table_data, title) for c in TABLE_CLASSES)
+            for name, function in zip(names, functions):
+                if name_filter not in name:
+                    continue
+                results[name] = time_it(function, min_time)
+                print('{0:<55} {1:>12.6f}s'.format(name, results[name]))
+                sys.stdout.flush()
+    return results
+
+
+def compare(results, calibration, baseline, threshold):
+    """Print a comparison against a saved run and return the regressions.
+
+    :param dict results: Current results.
+    :param float calibration: Current calibration time.
+    :param dict baseline: Saved run (output of --save).
+    :param float threshold: Maximum allowed slowdown ratio.
+
+    :return: Names of benchmarks slower than the threshold.
+    :rtype: list
+    """
+    scale = baseline['calibration'] / calibration
+    regressions = list()
+    print('\n{0:<55} {1:>12} {2:>12} {3:>8}'.format('benchmark', 'baseline', 'current', 'ratio'))
+    for name in sorted(set(results) & set(baseline['results'])):
+        ratio = results[name] * scale / baseline['results'][name]
+        flag = ''
+        if ratio > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print('{0:<55} {1:>11.6f}s {2:>11.6f}s {3:>7.2f}x{4}'.format(
+            name, baseline['results'][name], results[name], ratio, flag))
+    return regressions
+
+
+def git_commit():
+    """Get the current commit hash if this is a git checkout.
+
+    :return: Commit hash or None.
+    :rtype: str
+    """
+    try:
+        output = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('ascii').strip()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-cells', type=int, default=200000, help='skip larger shapes, 0 for no limit')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum seconds per repetition')
+    parser.add_argument('--save', help='write results to this JSON file')
+    parser.add_argument('--compare', help='compare against results saved by --save')
+    parser.add_argument('--threshold', type=float, default=1.25, help='maximum allowed slowdown ratio')
+    args = parser.parse_args()
+
+    calibration = calibrate()
+    print('{0:<55} {1:>12.6f}s'.format('calibration', calibration))
+    results = run(args.max_cells, args.filter, args.min_time)
+
+    if args.save:
+        with open(args.save, 'w') as handle:
+            json.dump(dict(
+                calibration=calibration,
+                commit=git_commit(),
+                python=platform.python_version(),
+                results=results,
+            ), handle, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, calibration, baseline, args.threshold)
+        if regressions:
+            print('\n{0} benchmark(s) slower than {1}x the baseline.'.format(len(regressions), args.threshold))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""Compare visible_width() against the original per-character unicodedata implementation.
+
+Usage: python benchmarks/bench_visible_width.py
+"""
+
+from __future__ import print_function
+
+import os
+import re
+import sys
+import timeit
+import unicodedata
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from terminaltables.width_and_alignment import visible_width  # noqa pylint: disable=wrong-import-position
+
+RE_COLOR_ANSI = re.compile(r'(\033\[[\d;]+m)')
+DATASETS = (
+    ('ascii', [u'Avocado', u'green', u'192.168.0.100', u'vegetable', u'Lettuce is a leafy vegetable']),
+    ('latin', [u'Café', u'naïve résumé', u'Ünïcödé', u'Ñandú', u'Crème brûlée est délicieuse']),
+    ('cjk', [u'世界你好', u'蓝色', u'hello 世界', u'東京都渋谷区', u'다람쥐 헌 쳇바퀴에 타고파']),
+    ('ansi', [u'\033[32m<10ms\033[39m', u'\033[1;33m10ms <= 100ms\033[0m', u'\033[31m>100ms\033[39m']),
+)
+
+
+def reference_width(string):
+    """Original implementation: call unicodedata.east_asian_width() for every character.
+
+    :param str string: String to measure.
+
+    :return: String's width.
+    :rtype: int
+    """
+    if '\033' in string:
+        string = RE_COLOR_ANSI.sub('', string)
+    try:
+        string = string.decode('u8')
+    except (AttributeError, UnicodeEncodeError):
+        pass
+    width = 0
+    for char in string:
+        if unicodedata.east_asian_width(char) in ('F', 'W'):
+            width += 2
+        else:
+            width += 1
+    return width
+
+
+def main(number=20000):
+    """Time both implementations on each dataset and print the speedup.
+
+    :param int number: Number of passes over each dataset.
+    """
+    print('{0:<8} {1:>12} {2:>12} {3:>8}'.format('dataset', 'reference', 'visible', 'speedup'))
+    for name, strings in DATASETS:
+        assert [reference_width(s) for s in strings] == [visible_width(s) for s in strings]
+        reference = min(timeit.repeat(lambda: [reference_width(s) for s in strings], number=number, repeat=3))
+        current = min(timeit.repeat(lambda: [visible_width(s) for s in strings], number=number, repeat=3))
+        print('{0:<8} {1:>11.3f}s {2:>11.3f}s {3:>7.1f}x'.format(name, reference, current, reference / current))
+
+
+if __name__ == '__main__':
+    main()
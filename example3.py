@@ -6,8 +6,6 @@ Just prints sample text and exits.
 
 from __future__ import print_function
 
-from textwrap import wrap
-
 from terminaltables import SingleTable
 
 LONG_STRING = ('Lorem ipsum dolor sit amet, consectetur adipisicing elit, sed do eiusmod tempor incididunt ut labore '
@@ -20,14 +18,12 @@ LONG_STRING = ('Lorem ipsum dolor sit amet, consectetur adipisicing elit, sed do
 def main():
     """Main function."""
     table_data = [
-        ['Long String', ''],  # One row. Two columns. Long string will replace this empty string.
+        ['Long String', LONG_STRING],  # One row. Two columns.
     ]
     table = SingleTable(table_data)
 
-    # Calculate newlines.
-    max_width = table.column_max_width(1)
-    wrapped_string = '\n'.join(wrap(LONG_STRING, max_width))
-    table.table_data[0][1] = wrapped_string
+    # Wrap the long string to fit the terminal.
+    table.max_widths[1] = table.column_max_width(1)
 
     print(table.table)
 
@@ -1,8 +1,10 @@
 """AsciiTable is the main table class. To be inherited by other tables. Define convenience methods here."""
 
-from terminaltables.base_table import BaseTable
-from terminaltables.terminal_io import terminal_size
-from terminaltables.width_and_alignment import column_max_width, max_dimensions, table_width
+from terminaltables.base_table import BaseTable, PreparedTable
+from terminaltables.terminal_io import TERMINAL_SIZE
+from terminaltables.width_and_alignment import column_max_width, table_width
+
+terminal_size = TERMINAL_SIZE  # pylint: disable=invalid-name
 
 
 class AsciiTable(BaseTable):
@@ -16,10 +18,23 @@ class AsciiTable(BaseTable):
     :ivar bool inner_row_border: Show a border in between every row.
     :ivar bool outer_border: Show the top, left, right, and bottom border.
     :ivar dict justify_columns: Horizontal justification. Keys are column indexes (int). Values are right/left/center.
+    :ivar dict max_widths: Maximum column widths (no padding). Keys are column indexes (int). Values are ints.
+    :ivar dict overflow_columns: What happens to lines wider than max_widths. Keys are column indexes (int). Values
+        are wrap (default, continue on the next line), truncate (cut), or ellipsis (cut and end with '...').
     :ivar int padding_left: Number of spaces to pad on the left side of every cell.
     :ivar int padding_right: Number of spaces to pad on the right side of every cell.
     """
 
+    def prepare(self):
+        """Measure table data once so the table can be queried and rendered several times without re-measuring it.
+
+        E.g. check ok, then call column_max_width() to wrap long cells, then print table.
+
+        :return: Prepared table bound to this table.
+        :rtype: PreparedAsciiTable
+        """
+        return PreparedAsciiTable(self)
+
     def column_max_width(self, column_number):
         """Return the maximum width of a column based on the current terminal width.
 
@@ -28,28 +43,60 @@ class AsciiTable(BaseTable):
         :return: The max width of the column.
         :rtype: int
         """
-        inner_widths = max_dimensions(self.table_data)[0]
-        outer_border = 2 if self.outer_border else 0
-        inner_border = 1 if self.inner_column_border else 0
-        padding = self.padding_left + self.padding_right
-        return column_max_width(inner_widths, column_number, outer_border, inner_border, padding)
+        return self.prepare().column_max_width(column_number)
 
     @property
     def column_widths(self):
         """Return a list of integers representing the widths of each table column without padding."""
-        if not self.table_data:
-            return list()
-        return max_dimensions(self.table_data)[0]
+        return self.prepare().column_widths
 
     @property
     def ok(self):  # Too late to change API. # pylint: disable=invalid-name
+        """Return True if the table fits within the terminal width, False if the table breaks."""
+        return self.prepare().ok
+
+    @property
+    def table_width(self):
+        """Return the width of the table including padding and borders."""
+        return self.prepare().table_width
+
+
+class PreparedAsciiTable(PreparedTable):
+    """Table data measured once, reused until table_data changes. Also answers AsciiTable's convenience methods.
+
+    Padding and border settings are read from the table every time, so changing them never requires re-measuring.
+    Assigning a new list to table.table_data and changes to TableData instances are detected automatically. Call
+    invalidate() after modifying a plain list in place.
+
+    :ivar AsciiTable parent: The table this was prepared from.
+    """
+
+    def column_max_width(self, column_number):
+        """Return the maximum width of a column based on the current terminal width.
+
+        :param int column_number: The column number to query.
+
+        :return: The max width of the column.
+        :rtype: int
+        """
+        outer_border = 2 if self.parent.outer_border else 0
+        inner_border = 1 if self.parent.inner_column_border else 0
+        padding = self.parent.padding_left + self.parent.padding_right
+        return column_max_width(self.inner_widths, column_number, outer_border, inner_border, padding)
+
+    @property
+    def column_widths(self):
+        """Return a list of integers representing the widths of each table column without padding."""
+        return list(self.inner_widths)
+
+    @property
+    def ok(self):  # pylint: disable=invalid-name
         """Return True if the table fits within the terminal width, False if the table breaks."""
         return self.table_width <= terminal_size()[0]
 
     @property
     def table_width(self):
         """Return the width of the table including padding and borders."""
-        outer_widths = max_dimensions(self.table_data, self.padding_left, self.padding_right)[2]
-        outer_border = 2 if self.outer_border else 0
-        inner_border = 1 if self.inner_column_border else 0
-        return table_width(outer_widths, outer_border, inner_border)
+        outer_border = 2 if self.parent.outer_border else 0
+        inner_border = 1 if self.parent.inner_column_border else 0
+        return table_width(self.outer_widths, outer_border, inner_border)
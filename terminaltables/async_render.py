@@ -0,0 +1,86 @@
+"""Render tables in chunks of rows without blocking an asyncio event loop. Requires Python 3.6 or later.
+
+Imported by BaseTable.arender() and BaseTable.awrite() only when they're called, so the rest of the package still works
+on Python versions without async generators.
+"""
+
+import asyncio
+
+from terminaltables.parallel import measure_fitted
+from terminaltables.table_data import ColumnData, TableData
+from terminaltables.width_and_alignment import max_dimensions
+
+
+async def measure(table, chunk_rows):
+    """Measure table data chunk by chunk, letting the event loop run other tasks between chunks.
+
+    :param BaseTable table: Table to measure.
+    :param int chunk_rows: Number of rows to measure between yielding to the event loop.
+
+    :return: Table metrics, inner widths, and inner heights.
+    :rtype: tuple
+    """
+    table_data = table.table_data
+    if isinstance(table_data, (TableData, ColumnData)) and not table.max_widths:
+        prepared = table.prepare()
+        return prepared.table_metrics, prepared.inner_widths, prepared.inner_heights
+
+    table_metrics, inner_widths, inner_heights = list(), list(), list()
+    for start in range(0, len(table_data), chunk_rows):
+        chunk = measure_fitted(table, table_data[start:start + chunk_rows])
+        chunk_widths, chunk_heights = max_dimensions(chunk, table_metrics=chunk)[:2]
+        inner_widths.extend([0] * (len(chunk_widths) - len(inner_widths)))
+        for i, width in enumerate(chunk_widths):
+            if width > inner_widths[i]:
+                inner_widths[i] = width
+        table_metrics.extend(chunk)
+        inner_heights.extend(chunk_heights)
+        await asyncio.sleep(0)
+    return table_metrics, inner_widths, inner_heights
+
+
+async def arender(table, chunk_rows=1000):
+    """Yield the rendered table in chunks of rows, letting the event loop run other tasks between chunks.
+
+    Joining all chunks gives the same text as the table property: chunks after the first start with a newline.
+
+    :param BaseTable table: Table to render. Its table_data must not change until the last chunk is yielded.
+    :param int chunk_rows: Number of rows to measure or render between yielding to the event loop.
+
+    :return: Async iterator of strings.
+    """
+    if chunk_rows < 1:
+        raise ValueError('chunk_rows must be at least 1')
+    table_metrics, inner_widths, inner_heights = await measure(table, chunk_rows)
+    if not inner_heights or table.legacy_gen_table():
+        yield table.table
+        return
+
+    outer_widths = [w + table.padding_left + table.padding_right for w in inner_widths]
+    for start in range(0, len(inner_heights), chunk_rows):
+        row_range = start, min(start + chunk_rows, len(inner_heights))
+        lines = table.gen_lines(inner_widths, inner_heights, outer_widths, table_metrics, row_range)
+        yield ('\n' if start else '') + '\n'.join(lines)
+        await asyncio.sleep(0)
+
+
+async def awrite(table, writer, chunk_rows=1000, encoding='utf-8'):
+    """Write the rendered table to an asyncio.StreamWriter, waiting for its buffer to drain after every chunk.
+
+    Slow clients pause rendering instead of growing the writer's buffer. Same text as the table property (no trailing
+    newline).
+
+    :param BaseTable table: Table to render.
+    :param asyncio.StreamWriter writer: Writer to write encoded chunks to.
+    :param int chunk_rows: Number of rows to render between writes.
+    :param str encoding: Encoding of written bytes.
+
+    :return: Number of characters written.
+    :rtype: int
+    """
+    written = 0
+    async for chunk in arender(table, chunk_rows):
+        writer.write(chunk.encode(encoding))
+        written += len(chunk)
+        await writer.drain()
+    return written
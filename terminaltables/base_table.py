@@ -1,7 +1,60 @@
 """Base table class. Define just the bare minimum to build tables."""
 
-from terminaltables.build import build_border, build_row, flatten
-from terminaltables.width_and_alignment import align_and_pad_cell, max_dimensions
+import copy
+import inspect
+import random
+from bisect import bisect_left, bisect_right
+from itertools import chain, islice
+from operator import methodcaller
+from timeit import default_timer
+
+from terminaltables.build import build_border, build_row, lookahead, write_encoded, write_lines
+from terminaltables.parallel import DEFAULT_CHUNK_ROWS, render_parallel, write_parallel
+from terminaltables.stats import active_collectors, render_with_stats
+from terminaltables.table_data import ColumnData, TableData
+from terminaltables.width_and_alignment import align_and_pad_cell, CellMetrics, CompactTableMetrics, fit_cell
+from terminaltables.width_and_alignment import max_dimensions, measure_cell
+
+
+def overrides(table, name):
+    """Determine whether a table's class overrides one of BaseTable's methods.
+
+    :param BaseTable table: Table instance.
+    :param str name: Method name.
+
+    :return: True if the method isn't BaseTable's.
+    :rtype: bool
+    """
+    method, base = getattr(type(table), name), getattr(BaseTable, name)
+    return getattr(method, '__func__', method) is not getattr(base, '__func__', base)  # Python 2.x unbound methods.
+
+
+def accepts_arguments(method, count):
+    """Determine whether a method accepts a number of positional arguments, e.g. an override with an older signature.
+
+    :param method: Bound or unbound method.
+    :param int count: Number of arguments (not counting self).
+
+    :return: True if the method takes *args or at least count arguments.
+    :rtype: bool
+    """
+    function = getattr(method, '__func__', method)
+    try:
+        spec = inspect.getfullargspec(function)
+    except AttributeError:  # Python 2.x.
+        spec = inspect.getargspec(function)  # pylint: disable=deprecated-method
+    return spec.varargs is not None or len(spec.args) - 1 >= count
+
+
+def cell_text(metrics):
+    """Rebuild a cell from its measured lines, e.g. a cell fitted to max_widths.
+
+    :param CellMetrics metrics: Measured cell.
+
+    :return: The cell's lines joined with newlines.
+    :rtype: str
+    """
+    return '\n'.join(metrics.lines)
 
 
 class BaseTable(object):
@@ -15,8 +68,13 @@ class BaseTable(object):
     :ivar bool inner_row_border: Show a border in between every row.
     :ivar bool outer_border: Show the top, left, right, and bottom border.
     :ivar dict justify_columns: Horizontal justification. Keys are column indexes (int). Values are right/left/center.
+    :ivar dict max_widths: Maximum column widths (no padding). Keys are column indexes (int). Values are ints.
+    :ivar dict overflow_columns: What happens to lines wider than max_widths. Keys are column indexes (int). Values
+        are wrap (default, continue on the next line), truncate (cut), or ellipsis (cut and end with '...').
     :ivar int padding_left: Number of spaces to pad on the left side of every cell.
     :ivar int padding_right: Number of spaces to pad on the right side of every cell.
+    :ivar str renderer: 'flat' for gen_flat_lines(), 'components' for gen_table(), 'auto' to pick (see
+        use_flat_renderer()).
     """
 
     CHAR_F_INNER_HORIZONTAL = '-'
@@ -65,8 +123,11 @@ class BaseTable(object):
         self.outer_border = True
 
         self.justify_columns = dict()  # {0: 'right', 1: 'left', 2: 'center'}
+        self.max_widths = dict()  # {1: 40}
+        self.overflow_columns = dict()  # {1: 'wrap', 2: 'truncate', 3: 'ellipsis'}
         self.padding_left = 1
         self.padding_right = 1
+        self.renderer = 'auto'
 
     def horizontal_border(self, style, outer_widths):
         """Build any kind of horizontal border for the table.
@@ -130,7 +191,7 @@ class BaseTable(object):
             ('|', ' Column One ', '|', '     ', '|', '       ', '|'),
         ]
 
-        :param iter row: One row in the table. List of cells.
+        :param iter row: One row in the table. List of cells (strings or CellMetrics).
         :param str style: Type of border characters to use.
         :param iter inner_widths: List of widths (no padding) for each column.
         :param int height: Inner height (no padding) (number of lines) to expand row to.
@@ -141,16 +202,30 @@ class BaseTable(object):
 
         # Resize row if it doesn't have enough cells.
         if len(row) != len(inner_widths):
-            row = row + [''] * (len(inner_widths) - len(row))
+            row = list(row) + [''] * (len(inner_widths) - len(row))
 
         # Pad and align each cell. Split each cell into lines to support multi-line cells.
         for i, cell in enumerate(row):
             align = (self.justify_columns.get(i),)
-            inner_dimensions = (inner_widths[i], height)
+            if i < len(inner_widths):
+                inner_dimensions = (inner_widths[i], height)
+            else:  # Row wider than stream()'s estimate, the cell is as wide as it is.
+                inner_dimensions = (cell.width if isinstance(cell, CellMetrics) else measure_cell(cell).width, height)
             padding = (self.padding_left, self.padding_right, 0, 0)
             cells_in_row.append(align_and_pad_cell(cell, align, inner_dimensions, padding))
 
-        # Determine border characters.
+        # Yield each line.
+        for line in build_row(cells_in_row, *self.vertical_borders(style)):
+            yield line
+
+    def vertical_borders(self, style):
+        """Determine the border characters on the left, in between, and on the right of the cells in a row.
+
+        :param str style: Type of border characters to use.
+
+        :return: Left, center, and right border strings.
+        :rtype: tuple
+        """
         if style == 'heading':
             left = self.CHAR_H_OUTER_LEFT_VERTICAL if self.outer_border else ''
             center = self.CHAR_H_INNER_VERTICAL if self.inner_column_border else ''
@@ -163,55 +238,879 @@ class BaseTable(object):
             left = self.CHAR_OUTER_LEFT_VERTICAL if self.outer_border else ''
             center = self.CHAR_INNER_VERTICAL if self.inner_column_border else ''
             right = self.CHAR_OUTER_RIGHT_VERTICAL if self.outer_border else ''
+        return left, center, right
 
-        # Yield each line.
-        for line in build_row(cells_in_row, left, center, right):
-            yield line
+    def row_template(self, style, inner_widths):
+        """Compile a function that renders a simple row in a single join, skipping align_and_pad_cell() and build_row().
+
+        Simple rows have single-line cells that fit their column and whose length equals their width (no wide characters
+        or escape codes). The output is the same as gen_row_lines().
+
+        :param str style: Type of border characters to use.
+        :param iter inner_widths: List of widths (no padding) for each column.
+
+        :return: Function that takes a row of CellMetrics and returns its line, or None if the row isn't simple.
+        :rtype: function
+        """
+        left, center, right = self.vertical_borders(style)
+        padding_left, padding_right = ' ' * self.padding_left, ' ' * self.padding_right
+        head, separator, tail = left + padding_left, padding_right + center + padding_left, padding_right + right
+        justify = list()
+        for i, width in enumerate(inner_widths):
+            align = self.justify_columns.get(i)
+            justify.append(methodcaller('rjust' if align == 'right' else 'center' if align == 'center' else 'ljust',
+                                        width))
+        blanks = [' ' * w for w in inner_widths]
+        columns = len(inner_widths)
+
+        def template(row):
+            """Render a row, or return None if it isn't simple.
+
+            :param iter row: List of CellMetrics.
 
-    def gen_table(self, inner_widths, inner_heights, outer_widths):
+            :return: The row's only line or None.
+            :rtype: str
+            """
+            if len(row) > columns:
+                return None
+            if not columns:  # No cells, no padding.
+                return left + right
+            cells = list()
+            for metrics, width in zip(row, inner_widths):
+                line = metrics.lines[0]
+                if metrics.height > 1 or metrics.width != len(line) or metrics.width > width:
+                    return None
+                cells.append(line)
+            cells = [j(c) for j, c in zip(justify, cells)]
+            return head + separator.join(cells + blanks[len(cells):]) + tail
+
+        return template
+
+    def column_fitter(self):
+        """Build a function that makes measured rows fit max_widths, using overflow_columns for lines that are too wide.
+
+        Applied to measurements before max_dimensions() so column widths and row heights come from the fitted cells.
+
+        :return: Function taking a row of CellMetrics and returning a new row, or None if no column has a maximum.
+        """
+        if not self.max_widths:
+            return None
+        fits = list()
+        for column, width in sorted(self.max_widths.items()):
+            overflow = self.overflow_columns.get(column, 'wrap')
+            if overflow not in OVERFLOW_MODES:
+                raise ValueError('Unknown overflow mode for column {0}: {1!r}'.format(column, overflow))
+            fits.append((column, width, overflow))
+
+        def fit_row(row):
+            """Fit cells of one row."""
+            row = list(row)
+            for column, width, overflow in fits:
+                if column < len(row) and row[column].width > width:
+                    row[column] = fit_cell(row[column], width, overflow)
+            return row
+
+        return fit_row
+
+    def border_lines(self, outer_widths):
+        """Get horizontal borders as strings, built once per style and reused across renders with the same layout.
+
+        The cache is rebuilt when outer widths, the title, border characters, or settings used by horizontal_border()
+        change.
+
+        :param iter outer_widths: List of widths (with padding) for each column.
+
+        :return: Mapping of style to the joined output of horizontal_border().
+        :rtype: BorderLines
+        """
+        key = (
+            tuple(outer_widths), self.title, self.outer_border, self.inner_column_border,
+            sorted(self.justify_columns.items()), [getattr(self, n) for n in CHAR_NAMES],
+        )
+        cached = self.__dict__.get('_border_lines')
+        if cached is None or cached[0] != key:
+            cached = self._border_lines = key, BorderLines(self, outer_widths)
+        return cached[1]
+
+    def outer_borders(self):
+        """Determine which horizontal borders are above and below the whole table.
+
+        :return: Styles for horizontal_border() of the top and bottom borders, None for no border.
+        :rtype: tuple
+        """
+        return ('top', 'bottom') if self.outer_border else (None, None)
+
+    def row_borders(self, i, is_last):
+        """Determine which horizontal borders surround a row and which style of vertical borders it uses.
+
+        :param int i: Row index.
+        :param bool is_last: Row is the last one in the table.
+
+        :return: Styles of the border before the row, the row itself, and the border after it (None for no border).
+        :rtype: tuple
+        """
+        before = None
+        if i:
+            # Heading separator.
+            if self.inner_heading_row_border and i == 1:
+                before = 'heading'
+            # Footing separator.
+            elif self.inner_footing_row_border and is_last:
+                before = 'footing'
+            # Row separator.
+            elif self.inner_row_border:
+                before = 'row'
+
+        if self.inner_heading_row_border and i == 0:
+            style = 'heading'
+        elif self.inner_footing_row_border and is_last:
+            style = 'footing'
+        else:
+            style = 'row'
+        return before, style, None
+
+    @staticmethod
+    def _select_rows(table_data, inner_heights, row_range):
+        """Pair rows with their index and whether they're the last row, for all rows or only those in row_range.
+
+        :param iter table_data: Rows to render.
+        :param iter inner_heights: List of heights (no padding) for each row. Required with row_range.
+        :param tuple row_range: Optional start and stop row indexes.
+
+        :return: Iterator of (index, (row, is_last)), the first index, and whether the last row is included.
+        :rtype: tuple
+        """
+        if row_range is None:
+            return enumerate(lookahead(table_data)), 0, True
+        first, stop = row_range
+        last = len(inner_heights) - 1
+        return ((i, (table_data[i], i == last)) for i in range(first, stop)), first, stop > last
+
+    def gen_table(self, inner_widths, inner_heights, outer_widths, table_metrics=None, row_range=None):
         """Combine everything and yield every line of the entire table with borders.
 
+        Rows are read with one row of lookahead (to find the footer), so table_metrics may be any iterable including a
+        generator.
+
         :param iter inner_widths: List of widths (no padding) for each column.
-        :param iter inner_heights: List of heights (no padding) for each row.
+        :param iter inner_heights: List of heights (no padding) for each row. None to get them from table_metrics.
         :param iter outer_widths: List of widths (with padding) for each column.
+        :param iter table_metrics: Optional measure_table() output to render instead of re-measuring table_data.
+        :param tuple row_range: Optional start and stop row indexes to only yield lines of those rows (and the top or
+            bottom border if the range includes the first or last row). Requires inner_heights and indexable rows.
         :return:
         """
+        rows, first, at_end = self._select_rows(self.table_data if table_metrics is None else table_metrics,
+                                                inner_heights, row_range)
+        top, bottom = self.outer_borders()
+        borders = self.border_lines(outer_widths)
+
         # Yield top border.
-        if self.outer_border:
-            yield self.horizontal_border('top', outer_widths)
+        if top and not first:
+            yield (borders[top],)
 
         # Yield table body.
-        row_count = len(self.table_data)
-        last_row_index, before_last_row_index = row_count - 1, row_count - 2
-        for i, row in enumerate(self.table_data):
+        # Fast path needs CellMetrics and must not bypass an overridden gen_row_lines(), which gets cells instead.
+        custom = table_metrics is not None and overrides(self, 'gen_row_lines')
+        from_table_data = custom and self._measures_table_data(table_metrics)
+        templates = None if table_metrics is None or custom else dict()
+        for i, (row, is_last) in rows:
+            before, style, after = self.row_borders(i, is_last)
+            if before:
+                yield (borders[before],)
+            height = max([c.height for c in row] or [0]) if inner_heights is None else inner_heights[i]
+            # Yield simple rows in one piece.
+            simple = None
+            if templates is not None and height <= 1:
+                template = templates.get(style) or templates.setdefault(style, self.row_template(style, inner_widths))
+                simple = template(row)
+            if simple is not None:
+                yield (simple,)
             # Yield the row line by line (e.g. multi-line rows).
-            if self.inner_heading_row_border and i == 0:
-                style = 'heading'
-            elif self.inner_footing_row_border and i == last_row_index:
-                style = 'footing'
             else:
-                style = 'row'
-            for line in self.gen_row_lines(row, style, inner_widths, inner_heights[i]):
+                if custom:
+                    row = self.table_data[i] if from_table_data else [cell_text(c) for c in row]
+                for line in self.gen_row_lines(row, style, inner_widths, height):
+                    yield line
+            if after:
+                yield (borders[after],)
+
+        # Yield bottom border.
+        if bottom and at_end:
+            yield (borders[bottom],)
+
+    def stream(self, rows, inner_widths=None, prefix_rows=1000, overflow=None, sample='head'):
+        """Yield printable lines of the table as rows arrive from any iterable (e.g. a generator of database rows).
+
+        Memory use is constant: only column widths and up to prefix_rows rows are kept. Column widths are estimated
+        from a sample of rows so every row is measured only once, in a single pass. Later cells may be wider than the
+        estimate; overflow decides what happens to them:
+
+        * None: the cell is printed anyway and misaligns the borders of its line.
+        * 'truncate': lines that are too wide are cut.
+        * 'ellipsis': lines that are too wide are cut and end with '...'.
+        * 'wrap': lines that are too wide continue on the next line of the row.
+        * 'expand': the table is ended and a new one is started with wider columns, repeating the heading row.
+
+        Except with 'expand', cells in columns beyond the estimated ones have no width to fit into. They're never
+        dropped: they're printed as they are after the last estimated column, misaligning the borders of their row.
+
+        :param iter rows: Iterable of rows (lists of cells). Replaces table_data.
+        :param iter inner_widths: List of widths (no padding) for each column. None to estimate them from a sample.
+        :param int prefix_rows: Number of rows to measure when inner_widths is None.
+        :param str overflow: Policy for cells wider than their column: None, 'truncate', 'ellipsis', 'wrap', or
+            'expand'.
+        :param str sample: Either 'head' (the first prefix_rows rows) or 'random' (the first row and prefix_rows
+            random rows, rows must be a sequence such as a list).
+
+        :return: Yields lines without trailing newlines.
+        :rtype: iter
+        """
+        if overflow not in (None, 'expand') + OVERFLOW_MODES:
+            raise ValueError('Unknown overflow policy: {0!r}'.format(overflow))
+        if sample not in ('head', 'random'):
+            raise ValueError('Unknown sample mode: {0!r}'.format(sample))
+
+        fit = self.column_fitter()
+
+        def measure_row(row):
+            """Measure cells of one row, fitting them to max_widths."""
+            row = [measure_cell(c) for c in row]
+            return fit(row) if fit else row
+
+        prefix = list()
+        if inner_widths is None and sample == 'random':
+            indexes = random.Random(0).sample(range(1, len(rows)), min(prefix_rows, max(len(rows) - 1, 0)))
+            sampled = [measure_row(rows[i]) for i in [0] + sorted(indexes)] if len(rows) else []
+            inner_widths = max_dimensions(sampled, table_metrics=sampled)[0]
+        elif inner_widths is None:
+            rows = iter(rows)
+            prefix = [measure_row(row) for row in islice(rows, prefix_rows)]
+            inner_widths = max_dimensions(prefix, table_metrics=prefix)[0]
+        table_metrics = chain(prefix, (measure_row(row) for row in rows))
+
+        if overflow == 'expand':
+            lines = self._stream_expanding(list(inner_widths), table_metrics)
+        else:
+            if overflow is not None:
+                columns = len(inner_widths)
+                table_metrics = ([fit_cell(c, w, overflow) for c, w in zip(row, inner_widths)] + list(row[columns:])
+                                 for row in table_metrics)
+            padding = self.padding_left + self.padding_right
+            outer_widths = [w + padding for w in inner_widths]
+            lines = self.gen_lines(inner_widths, None, outer_widths, table_metrics=table_metrics)
+        for line in lines:
+            yield line
+
+    def _stream_expanding(self, inner_widths, table_metrics):
+        """Yield lines of consecutive tables, starting a new one with wider columns whenever a row doesn't fit.
+
+        :param list inner_widths: Initial widths (no padding) for each column.
+        :param iter table_metrics: Rows of CellMetrics.
+
+        :return: Yields lines without trailing newlines.
+        :rtype: iter
+        """
+        table_metrics = iter(table_metrics)
+        pending = list(islice(table_metrics, 1))  # Rows that start the next table.
+        heading = pending[0] if pending and self.inner_heading_row_border else None
+
+        def segment_rows(segment, widths):
+            """Yield rows until one doesn't fit, then stop without treating the previous row as the footer."""
+            for row in table_metrics:
+                if len(row) > len(widths) or any(c.width > w for c, w in zip(row, widths)):
+                    pending[:] = [heading, row] if heading is not None else [row]
+                    segment.inner_footing_row_border = False
+                    return
+                yield row
+            del pending[:]
+
+        padding = self.padding_left + self.padding_right
+        while True:
+            inner_widths = list(inner_widths)
+            for row in pending:
+                inner_widths.extend([0] * (len(row) - len(inner_widths)))
+                for i, cell in enumerate(row):
+                    inner_widths[i] = max(inner_widths[i], cell.width)
+            outer_widths = [w + padding for w in inner_widths]
+
+            segment = copy.copy(self)
+            rows = chain(list(pending), segment_rows(segment, inner_widths))
+            for line in segment.gen_lines(inner_widths, None, outer_widths, table_metrics=rows):
                 yield line
-            # If this is the last row then break. No separator needed.
-            if i == last_row_index:
+            if not pending:
                 break
-            # Yield heading separator.
-            if self.inner_heading_row_border and i == 0:
-                yield self.horizontal_border('heading', outer_widths)
-            # Yield footing separator.
-            elif self.inner_footing_row_border and i == before_last_row_index:
-                yield self.horizontal_border('footing', outer_widths)
-            # Yield row separator.
-            elif self.inner_row_border:
-                yield self.horizontal_border('row', outer_widths)
 
-        # Yield bottom border.
-        if self.outer_border:
-            yield self.horizontal_border('bottom', outer_widths)
+    def gen_flat_lines(self, inner_widths, inner_heights, outer_widths, table_metrics=None, row_range=None):
+        """Yield the same lines as gen_table() already joined into strings, without building them from components.
+
+        Uses the outer_borders(), row_borders(), border_lines(), vertical_borders(), and row_template() hooks but not
+        gen_table() or gen_row_lines().
+
+        :param iter inner_widths: List of widths (no padding) for each column.
+        :param iter inner_heights: List of heights (no padding) for each row. None to get them from table_metrics.
+        :param iter outer_widths: List of widths (with padding) for each column.
+        :param iter table_metrics: Optional measure_table() output to render instead of re-measuring table_data.
+        :param tuple row_range: Optional start and stop row indexes to only yield lines of those rows.
+
+        :return: Yields lines without trailing newlines.
+        :rtype: iter
+        """
+        rows, first, at_end = self._select_rows(self.table_data if table_metrics is None else table_metrics,
+                                                inner_heights, row_range)
+        top, bottom = self.outer_borders()
+        borders = self.border_lines(outer_widths)
+        templates, vertical = dict(), dict()
+        padding = (self.padding_left, self.padding_right, 0, 0)
+        columns = len(inner_widths)
+
+        if top and not first:
+            yield borders[top]
+
+        for i, (row, is_last) in rows:
+            before, style, after = self.row_borders(i, is_last)
+            if before:
+                yield borders[before]
+            if table_metrics is None:
+                row = [measure_cell(c) for c in row]
+            height = max([c.height for c in row] or [0]) if inner_heights is None else inner_heights[i]
+
+            # Simple rows.
+            simple = None
+            if height <= 1:
+                template = templates.get(style) or templates.setdefault(style, self.row_template(style, inner_widths))
+                simple = template(row)
+            if simple is not None:
+                yield simple
+            # Multi-line rows.
+            else:
+                left, center, right = vertical.get(style) or vertical.setdefault(style, self.vertical_borders(style))
+                if len(row) < columns:
+                    row = list(row) + [measure_cell('')] * (columns - len(row))
+                # Cells beyond inner_widths (rows wider than stream()'s estimate) are as wide as they are.
+                cells = [align_and_pad_cell(c, (self.justify_columns.get(j),),
+                                            (inner_widths[j] if j < columns else c.width, height), padding)
+                         for j, c in enumerate(row)]
+                if not cells:
+                    yield left + right
+                for parts in zip(*cells):
+                    yield left + center.join(parts) + right
+
+            if after:
+                yield borders[after]
+
+        if bottom and at_end:
+            yield borders[bottom]
+
+    def use_flat_renderer(self):
+        """Determine whether gen_lines() uses gen_flat_lines() or joins the components from gen_table().
+
+        With renderer set to 'auto' the flat renderer is used unless a subclass overrides gen_table() or
+        gen_row_lines(), so their output is never bypassed.
+
+        :return: True for gen_flat_lines().
+        :rtype: bool
+        """
+        if self.renderer != 'auto':
+            return self.renderer == 'flat'
+
+        return not any(overrides(self, n) for n in ('gen_table', 'gen_row_lines'))
+
+    def gen_lines(self, inner_widths, inner_heights, outer_widths, table_metrics=None, row_range=None):
+        """Yield every line of the entire table as a printable string. Subclasses override this to post-process lines.
+
+        :param iter inner_widths: List of widths (no padding) for each column.
+        :param iter inner_heights: List of heights (no padding) for each row. None to get them from table_metrics.
+        :param iter outer_widths: List of widths (with padding) for each column.
+        :param iter table_metrics: Optional measure_table() output to render instead of re-measuring table_data.
+        :param tuple row_range: Optional start and stop row indexes to only yield lines of those rows.
+
+        :return: Yields lines without trailing newlines.
+        :rtype: iter
+        """
+        if self.use_flat_renderer():
+            for line in self.gen_flat_lines(inner_widths, inner_heights, outer_widths, table_metrics, row_range):
+                yield line
+            return
+        if self.legacy_gen_table():
+            components = self._gen_legacy_table(inner_widths, inner_heights, outer_widths, table_metrics, row_range)
+        else:
+            components = self.gen_table(inner_widths, inner_heights, outer_widths, table_metrics, row_range)
+        for line in components:
+            yield ''.join(line)
+
+    def legacy_gen_table(self):
+        """Determine whether gen_lines() uses a gen_table() override written for the original three argument signature.
+
+        Such overrides render the whole table even for a row_range, so chunked renderers render it in one piece.
+
+        :return: True if gen_table() is used and doesn't accept table_metrics and row_range.
+        :rtype: bool
+        """
+        return not self.use_flat_renderer() and not accepts_arguments(self.gen_table, 5)
+
+    def _measures_table_data(self, table_metrics):
+        """Determine whether table_metrics measures the cells of table_data as they are.
+
+        Not the case for cells fitted to max_widths or rows that aren't table_data (stream(), parallel chunks).
+
+        :param iter table_metrics: Rows of CellMetrics passed to gen_lines().
+
+        :return: True if cells can be read from table_data.
+        :rtype: bool
+        """
+        return (not self.column_fitter() and hasattr(table_metrics, '__len__') and
+                len(table_metrics) == len(self.table_data))
+
+    def _gen_legacy_table(self, inner_widths, inner_heights, outer_widths, table_metrics, row_range):
+        """Call a gen_table() override that only accepts inner_widths, inner_heights, and outer_widths.
+
+        The override reads table_data. When table_metrics doesn't measure table_data as it is, the override is called
+        on a copy of the table whose table_data holds cells rebuilt from table_metrics. With row_range the whole table
+        is rendered and lines of other rows are skipped, assuming the override yields one line per line of gen_table().
+
+        :param iter inner_widths: List of widths (no padding) for each column.
+        :param iter inner_heights: List of heights (no padding) for each row. None to get them from table_metrics.
+        :param iter outer_widths: List of widths (with padding) for each column.
+        :param iter table_metrics: Optional measure_table() output to render instead of re-measuring table_data.
+        :param tuple row_range: Optional start and stop row indexes to only yield lines of those rows.
+
+        :return: Yields lines split into components.
+        :rtype: iter
+        """
+        table = self
+        if table_metrics is not None and not self._measures_table_data(table_metrics):
+            table_metrics = list(table_metrics)
+            table = copy.copy(self)
+            table.table_data = [[cell_text(c) for c in row] for row in table_metrics]
+        if inner_heights is None:
+            inner_heights = max_dimensions(table.table_data, table_metrics=table_metrics)[1]
+        lines = table.gen_table(inner_widths, inner_heights, outer_widths)
+        if row_range is None:
+            return lines
+
+        # Count lines the same way as PreparedTable.line_index().
+        first, stop = row_range
+        top, bottom = self.outer_borders()
+        line, last, start, end = 1 if top else 0, len(inner_heights) - 1, 0, 0
+        for i, height in enumerate(inner_heights[:stop]):
+            if i == first and first:
+                start = line
+            before, _, after = self.row_borders(i, i == last)
+            line += bool(before) + max(height, 1) + bool(after)
+        end = line + 1 if bottom and stop > last else line
+        return islice(lines, start, end)
+
+    def gen_encoded_lines(self, inner_widths, inner_heights, outer_widths, table_metrics=None, row_range=None,
+                          encoding='utf-8', errors='strict'):
+        """Yield every line of gen_lines() encoded to bytes. Each border is encoded once, rows as they're rendered.
+
+        :param iter inner_widths: List of widths (no padding) for each column.
+        :param iter inner_heights: List of heights (no padding) for each row. None to get them from table_metrics.
+        :param iter outer_widths: List of widths (with padding) for each column.
+        :param iter table_metrics: Optional measure_table() output to render instead of re-measuring table_data.
+        :param tuple row_range: Optional start and stop row indexes to only yield lines of those rows.
+        :param str encoding: Encoding, e.g. utf-8 or cp437.
+        :param str errors: Encoding error handler, e.g. strict or replace.
+
+        :return: Yields lines as bytes without trailing newlines.
+        :rtype: iter
+        """
+        # Borders are yielded as the same objects held by border_lines(), their ids are unique while it's alive.
+        borders, encoded = self.border_lines(outer_widths), dict()
+        for line in self.gen_lines(inner_widths, inner_heights, outer_widths, table_metrics, row_range):
+            data = encoded.get(id(line))
+            if data is None:
+                data = line.encode(encoding, errors)
+                if len(encoded) < len(borders) and any(line is b for b in borders.values()):
+                    encoded[id(line)] = data
+            yield data
+
+    def prepare(self):
+        """Measure table data once so the table can be queried and rendered several times without re-measuring it.
+
+        :return: Prepared table bound to this table.
+        :rtype: PreparedTable
+        """
+        return PreparedTable(self)
+
+    def render(self, prepared):
+        """Render a prepared table into a large string.
+
+        :param PreparedTable prepared: Measured table data from prepare().
+
+        :return: The entire table ready to be printed to the terminal.
+        :rtype: str
+        """
+        collectors = active_collectors()
+        if not collectors:
+            return '\n'.join(prepared.gen_lines())
+        output, stats = render_with_stats(self, prepared)
+        for collector in collectors:
+            collector.record(stats)
+        return output
 
     @property
     def table(self):
         """Return a large string of the entire table ready to be printed to the terminal."""
-        dimensions = max_dimensions(self.table_data, self.padding_left, self.padding_right)[:3]
-        return flatten(self.gen_table(*dimensions))
+        return self.render(self.prepare())
+
+    def measure_widths(self):
+        """Measure column widths in one pass over table data, keeping no other measurements.
+
+        For writing tables too large to keep measurements of every cell, like prepare() does. Rows are measured again
+        as they're rendered. TableData and ColumnData instances keep their own measurements, those are used.
+
+        :return: Inner widths, inner heights (None unless kept by table_data), outer widths, and rows of CellMetrics
+            (a generator measuring rows again) to pass to gen_lines() or gen_encoded_lines().
+        :rtype: tuple
+        """
+        table_data, fit = self.table_data, self.column_fitter()
+        padding = self.padding_left + self.padding_right
+        if isinstance(table_data, (TableData, ColumnData)) and not fit:
+            inner_widths = table_data.inner_widths
+            return inner_widths, table_data.inner_heights, [w + padding for w in inner_widths], table_data.table_metrics
+
+        def measure_rows():
+            """Measure rows one at a time, fitting them to max_widths."""
+            if isinstance(table_data, (TableData, ColumnData)):
+                rows = table_data.table_metrics
+            else:
+                rows = ([measure_cell(c) for c in row] for row in table_data)
+            for row in rows:
+                yield fit(row) if fit else row
+
+        inner_widths = max_dimensions(table_data, table_metrics=measure_rows())[0]
+        return inner_widths, None, [w + padding for w in inner_widths], measure_rows()
+
+    def write(self, stream, chunk_size=65536):
+        """Write the table to a file object or file descriptor in chunks instead of building one large string.
+
+        Writes the same text as the table property (no trailing newline). Table data is measured twice with
+        measure_widths() instead of being prepared, so peak memory is about one chunk plus column widths.
+
+        :param stream: File object opened in text mode, or an integer file descriptor (written as UTF-8).
+        :param int chunk_size: Number of characters to buffer between writes.
+
+        :return: Number of characters written.
+        :rtype: int
+        """
+        return write_lines(self.gen_lines(*self.measure_widths()), stream, chunk_size)
+
+    def encode(self, encoding='utf-8', errors='strict'):
+        """Render the table directly to bytes, without building the table property's string first.
+
+        :param str encoding: Encoding, e.g. utf-8 or cp437.
+        :param str errors: Encoding error handler, e.g. strict or replace.
+
+        :return: The entire table encoded.
+        :rtype: bytes
+        """
+        return self.prepare().encode(encoding, errors)
+
+    def write_encoded(self, target, encoding='utf-8', errors='strict', chunk_size=65536):
+        """Write the table as bytes to a file descriptor (os.writev), socket (sendmsg), or binary file in batches.
+
+        Writes the same text as the table property (no trailing newline). Table data is measured twice with
+        measure_widths() instead of being prepared, so peak memory is about one batch plus column widths.
+
+        :param target: Integer file descriptor, socket, or file object opened in binary mode.
+        :param str encoding: Encoding, e.g. utf-8 or cp437.
+        :param str errors: Encoding error handler, e.g. strict or replace.
+        :param int chunk_size: Number of bytes to buffer between writes.
+
+        :return: Number of bytes written.
+        :rtype: int
+        """
+        lines = self.gen_encoded_lines(*self.measure_widths(), encoding=encoding, errors=errors)
+        return write_encoded(lines, target, chunk_size)
+
+    def arender(self, chunk_rows=1000):
+        """Render the table in chunks of rows for asyncio, letting the event loop run between chunks. Python 3.6+.
+
+        Usage: ``async for chunk in table.arender(): ...`` Joining all chunks gives the same text as the table property.
+
+        :param int chunk_rows: Number of rows to measure or render between yielding to the event loop.
+
+        :return: Async iterator of strings, chunks after the first start with a newline.
+        """
+        from terminaltables.async_render import arender  # Python 3.6+ syntax.
+        return arender(self, chunk_rows)
+
+    def awrite(self, writer, chunk_rows=1000, encoding='utf-8'):
+        """Write the table to an asyncio.StreamWriter in chunks of rows, awaiting drain() after each one. Python 3.6+.
+
+        Usage: ``await table.awrite(writer)``
+
+        :param asyncio.StreamWriter writer: Writer to write encoded chunks to.
+        :param int chunk_rows: Number of rows to render between writes.
+        :param str encoding: Encoding of written bytes.
+
+        :return: Coroutine returning the number of characters written.
+        """
+        from terminaltables.async_render import awrite  # Python 3.6+ syntax.
+        return awrite(self, writer, chunk_rows, encoding)
+
+    def render_parallel(self, executor=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """Measure and render the table in row chunks on a process or thread pool. Same text as the table property.
+
+        :param concurrent.futures.Executor executor: Executor to use. None for a new pool with one worker per CPU
+            (threads on free-threaded Python, processes otherwise).
+        :param int chunk_rows: Number of rows per chunk.
+
+        :return: The entire table ready to be printed to the terminal.
+        :rtype: str
+        """
+        return render_parallel(self, executor, chunk_rows)
+
+    def write_parallel(self, stream, executor=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """Like render_parallel() but write chunks in order as soon as they're ready instead of returning a string.
+
+        :param stream: File object opened in text mode, or an integer file descriptor (written as UTF-8).
+        :param concurrent.futures.Executor executor: Executor to use. None for a new pool with one worker per CPU.
+        :param int chunk_rows: Number of rows per chunk.
+
+        :return: Number of characters written.
+        :rtype: int
+        """
+        return write_parallel(self, stream, executor, chunk_rows)
+
+
+CHAR_NAMES = tuple(sorted(n for n in dir(BaseTable) if n.startswith('CHAR_')))
+OVERFLOW_MODES = ('wrap', 'truncate', 'ellipsis')
+
+
+class BorderLines(dict):
+    """Memoized style to horizontal border string mapping, filled by calling horizontal_border() as styles are seen.
+
+    :ivar int built: Number of borders built (for stats).
+    :ivar float seconds: Time spent building them (for stats).
+    """
+
+    def __init__(self, table, outer_widths):
+        """Constructor.
+
+        :param BaseTable table: Table whose horizontal_border() builds the borders.
+        :param iter outer_widths: List of widths (with padding) for each column.
+        """
+        super(BorderLines, self).__init__()
+        self.table = table
+        self.outer_widths = list(outer_widths)
+        self.built = 0
+        self.seconds = 0.0
+
+    def __missing__(self, style):
+        """Build a border not built before.
+
+        :param str style: Type of border to return.
+
+        :return: Border as a printable string.
+        :rtype: str
+        """
+        start = default_timer()
+        line = self[style] = ''.join(self.table.horizontal_border(style, self.outer_widths))
+        self.seconds += default_timer() - start
+        self.built += 1
+        return line
+
+
+class PreparedTable(object):
+    """Table data measured once, reused until table_data changes.
+
+    Padding and border settings are read from the table every time, so changing them never requires re-measuring.
+    Assigning a new list to table.table_data and changes to TableData instances are detected automatically. Call
+    invalidate() after modifying a plain list in place.
+
+    :ivar BaseTable parent: The table this was prepared from.
+    """
+
+    def __init__(self, parent):
+        """Constructor.
+
+        :param BaseTable parent: The table to prepare.
+        """
+        self.parent = parent
+        self._measured = None
+        self._line_index = None
+
+    def _measure(self):
+        """Measure the parent's table data if it hasn't been measured yet or if it has changed.
+
+        TableData and ColumnData instances are never measured here, their own widths and heights are used (or their
+        measurements are fitted to max_widths). Changes to max_widths and overflow_columns are
+        detected automatically.
+
+        :return: 5-item tuple: measured table_data, its version and fit settings, its metrics, inner widths, and inner
+            heights.
+        :rtype: tuple
+        """
+        parent = self.parent
+        table_data = parent.table_data
+        version = (getattr(table_data, 'version', None), sorted(parent.max_widths.items()),
+                   sorted(parent.overflow_columns.items()))
+        if self._measured is None or self._measured[0] is not table_data or self._measured[1] != version:
+            fit = parent.column_fitter()
+            if isinstance(table_data, (TableData, ColumnData)) and not fit:
+                measured = table_data.table_metrics, table_data.inner_widths, table_data.inner_heights
+            elif isinstance(table_data, (TableData, ColumnData)):
+                table_metrics = [fit(r) for r in table_data.table_metrics]
+                measured = (table_metrics,) + max_dimensions(table_metrics, table_metrics=table_metrics)[:2]
+            else:
+                table_metrics = CompactTableMetrics(table_data, fit)
+                measured = table_metrics, table_metrics.inner_widths, table_metrics.inner_heights
+            self._measured = (table_data, version) + measured
+        return self._measured
+
+    def invalidate(self):
+        """Forget measurements. Table data will be measured again the next time it's needed."""
+        self._measured = None
+
+    @property
+    def table_metrics(self):
+        """Return rows of CellMetrics, one for every cell in table_data (CompactTableMetrics for plain lists)."""
+        return self._measure()[2]
+
+    @property
+    def inner_widths(self):
+        """Return a list of widths (no padding) for each column."""
+        return self._measure()[3]
+
+    @property
+    def inner_heights(self):
+        """Return a list of heights (no padding) for each row."""
+        return self._measure()[4]
+
+    @property
+    def outer_widths(self):
+        """Return a list of widths (with padding) for each column."""
+        padding = self.parent.padding_left + self.parent.padding_right
+        return [w + padding for w in self.inner_widths]
+
+    def gen_lines(self, row_range=None):
+        """Yield every line of the entire table as a printable string.
+
+        :param tuple row_range: Optional start and stop row indexes to only yield lines of those rows.
+
+        :return: Yields lines without trailing newlines.
+        :rtype: iter
+        """
+        dimensions = self.inner_widths, self.inner_heights, self.outer_widths
+        return self.parent.gen_lines(*dimensions, table_metrics=self.table_metrics, row_range=row_range)
+
+    def line_index(self):
+        """Map rows to rendered lines. Rebuilt only when table data or horizontal border settings change.
+
+        offsets[i] is the number of the first line of row i including the border before it (if any). The last item is
+        the number of the line after the last row (the bottom border if there is one).
+
+        :return: List of offsets (one more than the number of rows) and the total number of lines.
+        :rtype: tuple
+        """
+        parent, measured = self.parent, self._measure()
+        key = (parent.outer_border, parent.inner_heading_row_border, parent.inner_footing_row_border,
+               parent.inner_row_border)
+        if self._line_index is None or self._line_index[0] is not measured or self._line_index[1] != key:
+            top, bottom = parent.outer_borders()
+            offsets, line = list(), 1 if top else 0
+            last = len(measured[4]) - 1
+            for i, height in enumerate(measured[4]):
+                offsets.append(line)
+                before, _, after = parent.row_borders(i, i == last)
+                line += bool(before) + max(height, 1) + bool(after)  # Rows are at least one line tall.
+            offsets.append(line)
+            self._line_index = measured, key, offsets, line + 1 if bottom else line
+        return self._line_index[2:]
+
+    def row_at_line(self, line):
+        """Find the row a rendered line belongs to.
+
+        :param int line: Line number (0 is the first line). Borders before and after a row belong to it.
+
+        :return: Row index, or None for the top and bottom borders.
+        """
+        offsets, total = self.line_index()
+        if not 0 <= line < total:
+            raise IndexError('line out of range')
+        row = bisect_right(offsets, line) - 1
+        return row if 0 <= row < len(offsets) - 1 else None
+
+    def render_lines(self, start_line=0, stop_line=None):
+        """Render only some lines of the table, like self.table.splitlines()[start_line:stop_line] but much faster.
+
+        Only the rows that overlap the slice are rendered. Column widths are those of the whole table.
+
+        :param int start_line: First line to render. Negative numbers count from the end.
+        :param int stop_line: Line to stop before. None for the end of the table.
+
+        :return: Lines without trailing newlines.
+        :rtype: list
+        """
+        offsets, total = self.line_index()
+        start_line, stop_line = slice(start_line, stop_line).indices(total)[:2]
+        if start_line >= stop_line:
+            return list()
+        rows = len(offsets) - 1
+        first = min(max(bisect_right(offsets, start_line) - 1, 0), max(rows - 1, 0))
+        stop = min(bisect_left(offsets, stop_line, first), rows)
+        skip = offsets[first] if first else 0  # First line yielded below.
+        lines = self.gen_lines(row_range=(first, stop))
+        return list(islice(lines, start_line - skip, stop_line - skip))
+
+    @property
+    def table(self):
+        """Return a large string of the entire table ready to be printed to the terminal."""
+        return self.parent.render(self)
+
+    def write(self, stream, chunk_size=65536):
+        """Write the table to a file object or file descriptor in chunks instead of building one large string.
+
+        Writes the same text as the table property (no trailing newline). Peak memory is about one chunk besides the
+        prepared measurements.
+
+        :param stream: File object opened in text mode, or an integer file descriptor (written as UTF-8).
+        :param int chunk_size: Number of characters to buffer between writes.
+
+        :return: Number of characters written.
+        :rtype: int
+        """
+        return write_lines(self.gen_lines(), stream, chunk_size)
+
+    def gen_encoded_lines(self, encoding='utf-8', errors='strict', row_range=None):
+        """Yield every line of the entire table encoded to bytes.
+
+        :param str encoding: Encoding, e.g. utf-8 or cp437.
+        :param str errors: Encoding error handler, e.g. strict or replace.
+        :param tuple row_range: Optional start and stop row indexes to only yield lines of those rows.
+
+        :return: Yields lines as bytes without trailing newlines.
+        :rtype: iter
+        """
+        dimensions = self.inner_widths, self.inner_heights, self.outer_widths
+        return self.parent.gen_encoded_lines(*dimensions, table_metrics=self.table_metrics, row_range=row_range,
+                                             encoding=encoding, errors=errors)
+
+    def encode(self, encoding='utf-8', errors='strict'):
+        """Render the table directly to bytes, without building the table property's string first.
+
+        :param str encoding: Encoding, e.g. utf-8 or cp437.
+        :param str errors: Encoding error handler, e.g. strict or replace.
+
+        :return: The entire table encoded.
+        :rtype: bytes
+        """
+        return b'\n'.join(self.gen_encoded_lines(encoding, errors))
+
+    def write_encoded(self, target, encoding='utf-8', errors='strict', chunk_size=65536):
+        """Write the table as bytes to a file descriptor (os.writev), socket (sendmsg), or binary file in batches.
+
+        Peak memory is about one batch besides the prepared measurements.
+
+        :param target: Integer file descriptor, socket, or file object opened in binary mode.
+        :param str encoding: Encoding, e.g. utf-8 or cp437.
+        :param str errors: Encoding error handler, e.g. strict or replace.
+        :param int chunk_size: Number of bytes to buffer between writes.
+
+        :return: Number of bytes written.
+        :rtype: int
+        """
+        return write_encoded(self.gen_encoded_lines(encoding, errors), target, chunk_size)
@@ -1,6 +1,13 @@
 """Combine cells into rows."""
 
-from terminaltables.width_and_alignment import visible_width
+import os
+
+from terminaltables.width_and_alignment import WIDTH_CACHE
+
+try:
+    IOV_MAX = max(os.sysconf('SC_IOV_MAX'), 16)
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 16  # POSIX minimum.
 
 
 def combine(line, left, intersect, right):
@@ -73,10 +80,10 @@ def build_border(outer_widths, horizontal, left, intersect, right, title=None):
     # Hide title if it doesn't fit.
     if title is not None and outer_widths:
         try:
-            length = visible_width(title)
+            length = WIDTH_CACHE.width(title)
         except TypeError:
             title = str(title)
-            length = visible_width(title)
+            length = WIDTH_CACHE.width(title)
         if length > sum(outer_widths) + len(intersect) * (len(outer_widths) - 1):
             title = None
 
@@ -140,6 +147,25 @@ def build_row(row, left, center, right):
         yield combine((c[row_index] for c in row), left, center, right)
 
 
+def lookahead(iterable):
+    """Yield every item with a flag that is True for the last one. Reads one item ahead.
+
+    :param iter iterable: Any iterable, including generators.
+
+    :return: Yields 2-item tuples of item and is_last.
+    :rtype: iter
+    """
+    iterator = iter(iterable)
+    try:
+        item = next(iterator)
+    except StopIteration:
+        return
+    for peek in iterator:
+        yield item, False
+        item = peek
+    yield item, True
+
+
 def flatten(table):
     """Flatten table data into a single string with newlines.
 
@@ -149,3 +175,113 @@ def flatten(table):
     :rtype: str
     """
     return '\n'.join(''.join(r) for r in table)
+
+
+def write_lines(lines, stream, chunk_size=65536):
+    """Join lines with newlines (no trailing newline) like flatten(), writing them in chunks as they're produced.
+
+    :param iter lines: Printable lines without trailing newlines.
+    :param stream: File object opened in text mode, or an integer file descriptor (written as UTF-8).
+    :param int chunk_size: Number of characters to buffer between writes.
+
+    :return: Number of characters written.
+    :rtype: int
+    """
+    if isinstance(stream, int):
+        def write(chunk):
+            """Write all of chunk to the file descriptor."""
+            data = chunk.encode('utf-8')
+            while data:
+                data = data[os.write(stream, data):]
+    else:
+        write = stream.write
+
+    chunk, size, written, first = list(), 0, 0, True
+    for line in lines:
+        if first:
+            first = False
+        else:
+            chunk.append('\n')
+            size += 1
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            write(''.join(chunk))
+            chunk, size, written = list(), 0, written + size
+    if chunk:
+        write(''.join(chunk))
+        written += size
+    return written
+
+
+def send_all(send, buffers):
+    """Call a scatter/gather write function until every buffer is written, resuming after partial writes.
+
+    :param send: os.writev() bound to a file descriptor, socket.sendmsg(), or similar. Returns the bytes written.
+    :param list buffers: Bytes to write, at most IOV_MAX of them.
+    """
+    while buffers:
+        written, i = send(buffers), 0
+        while i < len(buffers) and written >= len(buffers[i]):
+            written -= len(buffers[i])
+            i += 1
+        buffers = buffers[i:]
+        if buffers and written:
+            buffers[0] = memoryview(buffers[0])[written:]
+
+
+def write_encoded(lines, target, chunk_size=65536):
+    """Join encoded lines with newlines (no trailing newline), writing them in batches as they're produced.
+
+    Batches go to a file descriptor with one os.writev() call or to a socket with one sendmsg() call, without being
+    copied into one buffer first. Sockets without sendmsg() (Windows) get one sendall() call per batch with the batch
+    joined, other targets one write() call.
+
+    :param iter lines: Lines encoded to bytes, without trailing newlines.
+    :param target: Integer file descriptor, socket, or file object opened in binary mode.
+    :param int chunk_size: Number of bytes to buffer between writes.
+
+    :return: Number of bytes written.
+    :rtype: int
+    """
+    if isinstance(target, int):
+        if hasattr(os, 'writev'):
+            def flush(buffers):
+                """Write buffers with one system call (more if it writes partially)."""
+                send_all(lambda b: os.writev(target, b), buffers)
+        else:  # Windows.
+            def flush(buffers):
+                """Write buffers to the file descriptor."""
+                data = b''.join(buffers)
+                while data:
+                    data = data[os.write(target, data):]
+    elif hasattr(target, 'sendmsg'):
+        def flush(buffers):
+            """Send buffers with one system call (more if it sends partially)."""
+            send_all(target.sendmsg, buffers)
+    elif hasattr(target, 'sendall'):
+        def flush(buffers):
+            """Send joined buffers to the socket."""
+            target.sendall(b''.join(buffers))
+    else:
+        def flush(buffers):
+            """Write joined buffers to the file object."""
+            target.write(b''.join(buffers))
+
+    newline, max_buffers = b'\n', IOV_MAX - 1
+    buffers, size, written, first = list(), 0, 0, True
+    for line in lines:
+        if first:
+            first = False
+        else:
+            buffers.append(newline)
+            size += 1
+        buffers.append(line)
+        size += len(line)
+        if size >= chunk_size or len(buffers) >= max_buffers:
+            flush(buffers)
+            buffers, size, written = list(), 0, written + size
+    if buffers:
+        flush(buffers)
+        written += size
+    return written
@@ -11,6 +11,9 @@ class GithubFlavoredMarkdownTable(AsciiTable):
 
     :ivar iter table_data: List (empty or list of lists of strings) representing the table.
     :ivar dict justify_columns: Horizontal justification. Keys are column indexes (int). Values are right/left/center.
+    :ivar dict max_widths: Maximum column widths (no padding). Keys are column indexes (int). Values are ints.
+    :ivar dict overflow_columns: What happens to lines wider than max_widths. Keys are column indexes (int). Values
+        are wrap (default, continue on the next line), truncate (cut), or ellipsis (cut and end with '...').
     """
 
     def __init__(self, table_data):
@@ -53,18 +56,21 @@ class GithubFlavoredMarkdownTable(AsciiTable):
 
         return combine(columns, left, intersect, right)
 
-    def gen_table(self, inner_widths, inner_heights, outer_widths):
-        """Combine everything and yield every line of the entire table with borders.
+    def outer_borders(self):
+        """No top or bottom borders.
 
-        :param iter inner_widths: List of widths (no padding) for each column.
-        :param iter inner_heights: List of heights (no padding) for each row.
-        :param iter outer_widths: List of widths (with padding) for each column.
-        :return:
+        :return: Styles for horizontal_border() of the top and bottom borders, None for no border.
+        :rtype: tuple
+        """
+        return None, None
+
+    def row_borders(self, i, is_last):
+        """Only the first row has a border, after it.
+
+        :param int i: Row index.
+        :param bool is_last: Row is the last one in the table.
+
+        :return: Styles of the border before the row, the row itself, and the border after it (None for no border).
+        :rtype: tuple
         """
-        for i, row in enumerate(self.table_data):
-            # Yield the row line by line (e.g. multi-line rows).
-            for line in self.gen_row_lines(row, 'row', inner_widths, inner_heights[i]):
-                yield line
-            # Yield heading separator.
-            if i == 0:
-                yield self.horizontal_border(None, outer_widths)
+        return None, 'row', 'heading' if i == 0 else None
@@ -0,0 +1,189 @@
+"""Redraw a table in place in a terminal, sending only what changed since the previous frame.
+
+Each frame leaves the cursor at the start of the line below the table. The next frame moves the cursor up into the
+table with relative cursor movement and rewrites only the changed parts of changed lines. Escape sequences in the
+skipped part of a line (colors, line drawing charset) are replayed before and after the rewritten part so it looks the
+same as if the whole line had been printed.
+"""
+
+from terminaltables.width_and_alignment import RE_ESCAPE_CODES, visible_width
+
+
+def tokenize(line):
+    """Split a line into escape sequences and single characters.
+
+    :param str line: Line of text.
+
+    :return: Tokens, joining them gives line.
+    :rtype: list
+    """
+    tokens, position = list(), 0
+    for match in RE_ESCAPE_CODES.finditer(line):
+        tokens.extend(line[position:match.start()])
+        tokens.append(match.group())
+        position = match.end()
+    tokens.extend(line[position:])
+    return tokens
+
+
+def replay(codes):
+    """Reduce escape sequences to the ones needed to restore the state they leave the terminal in.
+
+    Only the last charset designation for each of G0 and G1 and the SGR codes after the last reset are kept.
+
+    :param iter codes: Escape sequences in the order they were printed.
+
+    :return: Escape sequences joined into a string.
+    :rtype: str
+    """
+    charsets, sgr, other = dict(), list(), list()
+    for code in codes:
+        if code[1:2] in ('(', ')'):
+            charsets[code[1]] = code
+        elif code.startswith('\033[') and code.endswith('m'):
+            if code in ('\033[0m', '\033[m'):
+                sgr = [code]
+            else:
+                sgr.append(code)
+        else:
+            other.append(code)
+    return ''.join(other + sgr + [charsets[k] for k in sorted(charsets)])
+
+
+def changed_span(old, new):
+    """Find the part of a line that changed. Both lines must have the same visible width.
+
+    :param str old: Line on the screen.
+    :param str new: Line to show instead.
+
+    :return: Text that moves the cursor to the first changed column and prints the changed part of new.
+    :rtype: str
+    """
+    old_tokens, new_tokens = tokenize(old), tokenize(new)
+    limit = min(len(old_tokens), len(new_tokens))
+    start = 0
+    while start < limit and old_tokens[start] == new_tokens[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old_tokens[-1 - end] == new_tokens[-1 - end]:
+        end += 1
+    # Don't start on a combining character.
+    while 0 < start < len(new_tokens) and new_tokens[start][0] != '\033' and not visible_width(new_tokens[start]):
+        start -= 1
+    middle = new_tokens[start:len(new_tokens) - end]
+    if not any(t[0] != '\033' for t in middle):
+        return '\r' + new
+
+    prefix, suffix = new_tokens[:start], new_tokens[len(new_tokens) - end:]
+    column = visible_width(''.join(t for t in prefix if t[0] != '\033'))
+    update = '\033[{0}G{1}{2}{3}'.format(
+        column + 1,
+        replay(t for t in prefix if t[0] == '\033'),
+        ''.join(middle),
+        replay(t for t in suffix if t[0] == '\033'),
+    )
+    return update if len(update) < len(new) + 1 else '\r' + new
+
+
+def move(row, target):
+    """Move the cursor vertically.
+
+    :param int row: Current row.
+    :param int target: Row to move to.
+
+    :return: Escape sequence, empty string if row is target.
+    :rtype: str
+    """
+    if target < row:
+        return '\033[{0}A'.format(row - target)
+    if target > row:
+        return '\033[{0}B'.format(target - row)
+    return ''
+
+
+class LiveTable(object):
+    """Redraw a table in place, e.g. a dashboard refreshed several times per second.
+
+    The first frame and frames after column widths change are full redraws. Other frames only rewrite changed parts of
+    changed lines, and add or erase lines at the bottom when the number of rows changes. Nothing else may be printed
+    between frames (call reset() if something was), and the table must fit in the terminal's height.
+
+    :ivar BaseTable table: Table to draw. Modify its table_data between frames.
+    :ivar list lines: Lines of the last frame.
+    :ivar list widths: Outer column widths of the last frame, None before the first frame.
+    """
+
+    def __init__(self, table):
+        """Constructor.
+
+        :param BaseTable table: Table to draw.
+        """
+        self.table = table
+        self.lines = list()
+        self.widths = None
+
+    def reset(self):
+        """Forget the last frame. The next frame is drawn in full below the cursor."""
+        self.lines = list()
+        self.widths = None
+
+    def frame(self):
+        """Render the table and return what to print to turn the last frame on the screen into this one.
+
+        :return: Text to print, empty if nothing changed.
+        :rtype: str
+        """
+        prepared = self.table.prepare()
+        lines = list(prepared.gen_lines())
+        widths = prepared.outer_widths
+        if widths != self.widths:
+            update = self.redraw(lines)
+        else:
+            update = self.diff(lines)
+        self.lines, self.widths = lines, widths
+        return update
+
+    def redraw(self, lines):
+        """Erase the last frame and draw lines in full.
+
+        :param list lines: Lines of the new frame.
+
+        :return: Text to print.
+        :rtype: str
+        """
+        erase = move(len(self.lines), 0) + '\r\033[J' if self.lines else ''
+        return erase + ''.join(line + '\n' for line in lines)
+
+    def diff(self, lines):
+        """Rewrite only what changed since the last frame. Column widths must be the same.
+
+        :param list lines: Lines of the new frame.
+
+        :return: Text to print, empty if nothing changed.
+        :rtype: str
+        """
+        parts, row, common = list(), len(self.lines), min(len(self.lines), len(lines))
+        for i in range(common):
+            if self.lines[i] != lines[i]:
+                parts.append(move(row, i) + changed_span(self.lines[i], lines[i]))
+                row = i
+        if len(lines) != len(self.lines):
+            parts.append(move(row, common) + '\r\033[J' + ''.join(line + '\n' for line in lines[common:]))
+            row = len(lines)
+        elif parts:
+            parts.append(move(row, len(lines)) + '\r')
+        return ''.join(parts)
+
+    def write(self, stream):
+        """Print the next frame to a stream and flush it.
+
+        :param stream: File object opened in text mode, e.g. sys.stdout.
+
+        :return: Number of characters written.
+        :rtype: int
+        """
+        update = self.frame()
+        if update:
+            stream.write(update)
+            stream.flush()
+        return len(update)
@@ -0,0 +1,84 @@
+"""Format NumPy arrays and pandas DataFrames into ColumnData with whole-array operations. Requires NumPy.
+
+Numeric columns are converted to strings and measured by NumPy in one call each, instead of str() and
+visible_width() per cell. Numbers format to single line ASCII, so their width is their length. Other columns (strings,
+objects) are left for ColumnData to measure cell by cell.
+
+NumPy is only imported by this module, the rest of the package works without it. pandas is never imported: DataFrames
+are read through their columns, index, and item access.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from terminaltables.table_data import ColumnData, MeasuredColumn
+from terminaltables.width_and_alignment import CellMetrics
+
+# dtype kinds formatted with NumPy: boolean, signed and unsigned integers, floating point.
+NUMERIC_KINDS = 'biuf'
+
+
+def require_numpy():
+    """Raise ImportError if NumPy isn't installed."""
+    if numpy is None:
+        raise ImportError('NumPy is required to format columns.')
+
+
+def is_plain(fmt):
+    """Determine whether a format string adds only characters one column wide to the numbers it formats.
+
+    :param str fmt: printf-style format, e.g. '%.2f'.
+
+    :return: True if every character is printable ASCII.
+    :rtype: bool
+    """
+    return all(' ' <= c <= '~' for c in fmt)
+
+
+def format_array(values, fmt=None):
+    """Convert a one-dimensional numeric array to strings and measure them with whole-array operations.
+
+    :param values: NumPy array or anything numpy.asarray() accepts.
+    :param str fmt: Optional printf-style format, e.g. '%.2f' or '%+d'. Defaults to str() of each number.
+
+    :return: Column ready for ColumnData, or values unchanged if they aren't numeric.
+    :rtype: MeasuredColumn
+    """
+    require_numpy()
+    data = numpy.asarray(values)
+    if data.ndim != 1:
+        raise ValueError('Columns must be one-dimensional.')
+    if data.dtype.kind not in NUMERIC_KINDS or (fmt is not None and not is_plain(fmt)):
+        return values
+
+    strings = data.astype(str) if fmt is None else numpy.char.mod(fmt, data)
+    widths = numpy.char.str_len(strings)
+    cells = strings.tolist()
+    metrics = [CellMetrics([c], [w], w, 1 if w else 0) for c, w in zip(cells, widths.tolist())]
+    return MeasuredColumn(cells, metrics, int(widths.max()) if len(cells) else 0)
+
+
+def from_dataframe(frame, formats=None, index=False):
+    """Build table data from a pandas DataFrame, formatting numeric columns with format_array().
+
+    :param frame: pandas DataFrame.
+    :param dict formats: Optional printf-style formats by column name, e.g. {'price': '%.2f'}.
+    :param bool index: Include the index as the first column.
+
+    :return: Table data with column names as the heading row.
+    :rtype: ColumnData
+    """
+    require_numpy()
+    formats = formats or dict()
+    named = [(frame.index.name, frame.index)] if index else []
+    named.extend((name, frame[name]) for name in frame.columns)
+
+    heading, columns = list(), list()
+    for name, values in named:
+        values = numpy.asarray(values)
+        column = format_array(values, formats.get(name))
+        heading.append('' if name is None else name)
+        columns.append(values.tolist() if column is values else column)  # Python objects instead of NumPy scalars.
+    return ColumnData(columns, heading)
@@ -40,12 +40,114 @@ class UnixTable(AsciiTable):
     CHAR_OUTER_TOP_LEFT = '\033(0\x6c\033(B'
     CHAR_OUTER_TOP_RIGHT = '\033(0\x6b\033(B'
 
-    @property
-    def table(self):
-        """Return a large string of the entire table ready to be printed to the terminal."""
-        ascii_table = super(UnixTable, self).table
-        optimized = ascii_table.replace('\033(B\033(0', '')
-        return optimized
+    def horizontal_border(self, style, outer_widths):
+        """Build any kind of horizontal border for the table. Enter the line drawing charset once per run of glyphs.
+
+        Borders are built once per style and layout (see border_lines()), so merging runs costs nothing per row.
+
+        :param str style: Type of border to return.
+        :param iter outer_widths: List of widths (with padding) for each column.
+
+        :return: Prepared border as a tuple of one string.
+        :rtype: tuple
+        """
+        border = ''.join(super(UnixTable, self).horizontal_border(style, outer_widths))
+        return (border.replace('\033(B\033(0', ''),)
+
+    def gen_lines(self, inner_widths, inner_heights, outer_widths, table_metrics=None, row_range=None):
+        """Yield every line of the entire table as a printable string.
+
+        Vertical borders are separated by cells, except around columns without width (no padding, all cells empty).
+        Only then are lines searched for adjacent box-drawing escape sequences to merge.
+
+        :param iter inner_widths: List of widths (no padding) for each column.
+        :param iter inner_heights: List of heights (no padding) for each row. None to get them from table_metrics.
+        :param iter outer_widths: List of widths (with padding) for each column.
+        :param iter table_metrics: Optional measure_table() output to render instead of re-measuring table_data.
+        :param tuple row_range: Optional start and stop row indexes to only yield lines of those rows.
+
+        :return: Yields lines without trailing newlines.
+        :rtype: iter
+        """
+        lines = super(UnixTable, self).gen_lines(inner_widths, inner_heights, outer_widths, table_metrics, row_range)
+        if outer_widths and all(outer_widths):
+            return lines
+        return (line.replace('\033(B\033(0', '') for line in lines)
+
+
+class UnicodeTable(AsciiTable):
+    """Draw a table using Unicode box-drawing characters (U+2500 block). Single-line borders.
+
+    Every border character is one code point one column wide, so unlike UnixTable no escape sequences are needed and
+    rows and borders take the same paths as AsciiTable's. In UTF-8 a vertical border takes 3 bytes instead of
+    UnixTable's 7, but a horizontal border takes 3 bytes per column instead of 1 (UnixTable enters the line drawing
+    charset once per run): output is smaller for tables with many rows and no inner row borders. Requires a Unicode
+    terminal.
+    """
+
+    CHAR_F_INNER_HORIZONTAL = u'\u2500'
+    CHAR_F_INNER_INTERSECT = u'\u253c'
+    CHAR_F_INNER_VERTICAL = u'\u2502'
+    CHAR_F_OUTER_LEFT_INTERSECT = u'\u251c'
+    CHAR_F_OUTER_LEFT_VERTICAL = u'\u2502'
+    CHAR_F_OUTER_RIGHT_INTERSECT = u'\u2524'
+    CHAR_F_OUTER_RIGHT_VERTICAL = u'\u2502'
+    CHAR_H_INNER_HORIZONTAL = u'\u2500'
+    CHAR_H_INNER_INTERSECT = u'\u253c'
+    CHAR_H_INNER_VERTICAL = u'\u2502'
+    CHAR_H_OUTER_LEFT_INTERSECT = u'\u251c'
+    CHAR_H_OUTER_LEFT_VERTICAL = u'\u2502'
+    CHAR_H_OUTER_RIGHT_INTERSECT = u'\u2524'
+    CHAR_H_OUTER_RIGHT_VERTICAL = u'\u2502'
+    CHAR_INNER_HORIZONTAL = u'\u2500'
+    CHAR_INNER_INTERSECT = u'\u253c'
+    CHAR_INNER_VERTICAL = u'\u2502'
+    CHAR_OUTER_BOTTOM_HORIZONTAL = u'\u2500'
+    CHAR_OUTER_BOTTOM_INTERSECT = u'\u2534'
+    CHAR_OUTER_BOTTOM_LEFT = u'\u2514'
+    CHAR_OUTER_BOTTOM_RIGHT = u'\u2518'
+    CHAR_OUTER_LEFT_INTERSECT = u'\u251c'
+    CHAR_OUTER_LEFT_VERTICAL = u'\u2502'
+    CHAR_OUTER_RIGHT_INTERSECT = u'\u2524'
+    CHAR_OUTER_RIGHT_VERTICAL = u'\u2502'
+    CHAR_OUTER_TOP_HORIZONTAL = u'\u2500'
+    CHAR_OUTER_TOP_INTERSECT = u'\u252c'
+    CHAR_OUTER_TOP_LEFT = u'\u250c'
+    CHAR_OUTER_TOP_RIGHT = u'\u2510'
+
+
+class UnicodeTableDouble(AsciiTable):
+    """Draw a table using Unicode box-drawing characters (U+2500 block). Double-line borders."""
+
+    CHAR_F_INNER_HORIZONTAL = u'\u2550'
+    CHAR_F_INNER_INTERSECT = u'\u256c'
+    CHAR_F_INNER_VERTICAL = u'\u2551'
+    CHAR_F_OUTER_LEFT_INTERSECT = u'\u2560'
+    CHAR_F_OUTER_LEFT_VERTICAL = u'\u2551'
+    CHAR_F_OUTER_RIGHT_INTERSECT = u'\u2563'
+    CHAR_F_OUTER_RIGHT_VERTICAL = u'\u2551'
+    CHAR_H_INNER_HORIZONTAL = u'\u2550'
+    CHAR_H_INNER_INTERSECT = u'\u256c'
+    CHAR_H_INNER_VERTICAL = u'\u2551'
+    CHAR_H_OUTER_LEFT_INTERSECT = u'\u2560'
+    CHAR_H_OUTER_LEFT_VERTICAL = u'\u2551'
+    CHAR_H_OUTER_RIGHT_INTERSECT = u'\u2563'
+    CHAR_H_OUTER_RIGHT_VERTICAL = u'\u2551'
+    CHAR_INNER_HORIZONTAL = u'\u2550'
+    CHAR_INNER_INTERSECT = u'\u256c'
+    CHAR_INNER_VERTICAL = u'\u2551'
+    CHAR_OUTER_BOTTOM_HORIZONTAL = u'\u2550'
+    CHAR_OUTER_BOTTOM_INTERSECT = u'\u2569'
+    CHAR_OUTER_BOTTOM_LEFT = u'\u255a'
+    CHAR_OUTER_BOTTOM_RIGHT = u'\u255d'
+    CHAR_OUTER_LEFT_INTERSECT = u'\u2560'
+    CHAR_OUTER_LEFT_VERTICAL = u'\u2551'
+    CHAR_OUTER_RIGHT_INTERSECT = u'\u2563'
+    CHAR_OUTER_RIGHT_VERTICAL = u'\u2551'
+    CHAR_OUTER_TOP_HORIZONTAL = u'\u2550'
+    CHAR_OUTER_TOP_INTERSECT = u'\u2566'
+    CHAR_OUTER_TOP_LEFT = u'\u2554'
+    CHAR_OUTER_TOP_RIGHT = u'\u2557'
 
 
 class WindowsTable(AsciiTable):
@@ -130,6 +232,9 @@ class SingleTable(WindowsTable if IS_WINDOWS else UnixTable):
     :ivar bool inner_row_border: Show a border in between every row.
     :ivar bool outer_border: Show the top, left, right, and bottom border.
     :ivar dict justify_columns: Horizontal justification. Keys are column indexes (int). Values are right/left/center.
+    :ivar dict max_widths: Maximum column widths (no padding). Keys are column indexes (int). Values are ints.
+    :ivar dict overflow_columns: What happens to lines wider than max_widths. Keys are column indexes (int). Values
+        are wrap (default, continue on the next line), truncate (cut), or ellipsis (cut and end with '...').
     :ivar int padding_left: Number of spaces to pad on the left side of every cell.
     :ivar int padding_right: Number of spaces to pad on the right side of every cell.
     """
@@ -148,6 +253,9 @@ class DoubleTable(WindowsTableDouble):
     :ivar bool inner_row_border: Show a border in between every row.
     :ivar bool outer_border: Show the top, left, right, and bottom border.
     :ivar dict justify_columns: Horizontal justification. Keys are column indexes (int). Values are right/left/center.
+    :ivar dict max_widths: Maximum column widths (no padding). Keys are column indexes (int). Values are ints.
+    :ivar dict overflow_columns: What happens to lines wider than max_widths. Keys are column indexes (int). Values
+        are wrap (default, continue on the next line), truncate (cut), or ellipsis (cut and end with '...').
     :ivar int padding_left: Number of spaces to pad on the left side of every cell.
     :ivar int padding_right: Number of spaces to pad on the right side of every cell.
     """
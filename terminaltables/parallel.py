@@ -0,0 +1,229 @@
+"""Measure and render one large table in row chunks on a pool of worker processes or threads.
+
+Rendering happens in two passes over the chunks. First every chunk is measured and the per-chunk column widths are
+reduced to the widths of the whole table. Then every chunk is rendered with those widths. Chunks are returned in
+order, and the output is identical to the table property.
+
+Any concurrent.futures executor works. Processes get pickled chunks of rows and measure them twice (measurements are
+too large to send back). Threads share memory, so measurements from the first pass are reused and all threads go
+through the (locked) WIDTH_CACHE, but they only run in parallel on free-threaded Python builds.
+"""
+
+import copy
+import multiprocessing
+import sys
+from collections import deque
+from itertools import islice
+
+from terminaltables.build import write_lines
+from terminaltables.width_and_alignment import max_dimensions, measure_table
+
+DEFAULT_CHUNK_ROWS = 10000
+
+
+class _Window(object):
+    """Read-only sequence holding the items of one chunk at their indexes in the whole table."""
+
+    def __init__(self, items, first, total):
+        """Constructor.
+
+        :param list items: Items of the chunk.
+        :param int first: Index of the chunk's first item in the whole table.
+        :param int total: Number of items in the whole table.
+        """
+        self.items = items
+        self.first = first
+        self.total = total
+
+    def __len__(self):
+        """Return the number of items in the whole table."""
+        return self.total
+
+    def __getitem__(self, index):
+        """Get an item of the chunk by its index in the whole table."""
+        return self.items[index - self.first]
+
+
+def free_threaded():
+    """Determine whether threads run Python code in parallel (Python built without the GIL, or with it disabled).
+
+    :return: True if the GIL is disabled.
+    :rtype: bool
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def default_executor():
+    """Create a thread pool on free-threaded Python and a process pool otherwise, one worker per CPU.
+
+    :return: New executor, the caller shuts it down.
+    :rtype: concurrent.futures.Executor
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    return (ThreadPoolExecutor if free_threaded() else ProcessPoolExecutor)(multiprocessing.cpu_count())
+
+
+def uses_threads(executor):
+    """Determine whether an executor runs tasks in threads of this process (sharing memory).
+
+    :param concurrent.futures.Executor executor: Executor to inspect.
+
+    :return: True for thread pools.
+    :rtype: bool
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    return isinstance(executor, ThreadPoolExecutor)
+
+
+def ordered_map(executor, function, tasks, ahead):
+    """Like executor.map() but only submits a limited number of tasks ahead of the result being yielded.
+
+    Bounds memory use: executor.map() submits (and for processes, pickles) every task up front.
+
+    :param concurrent.futures.Executor executor: Executor running the tasks.
+    :param function: Function to call with each task.
+    :param iter tasks: Arguments, one per call.
+    :param int ahead: Maximum number of submitted tasks whose results haven't been yielded yet.
+
+    :return: Yields results in the order of tasks.
+    :rtype: iter
+    """
+    pending = deque()
+    for task in tasks:
+        pending.append(executor.submit(function, task))
+        if len(pending) >= ahead:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def measure_fitted(table, rows):
+    """Measure rows and fit them to the table's max_widths.
+
+    :param BaseTable table: Table whose column_fitter() to use.
+    :param list rows: Rows to measure.
+
+    :return: List of list of CellMetrics.
+    :rtype: list
+    """
+    table_metrics = measure_table(rows)
+    fit = table.column_fitter()
+    return [fit(r) for r in table_metrics] if fit else table_metrics
+
+
+def measure_chunk(task):
+    """Measure a chunk of rows (first pass).
+
+    :param tuple task: Table (without table data), rows, and whether to return measurements (False when they would
+        have to be pickled).
+
+    :return: Measurements (or None), row heights (or None), and column widths.
+    :rtype: tuple
+    """
+    table, rows, keep = task
+    table_metrics = measure_fitted(table, rows)
+    inner_widths, inner_heights = max_dimensions(rows, table_metrics=table_metrics)[:2]
+    return (table_metrics, inner_heights, inner_widths) if keep else (None, None, inner_widths)
+
+
+def render_chunk(task):
+    """Render a chunk of rows with the column widths of the whole table (second pass).
+
+    :param tuple task: Table (without table data), rows, measurements and row heights (or None to measure rows
+        again), index of the first row, number of rows in the whole table, and inner widths of the whole table.
+
+    :return: Lines of the chunk joined with newlines, including the top or bottom border for the first or last chunk.
+    :rtype: str
+    """
+    table, rows, table_metrics, inner_heights, first, total, inner_widths = task
+    if table_metrics is None:
+        table_metrics = measure_fitted(table, rows)
+        inner_heights = max_dimensions(rows, table_metrics=table_metrics)[1]
+    outer_widths = [w + table.padding_left + table.padding_right for w in inner_widths]
+    lines = table.gen_lines(inner_widths, _Window(inner_heights, first, total), outer_widths,
+                            _Window(table_metrics, first, total), (first, first + len(rows)))
+    return '\n'.join(lines)
+
+
+def gen_chunks(table, executor=None, chunk_rows=DEFAULT_CHUNK_ROWS, ahead=None):
+    """Render a table in parallel, yielding rendered chunks in order.
+
+    :param BaseTable table: Table to render. Its table_data must not change until all chunks are yielded.
+    :param concurrent.futures.Executor executor: Executor to use, default_executor() (shut down afterwards) if None.
+    :param int chunk_rows: Number of rows per chunk.
+    :param int ahead: Maximum number of chunks in flight. Defaults to twice the number of CPUs.
+
+    :return: Yields the table's lines joined into chunks, join them with newlines for the whole table.
+    :rtype: iter
+    """
+    if chunk_rows < 1:
+        raise ValueError('chunk_rows must be at least 1')
+    owned = executor is None
+    if owned:
+        executor = default_executor()
+    ahead = ahead or 2 * multiprocessing.cpu_count()
+    threads = uses_threads(executor)
+    rows = iter(table.table_data)
+
+    try:
+        if threads:
+            chunks = list(iter(lambda: list(islice(rows, chunk_rows)), []))
+        else:  # Rows of TableData reference the whole table, pickle plain lists.
+            chunks = list(iter(lambda: [list(r) for r in islice(rows, chunk_rows)], []))
+
+        # Nothing to split, or an override of gen_table() that can't render chunks.
+        if not chunks or table.legacy_gen_table():
+            yield table.table
+            return
+
+        template = copy.copy(table)
+        template.table_data = list()
+        template.__dict__.pop('_border_lines', None)
+
+        # First pass, reduce chunk widths to table widths.
+        measured = list(ordered_map(executor, measure_chunk, ((template, c, threads) for c in chunks), ahead))
+        inner_widths = [0] * max(len(m[2]) for m in measured)
+        for _, _, chunk_widths in measured:
+            for i, width in enumerate(chunk_widths):
+                if width > inner_widths[i]:
+                    inner_widths[i] = width
+
+        # Second pass.
+        firsts = [0]
+        for chunk in chunks:
+            firsts.append(firsts[-1] + len(chunk))
+        tasks = ((copy.copy(template), c, m[0], m[1], f, firsts[-1], inner_widths)
+                 for c, m, f in zip(chunks, measured, firsts))
+        for rendered in ordered_map(executor, render_chunk, tasks, ahead):
+            yield rendered
+    finally:
+        if owned:
+            executor.shutdown()
+
+
+def render_parallel(table, executor=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Render a table in parallel into one large string, identical to the table property.
+
+    :param BaseTable table: Table to render.
+    :param concurrent.futures.Executor executor: Executor to use, default_executor() (shut down afterwards) if None.
+    :param int chunk_rows: Number of rows per chunk.
+
+    :return: The entire table ready to be printed to the terminal.
+    :rtype: str
+    """
+    return '\n'.join(gen_chunks(table, executor, chunk_rows))
+
+
+def write_parallel(table, stream, executor=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Render a table in parallel, writing chunks in order as soon as they're ready. Same text as the table property.
+
+    :param BaseTable table: Table to render.
+    :param stream: File object opened in text mode, or an integer file descriptor (written as UTF-8).
+    :param concurrent.futures.Executor executor: Executor to use, default_executor() (shut down afterwards) if None.
+    :param int chunk_rows: Number of rows per chunk.
+
+    :return: Number of characters written.
+    :rtype: int
+    """
+    return write_lines(gen_chunks(table, executor, chunk_rows), stream, chunk_size=1)
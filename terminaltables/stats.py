@@ -0,0 +1,174 @@
+"""Opt-in instrumentation of table rendering: wall time per phase and counters.
+
+Example:
+    with StatsCollector(hook=send_to_metrics) as collector:
+        print(table.table)
+    print(collector.renders[0].as_dict())
+"""
+
+import threading
+from timeit import default_timer
+
+from terminaltables.width_and_alignment import WIDTH_CACHE
+
+_LOCAL = threading.local()
+
+
+class RenderStats(object):
+    """Timings and counters of one render.
+
+    :ivar str table_class: Name of the rendered table's class.
+    :ivar float max_dimensions: Seconds spent measuring cells and finding column widths and row heights.
+    :ivar float rows: Seconds spent aligning, padding, and combining cells into lines (gen_row_lines, templates).
+    :ivar float borders: Seconds spent building horizontal borders (horizontal_border, not cached ones).
+    :ivar float join: Seconds spent joining lines into one string.
+    :ivar int cells_measured: Number of cells measured during this render (0 if measurements were reused).
+    :ivar int lines: Number of lines produced.
+    :ivar int chars: Number of characters in the output.
+    :ivar int bytes: Number of bytes in the output encoded as UTF-8.
+    :ivar int borders_built: Number of horizontal borders built instead of reused.
+    :ivar int cache_hits: Number of WIDTH_CACHE lookups answered from the cache.
+    :ivar int cache_misses: Number of WIDTH_CACHE lookups that had to measure a string.
+    """
+
+    PHASES = ('max_dimensions', 'rows', 'borders', 'join')
+    COUNTERS = ('cells_measured', 'lines', 'chars', 'bytes', 'borders_built', 'cache_hits', 'cache_misses')
+
+    def __init__(self, table_class):
+        """Constructor.
+
+        :param str table_class: Name of the rendered table's class.
+        """
+        self.table_class = table_class
+        for name in self.PHASES:
+            setattr(self, name, 0.0)
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+
+    def __repr__(self):
+        """Represent with total time and line count."""
+        return '<{0} {1} {2:.6f}s {3} lines>'.format(self.__class__.__name__, self.table_class, self.total, self.lines)
+
+    @property
+    def total(self):
+        """Return the sum of all phases in seconds."""
+        return sum(getattr(self, n) for n in self.PHASES)
+
+    def as_dict(self):
+        """Return all timings and counters in a dictionary, e.g. for a metrics system.
+
+        :return: Names and values.
+        :rtype: dict
+        """
+        values = dict((n, getattr(self, n)) for n in self.PHASES + self.COUNTERS)
+        values.update(table_class=self.table_class, total=self.total)
+        return values
+
+
+class StatsCollector(object):
+    """Context manager that instruments every render of a table property in the current thread.
+
+    Renders outside the context manager (and write(), stream(), render_lines()) are not instrumented and don't pay
+    for it.
+
+    :ivar hook: Optional function called with the RenderStats of every render.
+    :ivar list renders: RenderStats of every render so far.
+    """
+
+    def __init__(self, hook=None):
+        """Constructor.
+
+        :param hook: Optional function called with the RenderStats of every render.
+        """
+        self.hook = hook
+        self.renders = list()
+
+    def __enter__(self):
+        """Start collecting."""
+        if not hasattr(_LOCAL, 'collectors'):
+            _LOCAL.collectors = list()
+        _LOCAL.collectors.append(self)
+        return self
+
+    def __exit__(self, *_):
+        """Stop collecting."""
+        _LOCAL.collectors.remove(self)
+
+    def record(self, stats):
+        """Keep stats of one render and call the hook.
+
+        :param RenderStats stats: Stats of one render.
+        """
+        self.renders.append(stats)
+        if self.hook is not None:
+            self.hook(stats)
+
+
+def active_collectors():
+    """Return the StatsCollector instances active in the current thread (usually an empty list).
+
+    :return: Active collectors.
+    :rtype: list
+    """
+    return getattr(_LOCAL, 'collectors', None) or list()
+
+
+def render_with_stats(table, prepared):
+    """Render a prepared table like BaseTable.render(), timing each phase separately.
+
+    :param BaseTable table: Table to render.
+    :param PreparedTable prepared: Table data from table.prepare().
+
+    :return: The rendered table and its stats.
+    :rtype: tuple
+    """
+    stats = RenderStats(table.__class__.__name__)
+    hits, misses = WIDTH_CACHE.hits, WIDTH_CACHE.misses
+
+    # Measure.
+    previous = prepared._measured  # pylint: disable=protected-access
+    start = default_timer()
+    measured = prepared._measure()  # pylint: disable=protected-access
+    stats.max_dimensions = default_timer() - start
+    if measured is not previous and not hasattr(measured[0], 'version'):
+        stats.cells_measured = sum(len(r) for r in measured[0])
+
+    # Render lines. Borders are built inside, their time is subtracted.
+    before = _border_state(table)
+    start = default_timer()
+    lines = list(prepared.gen_lines())
+    elapsed = default_timer() - start
+    after = _border_state(table)
+    if after[0] is before[0]:
+        stats.borders_built, stats.borders = after[1] - before[1], after[2] - before[2]
+    else:
+        stats.borders_built, stats.borders = after[1:]
+    stats.rows = max(elapsed - stats.borders, 0.0)
+
+    # Join.
+    start = default_timer()
+    output = '\n'.join(lines)
+    stats.join = default_timer() - start
+
+    stats.lines = len(lines)
+    stats.chars = len(output)
+    try:
+        stats.bytes = len(output.encode('utf-8'))
+    except UnicodeDecodeError:  # Python 2.x byte strings.
+        stats.bytes = len(output)
+    stats.cache_hits, stats.cache_misses = WIDTH_CACHE.hits - hits, WIDTH_CACHE.misses - misses
+    return output, stats
+
+
+def _border_state(table):
+    """Get the table's border cache and its counters.
+
+    :param BaseTable table: Table to inspect.
+
+    :return: BorderLines instance (or None), number of borders it built, and seconds spent building them.
+    :rtype: tuple
+    """
+    borders = table.__dict__.get('_border_lines', (None, None))[1]
+    if borders is None:
+        return None, 0, 0.0
+    return borders, borders.built, borders.seconds
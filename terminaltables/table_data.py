@@ -0,0 +1,430 @@
+"""Table data that keeps column widths and row heights up to date as it changes, or that is stored as columns."""
+
+from array import array
+from contextlib import contextmanager
+
+try:
+    from collections.abc import MutableSequence, Sequence
+except ImportError:  # Python 2.x.
+    from collections import MutableSequence, Sequence
+
+from terminaltables.width_and_alignment import CellMetrics, measure_cell
+
+# array.array type codes of numbers, which str() converts to single line ASCII strings.
+NUMERIC_TYPECODES = 'bBhHiIlLqQfd'
+
+
+class TableRow(MutableSequence):
+    """One row of cells in TableData. Every cell is measured once when it's added.
+
+    Changes are reported to the TableData instance the row belongs to, which takes O(number of columns) time.
+
+    :ivar list metrics: CellMetrics of each cell.
+    :ivar int height: Height (no padding) of the tallest cell.
+    """
+
+    def __init__(self, cells=(), parent=None):
+        """Constructor.
+
+        :param iter cells: Initial cells.
+        :param TableData parent: Table to notify when cells change.
+        """
+        self._cells = list(cells)
+        self.metrics = [measure_cell(c) for c in self._cells]
+        self.height = max([m.height for m in self.metrics] or [0])
+        self.parent = parent
+
+    def __repr__(self):
+        """Represent like a list."""
+        return '{0}({1!r})'.format(self.__class__.__name__, self._cells)
+
+    def __len__(self):
+        """Return the number of cells."""
+        return len(self._cells)
+
+    def __iter__(self):
+        """Iterate cells."""
+        return iter(self._cells)
+
+    def __getitem__(self, index):
+        """Return one cell or a list of cells.
+
+        :param index: Integer or slice.
+        """
+        return self._cells[index]
+
+    def __setitem__(self, index, value):
+        """Replace one cell or a slice of cells.
+
+        :param index: Integer or slice.
+        :param value: New cell or iterable of new cells.
+        """
+        if isinstance(index, slice):
+            value = list(value)
+            metrics = [measure_cell(c) for c in value]
+        else:
+            metrics = measure_cell(value)
+        with self._changing():
+            self._cells[index] = value
+            self.metrics[index] = metrics
+
+    def __delitem__(self, index):
+        """Remove one cell or a slice of cells.
+
+        :param index: Integer or slice.
+        """
+        with self._changing():
+            del self._cells[index]
+            del self.metrics[index]
+
+    def insert(self, index, value):
+        """Insert a cell before index.
+
+        :param int index: Position of the new cell.
+        :param value: New cell.
+        """
+        metrics = measure_cell(value)
+        with self._changing():
+            self._cells.insert(index, value)
+            self.metrics.insert(index, metrics)
+
+    @contextmanager
+    def _changing(self):
+        """Remove this row from the parent's column width counts during a change, then update and add it back."""
+        if self.parent is not None:
+            self.parent.forget_row(self)
+        try:
+            yield
+        finally:
+            self.height = max([m.height for m in self.metrics] or [0])
+            if self.parent is not None:
+                self.parent.count_row(self)
+                self.parent.version += 1
+
+
+class TableData(MutableSequence):
+    """List of lists of strings usable as table_data, that maintains column widths incrementally.
+
+    Appending, inserting, replacing, or deleting rows or cells only measures the new cells. Every column keeps a count
+    of how many cells have each width, so the widest cell can be removed without re-scanning the column. Tables read
+    widths and heights from here instead of measuring every cell on every render.
+
+    :ivar int version: Incremented on every change. Used by PreparedTable to detect changes.
+    """
+
+    def __init__(self, rows=()):
+        """Constructor.
+
+        :param iter rows: Initial rows (iterables of cells).
+        """
+        self.version = 0
+        self._rows = list()
+        self._row_lengths = dict()  # Number of rows with each length.
+        self._width_counts = list()  # For each column: number of cells with each width.
+        self._max_widths = list()
+        self.extend(rows)
+
+    def __repr__(self):
+        """Represent like a list."""
+        return '{0}({1!r})'.format(self.__class__.__name__, [list(r) for r in self._rows])
+
+    def __len__(self):
+        """Return the number of rows."""
+        return len(self._rows)
+
+    def __iter__(self):
+        """Iterate rows."""
+        return iter(self._rows)
+
+    def __getitem__(self, index):
+        """Return one row or a list of rows.
+
+        :param index: Integer or slice.
+        """
+        return self._rows[index]
+
+    def __setitem__(self, index, value):
+        """Replace one row or a slice of rows.
+
+        :param index: Integer or slice.
+        :param value: New row or iterable of new rows.
+        """
+        if isinstance(index, slice):
+            new = [TableRow(r, self) for r in value]
+        else:
+            new = TableRow(value, self)
+        old = self._rows[index]
+        self._rows[index] = new
+        for row in old if isinstance(index, slice) else [old]:
+            self.forget_row(row)
+            row.parent = None
+        for row in new if isinstance(index, slice) else [new]:
+            self.count_row(row)
+        self.version += 1
+
+    def __delitem__(self, index):
+        """Remove one row or a slice of rows.
+
+        :param index: Integer or slice.
+        """
+        old = self._rows[index]
+        del self._rows[index]
+        for row in old if isinstance(index, slice) else [old]:
+            self.forget_row(row)
+            row.parent = None
+        self.version += 1
+
+    def insert(self, index, value):
+        """Insert a row before index.
+
+        :param int index: Position of the new row.
+        :param iter value: New row.
+        """
+        row = TableRow(value, self)
+        self._rows.insert(index, row)
+        self.count_row(row)
+        self.version += 1
+
+    def count_row(self, row):
+        """Add a row's cell widths to the column width counts.
+
+        :param TableRow row: Row being added.
+        """
+        length = len(row.metrics)
+        self._row_lengths[length] = self._row_lengths.get(length, 0) + 1
+        while len(self._width_counts) < length:
+            self._width_counts.append(dict())
+            self._max_widths.append(0)
+        for i, metrics in enumerate(row.metrics):
+            counts = self._width_counts[i]
+            counts[metrics.width] = counts.get(metrics.width, 0) + 1
+            if metrics.width > self._max_widths[i]:
+                self._max_widths[i] = metrics.width
+
+    def forget_row(self, row):
+        """Remove a row's cell widths from the column width counts.
+
+        :param TableRow row: Row being removed.
+        """
+        length = len(row.metrics)
+        self._row_lengths[length] -= 1
+        if not self._row_lengths[length]:
+            del self._row_lengths[length]
+        for i, metrics in enumerate(row.metrics):
+            counts = self._width_counts[i]
+            counts[metrics.width] -= 1
+            if not counts[metrics.width]:
+                del counts[metrics.width]
+                if metrics.width == self._max_widths[i]:  # Widest cell removed, next widest is in the counts.
+                    self._max_widths[i] = max(counts) if counts else 0
+
+    @property
+    def inner_widths(self):
+        """Return a list of widths (no padding) for each column."""
+        return self._max_widths[:max(self._row_lengths) if self._row_lengths else 0]
+
+    @property
+    def inner_heights(self):
+        """Return a list of heights (no padding) for each row."""
+        return [r.height for r in self._rows]
+
+    @property
+    def table_metrics(self):
+        """Return a list of lists of CellMetrics, one for every cell."""
+        return [r.metrics for r in self._rows]
+
+
+def measure_column(column):
+    """Measure every cell of one column in a single pass.
+
+    Numeric array.array columns skip measure_cell(): their cells are single line ASCII, so width is len(str(cell)).
+    MeasuredColumn instances are already measured.
+
+    :param iter column: Cells of the column.
+
+    :return: List of CellMetrics.
+    :rtype: list
+    """
+    if isinstance(column, MeasuredColumn):
+        return column.metrics
+    if isinstance(column, array) and column.typecode in NUMERIC_TYPECODES:
+        return [CellMetrics([s], [len(s)], len(s), 1) for s in map(str, column)]
+    return [measure_cell(c) for c in column]
+
+
+class MeasuredColumn(Sequence):
+    """Column of cells already converted to strings and measured, e.g. by terminaltables.numeric.format_array().
+
+    :ivar list cells: Cells (strings).
+    :ivar list metrics: CellMetrics of each cell.
+    :ivar int width: Visible width of the widest cell.
+    """
+
+    def __init__(self, cells, metrics, width):
+        """Constructor.
+
+        :param list cells: Cells (strings).
+        :param list metrics: CellMetrics of each cell.
+        :param int width: Visible width of the widest cell.
+        """
+        self.cells = cells
+        self.metrics = metrics
+        self.width = width
+
+    def __repr__(self):
+        """Represent like a list."""
+        return '{0}({1!r})'.format(self.__class__.__name__, self.cells)
+
+    def __len__(self):
+        """Return the number of cells."""
+        return len(self.cells)
+
+    def __getitem__(self, index):
+        """Return one cell or a list of cells.
+
+        :param index: Integer or slice.
+        """
+        return self.cells[index]
+
+
+class ColumnRow(Sequence):
+    """One row of ColumnRows. A view reading cells from the columns by index, no list of cells is built."""
+
+    __slots__ = ('columns', 'index')
+
+    def __init__(self, columns, index):
+        """Constructor.
+
+        :param list columns: Columns of the table.
+        :param int index: Index of the row in every column.
+        """
+        self.columns = columns
+        self.index = index
+
+    def __repr__(self):
+        """Represent like a list."""
+        return '{0}({1!r})'.format(self.__class__.__name__, list(self))
+
+    def __len__(self):
+        """Return the number of cells."""
+        return len(self.columns)
+
+    def __iter__(self):
+        """Iterate cells."""
+        index = self.index
+        return (c[index] for c in self.columns)
+
+    def __getitem__(self, index):
+        """Return one cell or a list of cells.
+
+        :param index: Integer or slice.
+        """
+        if isinstance(index, slice):
+            return [c[self.index] for c in self.columns[index]]
+        return self.columns[index][self.index]
+
+
+class ColumnRows(Sequence):
+    """Read-only list of rows over a list of equally long columns, optionally preceded by a heading row.
+
+    :ivar list columns: Columns, any sequences (lists, array.array, etc.).
+    :ivar list heading: Cells of the first row, or None.
+    """
+
+    def __init__(self, columns, heading=None):
+        """Constructor.
+
+        :param iter columns: Columns, all of the same length.
+        :param iter heading: Optional cells of the first row, one per column.
+        """
+        self.columns = list(columns)
+        self.heading = None if heading is None else list(heading)
+        lengths = set(len(c) for c in self.columns)
+        if len(lengths) > 1:
+            raise ValueError('Columns must have the same length.')
+        if self.heading is not None and len(self.heading) != len(self.columns):
+            raise ValueError('Heading must have one cell per column.')
+        self._length = lengths.pop() if lengths else 0
+
+    def __repr__(self):
+        """Represent like a list."""
+        return '{0}({1!r})'.format(self.__class__.__name__, [list(r) for r in self])
+
+    def __len__(self):
+        """Return the number of rows."""
+        return self._length + (self.heading is not None)
+
+    def __getitem__(self, index):
+        """Return one row or a list of rows.
+
+        :param index: Integer or slice.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('row index out of range')
+        if self.heading is not None:
+            if not index:
+                return self.heading
+            index -= 1
+        return ColumnRow(self.columns, index)
+
+
+class ColumnData(ColumnRows):
+    """Column-oriented table data usable as table_data, e.g. a dict of lists or array.array instead of rows.
+
+    Every column is measured once, in one pass, when the instance is created, and rows are views assembled as they're
+    rendered. The data is never transposed into lists of rows. The columns must not be changed afterwards: create a
+    new instance instead.
+
+    :ivar int version: Always 0, columns are read-only.
+    """
+
+    version = 0
+
+    def __init__(self, columns, heading=None):
+        """Constructor.
+
+        :param columns: Columns, all of the same length. Either a list of columns or a mapping (e.g. an OrderedDict)
+            of heading cells to columns.
+        :param iter heading: Optional cells of the first row. Defaults to the keys of columns if it's a mapping.
+        """
+        if hasattr(columns, 'keys'):
+            if heading is None:
+                heading = list(columns.keys())
+            columns = [columns[k] for k in columns.keys()]
+        super(ColumnData, self).__init__(columns, heading)
+
+        metrics = [measure_column(c) for c in self.columns]
+        heading_metrics = None if self.heading is None else [measure_cell(c) for c in self.heading]
+        self._table_metrics = ColumnRows(metrics, heading_metrics)
+
+        self._inner_widths = list()
+        for column, column_metrics in zip(self.columns, metrics):
+            if isinstance(column, MeasuredColumn):
+                self._inner_widths.append(column.width)
+            else:
+                self._inner_widths.append(max([m.width for m in column_metrics] or [0]))
+        self._inner_heights = [0] * self._length
+        for column in metrics:
+            self._inner_heights = list(map(max, self._inner_heights, [m.height for m in column]))
+        if heading_metrics is not None:
+            self._inner_widths = list(map(max, self._inner_widths, [m.width for m in heading_metrics]))
+            self._inner_heights.insert(0, max([m.height for m in heading_metrics] or [0]))
+
+    @property
+    def inner_widths(self):
+        """Return a list of widths (no padding) for each column."""
+        return self._inner_widths
+
+    @property
+    def inner_heights(self):
+        """Return a list of heights (no padding) for each row."""
+        return self._inner_heights
+
+    @property
+    def table_metrics(self):
+        """Return a list of rows of CellMetrics, one for every cell. Rows are views like the rows of table data."""
+        return self._table_metrics
@@ -1,9 +1,15 @@
 """Get info about the current terminal window/screen buffer."""
 
 import ctypes
+import signal
 import struct
 import sys
 
+try:
+    from time import monotonic as clock
+except ImportError:  # Python 2.x.
+    from time import time as clock
+
 DEFAULT_HEIGHT = 24
 DEFAULT_WIDTH = 79
 INVALID_HANDLE_VALUE = -1
@@ -68,6 +74,89 @@ def terminal_size(kernel32=None):
     return width, height
 
 
+class TerminalSize(object):
+    """Cached terminal_size(). Call the instance to get the width and height without a syscall every time.
+
+    By default the size is queried again at most once every poll_interval seconds.
+
+    Optionally (use_signal=True or watch()) a SIGWINCH handler marks the cached size stale when the terminal is resized
+    instead, calling the handler it replaced. This changes process-wide state: on Python 2 a Python-level signal
+    handler makes blocking system calls interrupted by a resize raise EINTR (IOError/OSError) in the application's
+    code. If the application or a library (e.g. curses) installs its own SIGWINCH handler afterwards, this is detected
+    and polling resumes. Signals aren't available on Windows or outside the main thread, polling is used there.
+
+    :ivar query: Function that returns the width and height of the terminal.
+    :ivar float poll_interval: Seconds to cache the size for when not watching SIGWINCH.
+    :ivar bool use_signal: Install a SIGWINCH handler on first use. Off by default, see above.
+    :ivar tuple pinned: Width and height to return instead of querying (e.g. tests and headless rendering). Or None.
+    """
+
+    def __init__(self, query=terminal_size, poll_interval=1.0, use_signal=False):
+        """Constructor.
+
+        :param query: Function that returns the width and height of the terminal.
+        :param float poll_interval: Seconds to cache the size for when not watching SIGWINCH.
+        :param bool use_signal: Install a SIGWINCH handler on first use.
+        """
+        self.query = query
+        self.poll_interval = poll_interval
+        self.use_signal = use_signal
+        self.pinned = None
+        self.watching = False
+        self._handler = None
+        self._size = None
+        self._queried = 0.0
+
+    def __call__(self):
+        """Get the width and height of the terminal.
+
+        :return: Width (number of characters) and height (number of lines) of the terminal.
+        :rtype: tuple
+        """
+        if self.pinned is not None:
+            return self.pinned
+        if self.watching and signal.getsignal(signal.SIGWINCH) is not self._handler:
+            # Replaced by another handler, resizes may have been missed. Poll from now on.
+            self.watching = self.use_signal = False
+            self._size = None
+        if self._size is None or (not self.watching and clock() - self._queried >= self.poll_interval):
+            if self.use_signal and not self.watching:
+                self.watch()
+            self._size = self.query()
+            self._queried = clock()
+        return self._size
+
+    def invalidate(self):
+        """Query the terminal again on the next call."""
+        self._size = None
+
+    def watch(self):
+        """Install the SIGWINCH handler. See the class docstring for its side effects.
+
+        :return: If the handler is installed.
+        :rtype: bool
+        """
+        if self.watching or not hasattr(signal, 'SIGWINCH'):
+            return self.watching
+        previous = signal.getsignal(signal.SIGWINCH)
+
+        def handler(signum, frame):
+            """Invalidate the cached size and call the handler that was replaced."""
+            self.invalidate()
+            if callable(previous):
+                previous(signum, frame)
+
+        try:
+            signal.signal(signal.SIGWINCH, handler)
+        except ValueError:  # Not the main thread.
+            return False
+        self.watching, self._handler = True, handler
+        return True
+
+
+TERMINAL_SIZE = TerminalSize()
+
+
 def set_terminal_title(title, kernel32=None):
     """Set the terminal title.
 
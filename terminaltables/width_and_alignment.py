@@ -1,11 +1,121 @@
 """Functions that handle alignment, padding, widths, etc."""
 
 import re
+import sys
+import threading
 import unicodedata
+from bisect import bisect_right
+from collections import namedtuple
+
+from terminaltables.terminal_io import TERMINAL_SIZE
+from terminaltables.width_table import UNIDATA_VERSION, WIDE_BOUNDARIES
+
+# Cached terminal_size(), queried again at most once a second (or on SIGWINCH after TERMINAL_SIZE.watch()). Set
+# TERMINAL_SIZE.pinned to fix the size.
+terminal_size = TERMINAL_SIZE  # pylint: disable=invalid-name
+
+# Tokenizes every kind of terminal escape sequence in a single pass:
+# CSI: parameter bytes (SGR colors including colon separated params, cursor movement, etc.) and one final byte.
+# OSC: string terminated by BEL or ST, e.g. \033]8;;url\033\\ hyperlinks. DCS/SOS/PM/APC: string terminated by ST.
+# nF: intermediate bytes and one final byte, e.g. \033(0 and \033(B charset designations emitted by UnixTable.
+# Fp/Fe/Fs: other two character escapes. A lone or incomplete escape at the end of a string still matches.
+RE_ESCAPE_CODES = re.compile(
+    r'\033(?:'
+    r'\[[0-?]*[ -/]*[@-~]?|'
+    r'\][^\007\033]*(?:\007|\033\\)?|'
+    r'[PX^_][^\033]*(?:\033\\)?|'
+    r'[ -/]+[0-~]?|'
+    r'[0-~]'
+    r')?'
+)
+
+try:
+    CHR = unichr  # noqa pylint: disable=undefined-variable
+except NameError:
+    CHR = chr
+TEXT = type(u'')
+
+# Attributes set (1-9) or reset (21-29) by single parameter SGR escape sequences, besides colors.
+SGR_ATTRIBUTES = {
+    1: 'intensity', 2: 'intensity', 22: 'intensity', 3: 'italic', 23: 'italic', 4: 'underline', 21: 'underline',
+    24: 'underline', 5: 'blink', 6: 'blink', 25: 'blink', 7: 'inverse', 27: 'inverse', 8: 'hidden', 28: 'hidden',
+    9: 'strike', 29: 'strike',
+}
+SGR_OFF = ('22', '23', '24', '25', '27', '28', '29', '39', '49')
+
+
+def build_wide_boundaries(east_asian_width=unicodedata.east_asian_width, maxunicode=sys.maxunicode):
+    """Scan every code point and return boundaries of ranges that are East Asian Fullwidth or Wide.
+
+    Used to generate terminaltables/width_table.py and as a fallback when the running Python's unicodedata version
+    doesn't match the one the table was generated from. Takes a fraction of a second so it's never done at import time.
+
+    :param east_asian_width: Function that returns the East Asian Width property of a character.
+    :param int maxunicode: Highest code point to scan.
+
+    :return: Sorted boundaries. Wide code points are in [b[0], b[1]), [b[2], b[3]), etc.
+    :rtype: tuple
+    """
+    boundaries, previous = list(), False
+    for code_point in range(maxunicode + 1):
+        wide = east_asian_width(CHR(code_point)) in ('F', 'W')
+        if wide is not previous:
+            boundaries.append(code_point)
+            previous = wide
+    if previous:
+        boundaries.append(maxunicode + 1)
+    return tuple(boundaries)
+
+
+# Lookup table used by visible_width(). Filled lazily by _wide_boundaries() if unicodedata versions differ.
+WIDE = list(WIDE_BOUNDARIES) if UNIDATA_VERSION == unicodedata.unidata_version else list()
+
+
+def _wide_boundaries():
+    """Return the lookup table, building it from unicodedata on first use if the shipped table is for another version.
+
+    :return: Sorted wide/narrow boundaries.
+    :rtype: list
+    """
+    if not WIDE:
+        WIDE.extend(build_wide_boundaries())
+    return WIDE
+
+
+class CharWidths(dict):
+    """Memoized character to width (1 or 2) mapping, filled from the WIDE lookup table as characters are seen."""
 
-from terminaltables.terminal_io import terminal_size
+    def __missing__(self, char):
+        """Look up a character not seen before. Wide characters have odd indexes in the lookup table.
 
-RE_COLOR_ANSI = re.compile(r'(\033\[[\d;]+m)')
+        :param str char: Single character.
+
+        :return: Character's width.
+        :rtype: int
+        """
+        width = self[char] = 2 if bisect_right(WIDE or _wide_boundaries(), ord(char)) & 1 else 1
+        return width
+
+
+CHAR_WIDTHS = CharWidths()
+
+
+def _raw_width(string):
+    """Get the width of a unicode string assuming every character is printable.
+
+    :param str string: String to measure.
+
+    :return: String's width.
+    :rtype: int
+    """
+    # Fast path: ASCII strings don't have any wide characters.
+    try:
+        if string.isascii():
+            return len(string)
+    except AttributeError:  # Python < 3.7.
+        pass
+
+    return sum(map(CHAR_WIDTHS.__getitem__, string))
 
 
 def visible_width(string):
@@ -20,29 +130,423 @@ def visible_width(string):
     :return: String's width.
     :rtype: int
     """
-    if '\033' in string:
-        string = RE_COLOR_ANSI.sub('', string)
+    has_escape_codes = '\033' in string
 
-    # Convert to unicode.
-    try:
+    # Convert to unicode. Subclasses such as colorclass.Color override len() to exclude escape codes.
+    if isinstance(string, bytes):
         string = string.decode('u8')
-    except (AttributeError, UnicodeEncodeError):
-        pass
-
-    width = 0
-    for char in string:
-        if unicodedata.east_asian_width(char) in ('F', 'W'):
-            width += 2
-        else:
-            width += 1
+    elif type(string) is not TEXT:  # pylint: disable=unidiomatic-typecheck
+        string = TEXT(string)
 
+    # Measure everything, then subtract escape sequences instead of building a stripped copy of the string.
+    width = _raw_width(string)
+    if has_escape_codes:
+        width -= sum(map(_raw_width, RE_ESCAPE_CODES.findall(string)))
     return width
 
 
+class WidthCache(object):
+    """Bounded LRU cache of visible_width() results. Shared by max_dimensions(), align_and_pad_cell(), build_border().
+
+    Plain ASCII strings without escape codes bypass the cache (and its counters) since len() is cheaper than a lookup.
+    Lookups, reordering, and evictions hold a lock, so one instance may be shared by threads (e.g. render_parallel()).
+
+    :ivar int maxsize: Maximum number of cached strings. Set to 0 to disable caching.
+    :ivar int hits: Number of lookups answered from the cache.
+    :ivar int misses: Number of lookups that had to measure the string.
+    :ivar int evictions: Number of least recently used strings dropped to stay within maxsize.
+    """
+
+    def __init__(self, maxsize=4096):
+        """Constructor.
+
+        :param int maxsize: Maximum number of cached strings. Set to 0 to disable caching.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Circular doubly linked list of [previous, next, string, width] links, least recently used first. Not an
+        # OrderedDict, Python 2.6 doesn't have it.
+        self._cache = dict()  # String to its link.
+        self._root = self._new_root()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _new_root():
+        """Create the sentinel link of an empty list.
+
+        :return: Link pointing to itself.
+        :rtype: list
+        """
+        root = list()
+        root[:] = [root, root, None, None]
+        return root
+
+    def __len__(self):
+        """Return the number of cached strings."""
+        return len(self._cache)
+
+    def clear(self):
+        """Drop all cached strings and reset counters."""
+        with self._lock:
+            self._cache.clear()
+            self._root = self._new_root()
+            self.hits = self.misses = self.evictions = 0
+
+    def width(self, string):
+        """Get the visible width of a string, measuring it only if it's not already cached.
+
+        :param str string: String to measure.
+
+        :return: String's width.
+        :rtype: int
+        """
+        try:
+            if string.isascii() and '\033' not in string:
+                return len(string)
+        except AttributeError:  # Python < 3.7 or not a string.
+            pass
+        if self.maxsize <= 0:
+            return visible_width(string)
+
+        with self._lock:
+            cache, root = self._cache, self._root
+            link = cache.get(string)
+            if link is not None:
+                # Move to the end, most recently used strings are there.
+                link[0][1], link[1][0] = link[1], link[0]
+                last = root[0]
+                last[1] = root[0] = link
+                link[0], link[1] = last, root
+                self.hits += 1
+                return link[3]
+
+        width = visible_width(string)  # Measured without the lock, other threads may measure the same string.
+        with self._lock:
+            cache, root = self._cache, self._root
+            self.misses += 1
+            if string in cache:
+                return width
+            while cache and len(cache) >= self.maxsize:
+                oldest = root[1]
+                root[1], oldest[1][0] = oldest[1], root
+                del cache[oldest[2]]
+                self.evictions += 1
+            last = root[0]
+            last[1] = root[0] = cache[string] = [last, root, string, width]
+        return width
+
+
+WIDTH_CACHE = WidthCache()
+
+
+class CellMetrics(namedtuple('CellMetrics', 'lines widths width height')):
+    """A cell split into lines with each line measured once. Returned by measure_cell().
+
+    :ivar list lines: Lines of the cell. Always at least one (empty) line.
+    :ivar list widths: Visible width of each line.
+    :ivar int width: Visible width of the widest line.
+    :ivar int height: Number of lines, 0 for empty cells.
+    """
+
+    __slots__ = ()
+
+
+def measure_cell(cell):
+    """Convert a cell to a string, split it into lines, and measure the visible width of each line.
+
+    :param cell: Cell from table data (string or any other object).
+
+    :return: Cell's lines and their widths.
+    :rtype: CellMetrics
+    """
+    if not hasattr(cell, 'count') or not hasattr(cell, 'splitlines'):
+        cell = str(cell)
+
+    # Handle trailing newlines or empty strings, str.splitlines() does not satisfy.
+    lines = cell.splitlines() or ['']
+    if cell.endswith('\n'):
+        lines.append('')
+
+    widths = [WIDTH_CACHE.width(line) for line in lines]
+    return CellMetrics(lines, widths, max(widths), len(lines) if cell else 0)
+
+
+def measure_table(table_data):
+    """Measure every cell in the table once so later stages don't have to split and measure them again.
+
+    :param iter table_data: List of list of strings (unmodified table data).
+
+    :return: List of list of CellMetrics, same shape as table_data.
+    :rtype: list
+    """
+    return [[measure_cell(c) for c in row] for row in table_data]
+
+
+class CompactTableMetrics(object):
+    """Measurements of every cell in a table, stored compactly. A read-only sequence of rows of CellMetrics.
+
+    Single-line cells not changed by fitting are stored as their width only, their text is read from table_data again
+    (without measuring it) when a row is read. Other cells are stored as CellMetrics. A list of lists of CellMetrics
+    takes about ten times the memory of the table data.
+
+    :ivar iter table_data: List of list of cells that were measured.
+    :ivar list inner_widths: Widths (no padding) for each column.
+    :ivar list inner_heights: Heights (no padding) for each row.
+    """
+
+    def __init__(self, table_data, fit=None):
+        """Measure every cell once.
+
+        :param iter table_data: List of list of strings (unmodified table data).
+        :param fit: Optional function taking a row of CellMetrics and returning it fitted to maximum widths.
+        """
+        self.table_data = table_data
+        self._rows = list()
+        self.inner_widths, self.inner_heights = max_dimensions(table_data, table_metrics=self._measure(fit))[:2]
+
+    def _measure(self, fit):
+        """Measure rows, storing them compactly.
+
+        :param fit: Optional function taking a row of CellMetrics and returning it fitted to maximum widths.
+
+        :return: Yields rows of CellMetrics.
+        :rtype: iter
+        """
+        append = self._rows.append
+        for row in self.table_data:
+            measured = [measure_cell(c) for c in row]
+            fitted = fit(measured) if fit else measured
+            append(tuple(m.widths[0] if m is o and len(m.lines) == 1 else m for m, o in zip(fitted, measured)))
+            yield fitted
+
+    @staticmethod
+    def _expand(row, compact):
+        """Rebuild CellMetrics of one row.
+
+        :param iter row: Cells from table data.
+        :param tuple compact: Stored widths and CellMetrics.
+
+        :return: Row of CellMetrics.
+        :rtype: list
+        """
+        expanded = list()
+        for cell, stored in zip(row, compact):
+            if stored.__class__ is int:
+                if not hasattr(cell, 'count') or not hasattr(cell, 'splitlines'):
+                    cell = str(cell)
+                stored = CellMetrics([cell], [stored], stored, 1 if cell else 0)
+            expanded.append(stored)
+        return expanded
+
+    def __len__(self):
+        """Return the number of rows."""
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        """Get a row of CellMetrics."""
+        return self._expand(self.table_data[index], self._rows[index])
+
+    def __iter__(self):
+        """Yield rows of CellMetrics."""
+        table_data, expand = self.table_data, self._expand
+        for i, compact in enumerate(self._rows):
+            yield expand(table_data[i], compact)
+
+
+def split_line(line, width):
+    """Split one line of text where it reaches a visible width. Escape sequences have no width and stay in the head.
+
+    :param str line: Line of text (no newlines).
+    :param int width: Maximum visible width of the head.
+
+    :return: Head (at most width wide) and the rest of the line.
+    :rtype: tuple
+    """
+    if not isinstance(line, bytes) and type(line) is not TEXT:  # pylint: disable=unidiomatic-typecheck
+        line = TEXT(line)  # Subclasses such as colorclass.Color index and slice around escape codes.
+    if '\033' not in line:
+        try:
+            if line.isascii():
+                return line[:width], line[width:]
+        except AttributeError:  # Python < 3.7.
+            pass
+
+    used, position, length = 0, 0, len(line)
+    while position < length:
+        if line[position] == '\033':
+            position = RE_ESCAPE_CODES.match(line, position).end()
+            continue
+        used += CHAR_WIDTHS[line[position]]
+        if used > width:
+            break
+        position += 1
+    return line[:position], line[position:]
+
+
+def sgr_group(code):
+    r"""Determine which attribute an SGR escape sequence sets or resets, e.g. foreground color for 31, 38;5;9, and 39.
+
+    :param str code: SGR escape sequence, e.g. '\033[31m'.
+
+    :return: Attribute name, or None for sequences setting several attributes.
+    :rtype: str
+    """
+    params = code[2:-1].split(';')
+    first = int(params[0]) if params[0].isdigit() else -1
+    if len(params) > 1 and first not in (38, 48):
+        return None
+    if 30 <= first <= 39 or 90 <= first <= 97:
+        return 'foreground'
+    if 40 <= first <= 49 or 100 <= first <= 107:
+        return 'background'
+    return SGR_ATTRIBUTES.get(first)
+
+
+def open_escapes(codes):
+    """Reduce escape sequences to the colors and charsets they leave in effect.
+
+    That's SGR codes after the last reset, minus attributes turned off again, and charsets other than ASCII.
+
+    :param iter codes: Escape sequences in the order they were printed.
+
+    :return: Escape sequences that restore the state and escape sequences that reset it (both empty if nothing is open).
+    :rtype: tuple
+    """
+    sgr, charsets = list(), dict()
+    for code in codes:
+        if code[1:2] in ('(', ')'):
+            charsets[code[1]] = code
+        elif code.startswith('\033[') and code.endswith('m'):
+            if code in ('\033[0m', '\033[m'):
+                sgr = list()
+            elif code[2:-1] in SGR_OFF:
+                group = sgr_group(code)
+                sgr = [c for c in sgr if sgr_group(c) != group]
+                if any(sgr_group(c) is None for c in sgr):  # May turn off part of a sequence setting several.
+                    sgr.append(code)
+            else:
+                sgr.append(code)
+    designated = [charsets[k] for k in sorted(charsets) if charsets[k][2:] != 'B']
+    restore = ''.join(sgr + designated)
+    reset = ('\033[0m' if sgr else '') + ''.join(c[:2] + 'B' for c in designated)
+    return restore, reset
+
+
+def wrap_line(line, width):
+    """Split one line of text into pieces of a visible width in a single pass. Escape sequences have no width.
+
+    Like textwrap.wrap() pieces end at the last space that fits (the space is dropped), but widths are visible widths.
+    Words wider than width are split anywhere. Colors and charsets still open at the end of a piece are reset there and
+    restored at the start of the next piece, so they don't leak into padding and borders.
+
+    :param str line: Line of text (no newlines).
+    :param int width: Maximum visible width of each piece. A piece is wider only if one character is wider.
+
+    :return: Pieces and their visible widths.
+    :rtype: list
+    """
+    if not isinstance(line, bytes) and type(line) is not TEXT:  # pylint: disable=unidiomatic-typecheck
+        line = TEXT(line)  # Subclasses such as colorclass.Color index and slice around escape codes.
+    width = max(width, 1)
+    pieces, start, length = list(), 0, len(line)
+    if '\033' not in line:
+        try:
+            ascii_only = line.isascii()
+        except AttributeError:  # Python < 3.7.
+            ascii_only = False
+        if ascii_only:
+            while length - start > width:
+                space = line.rfind(' ', start + 1, start + width + 1)
+                stop = start + width if space < 0 else space
+                pieces.append((line[start:stop], stop - start))
+                start = stop + 1 if space >= 0 else stop
+            if start < length or not pieces:
+                pieces.append((line[start:], length - start))
+            return pieces
+
+    used, position, space, space_used = 0, 0, -1, 0
+    while position < length:
+        char = line[position]
+        if char == '\033':
+            position = RE_ESCAPE_CODES.match(line, position).end()
+            continue
+        char_width = CHAR_WIDTHS[char]
+        while used and used + char_width > width:
+            if char == ' ':  # Break at the space that doesn't fit.
+                pieces.append((line[start:position], used))
+                start, used, space = position + 1, 0, -1
+                break
+            if space > start:  # Break at the last space.
+                pieces.append((line[start:space], space_used))
+                start, used, space = space + 1, used - space_used - CHAR_WIDTHS[' '], -1
+                continue
+            pieces.append((line[start:position], used))
+            start, used, space = position, 0, -1
+        if start > position:
+            position += 1
+            continue
+        if char == ' ':
+            space, space_used = position, used
+        used += char_width
+        position += 1
+    if start < length or not pieces:
+        pieces.append((line[start:], used))
+
+    codes, restore = list(), ''
+    for i, (piece, piece_width) in enumerate(pieces[:-1]):
+        codes.extend(RE_ESCAPE_CODES.findall(piece))
+        state, reset = open_escapes(codes)
+        pieces[i] = (restore + piece + reset, piece_width)
+        restore = state
+    if restore:
+        pieces[-1] = (restore + pieces[-1][0], pieces[-1][1])
+    return pieces
+
+
+def fit_cell(metrics, width, overflow, ellipsis='...'):
+    """Make every line of a measured cell fit within a width by truncating or wrapping the lines that are too wide.
+
+    :param CellMetrics metrics: Cell from measure_cell().
+    :param int width: Maximum visible width (no padding).
+    :param str overflow: Either 'truncate' (cut lines), 'ellipsis' (cut lines and end them with the ellipsis), or
+        'wrap' (continue them on new lines).
+    :param str ellipsis: Appended to lines cut by 'ellipsis'.
+
+    :return: New CellMetrics, or the same one if it already fits.
+    :rtype: CellMetrics
+    """
+    if metrics.width <= width:
+        return metrics
+
+    lines, widths = list(), list()
+    for line, line_width in zip(metrics.lines, metrics.widths):
+        if overflow == 'wrap' and line_width > width:
+            for piece, piece_width in wrap_line(line, width):
+                lines.append(piece)
+                widths.append(piece_width)
+            continue
+        if overflow != 'wrap' and line_width > width:
+            if overflow != 'ellipsis':
+                ellipsis = ''
+            ellipsis_width = WIDTH_CACHE.width(ellipsis)
+            if ellipsis_width > width:
+                line = split_line(ellipsis, width)[0]
+            else:
+                head, rest = split_line(line, width - ellipsis_width)
+                line = head + ellipsis + ''.join(RE_ESCAPE_CODES.findall(rest))  # Keep color resets.
+            line_width = WIDTH_CACHE.width(line)
+        lines.append(line)
+        widths.append(line_width)
+
+    return CellMetrics(lines, widths, max(widths), len(lines))
+
+
 def align_and_pad_cell(string, align, inner_dimensions, padding, space=' '):
     """Align a string horizontally and vertically. Also add additional padding in both dimensions.
 
-    :param str string: Input string to operate on.
+    :param str string: Input string to operate on, or its CellMetrics from measure_cell() to skip measuring it again.
     :param tuple align: Tuple that contains one of left/center/right and/or top/middle/bottom.
     :param tuple inner_dimensions: Width and height ints to expand string to without padding.
     :param iter padding: Number of space chars for left, right, top, and bottom (4 ints).
@@ -51,37 +555,34 @@ def align_and_pad_cell(string, align, inner_dimensions, padding, space=' '):
     :return: Padded cell split into lines.
     :rtype: list
     """
-    if not hasattr(string, 'splitlines'):
-        string = str(string)
+    if not isinstance(string, CellMetrics):
+        string = measure_cell(string)
 
-    # Handle trailing newlines or empty strings, str.splitlines() does not satisfy.
-    lines = string.splitlines() or ['']
-    if string.endswith('\n'):
-        lines.append('')
+    # Horizontally align and pad.
+    lines = list()
+    for line, width in zip(string.lines, string.widths):
+        new_width = inner_dimensions[0] + len(line) - width
+        if 'right' in align:
+            lines.append(line.rjust(padding[0] + new_width, space) + (space * padding[1]))
+        elif 'center' in align:
+            lines.append((space * padding[0]) + line.center(new_width, space) + (space * padding[1]))
+        else:
+            lines.append((space * padding[0]) + line.ljust(new_width + padding[1], space))
 
     # Vertically align and pad.
+    blank = [space * (padding[0] + inner_dimensions[0] + padding[1])]
     if 'bottom' in align:
-        lines = ([''] * (inner_dimensions[1] - len(lines) + padding[2])) + lines + ([''] * padding[3])
+        lines = (blank * (inner_dimensions[1] - len(lines) + padding[2])) + lines + (blank * padding[3])
     elif 'middle' in align:
         delta = inner_dimensions[1] - len(lines)
-        lines = ([''] * (delta // 2 + delta % 2 + padding[2])) + lines + ([''] * (delta // 2 + padding[3]))
+        lines = (blank * (delta // 2 + delta % 2 + padding[2])) + lines + (blank * (delta // 2 + padding[3]))
     else:
-        lines = ([''] * padding[2]) + lines + ([''] * (inner_dimensions[1] - len(lines) + padding[3]))
-
-    # Horizontally align and pad.
-    for i, line in enumerate(lines):
-        new_width = inner_dimensions[0] + len(line) - visible_width(line)
-        if 'right' in align:
-            lines[i] = line.rjust(padding[0] + new_width, space) + (space * padding[1])
-        elif 'center' in align:
-            lines[i] = (space * padding[0]) + line.center(new_width, space) + (space * padding[1])
-        else:
-            lines[i] = (space * padding[0]) + line.ljust(new_width + padding[1], space)
+        lines = (blank * padding[2]) + lines + (blank * (inner_dimensions[1] - len(lines) + padding[3]))
 
     return lines
 
 
-def max_dimensions(table_data, padding_left=0, padding_right=0, padding_top=0, padding_bottom=0):
+def max_dimensions(table_data, padding_left=0, padding_right=0, padding_top=0, padding_bottom=0, table_metrics=None):
     """Get maximum widths of each column and maximum height of each row.
 
     :param iter table_data: List of list of strings (unmodified table data).
@@ -89,6 +590,7 @@ def max_dimensions(table_data, padding_left=0, padding_right=0, padding_top=0, p
     :param int padding_right: Number of space chars on right side of cell.
     :param int padding_top: Number of empty lines on top side of cell.
     :param int padding_bottom: Number of empty lines on bottom side of cell.
+    :param iter table_metrics: Optional output of measure_table(table_data) to use instead of measuring table_data.
 
     :return: 4-item tuple of n-item lists. Inner column widths and row heights, outer column widths and row heights.
     :rtype: tuple
@@ -97,14 +599,13 @@ def max_dimensions(table_data, padding_left=0, padding_right=0, padding_top=0, p
     inner_heights = [0] * len(table_data)
 
     # Find max width and heights.
-    for j, row in enumerate(table_data):
+    if table_metrics is None:
+        table_metrics = ((measure_cell(c) for c in row) for row in table_data)
+    for j, row in enumerate(table_metrics):
         for i, cell in enumerate(row):
-            if not hasattr(cell, 'count') or not hasattr(cell, 'splitlines'):
-                cell = str(cell)
-            if not cell:
-                continue
-            inner_heights[j] = max(inner_heights[j], cell.count('\n') + 1)
-            inner_widths[i] = max(inner_widths[i], *[visible_width(l) for l in cell.splitlines()])
+            if cell.height:
+                inner_heights[j] = max(inner_heights[j], cell.height)
+                inner_widths[i] = max(inner_widths[i], cell.width)
 
     # Calculate with padding.
     outer_widths = [padding_left + i + padding_right for i in inner_widths]
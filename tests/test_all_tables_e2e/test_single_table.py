@@ -169,3 +169,20 @@ def test_multi_line():
         '\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x71\x6a\033(B'
     )
     assert actual == expected
+
+
+@pytest.mark.parametrize('padding', [0, 1])
+def test_coalesced(padding):
+    """Test that the charset is switched once per run of box-drawing characters, including empty columns.
+
+    :param int padding: Left and right padding.
+    """
+    table = SingleTable([['a', '', 'b'], []])
+    table.padding_left = table.padding_right = padding
+    assert table.horizontal_border('top', [padding * 2 + 1, padding * 2, padding * 2 + 1]) == (
+        '\033(0lqqqwqqwqqqk\033(B' if padding else '\033(0lqwwqk\033(B',
+    )
+    lines = table.table.splitlines()
+    assert not any('\033(B\033(0' in line for line in lines)
+    assert lines[1] == ('\033(0x\033(B a \033(0x\033(B  \033(0x\033(B b \033(0x\033(B' if padding else
+                        '\033(0x\033(Ba\033(0xx\033(Bb\033(0x\033(B')
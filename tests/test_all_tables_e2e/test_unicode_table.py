@@ -0,0 +1,68 @@
+# coding: utf-8
+"""UnicodeTable and UnicodeTableDouble end to end testing."""
+
+import pytest
+
+from terminaltables import AsciiTable
+from terminaltables.other_tables import UnicodeTable, UnicodeTableDouble, UnixTable
+from terminaltables.width_and_alignment import RE_ESCAPE_CODES
+
+TABLE_DATA = [
+    ['Name', 'Color', 'Type'],
+    ['Avocado', 'green', 'nut'],
+    ['Tomato', 'red', 'fruit'],
+    ['Lettuce', 'green', 'vegetable'],
+    ['Watermelon', 'green'],
+]
+
+
+def test_single():
+    """Test single-line borders."""
+    table = UnicodeTable(TABLE_DATA, 'Example')
+    table.inner_footing_row_border = True
+    table.justify_columns[2] = 'right'
+    expected = (
+        u'┌Example─────┬───────┬───────────┐\n'
+        u'│ Name       │ Color │      Type │\n'
+        u'├────────────┼───────┼───────────┤\n'
+        u'│ Avocado    │ green │       nut │\n'
+        u'│ Tomato     │ red   │     fruit │\n'
+        u'│ Lettuce    │ green │ vegetable │\n'
+        u'├────────────┼───────┼───────────┤\n'
+        u'│ Watermelon │ green │           │\n'
+        u'└────────────┴───────┴───────────┘'
+    )
+    assert table.table == expected
+
+
+def test_double():
+    """Test double-line borders with every row separated."""
+    table = UnicodeTableDouble(TABLE_DATA[:3])
+    table.inner_row_border = True
+    expected = (
+        u'╔═════════╦═══════╦═══════╗\n'
+        u'║ Name    ║ Color ║ Type  ║\n'
+        u'╠═════════╬═══════╬═══════╣\n'
+        u'║ Avocado ║ green ║ nut   ║\n'
+        u'╠═════════╬═══════╬═══════╣\n'
+        u'║ Tomato  ║ red   ║ fruit ║\n'
+        u'╚═════════╩═══════╩═══════╝'
+    )
+    assert table.table == expected
+
+
+@pytest.mark.parametrize('cls', [UnicodeTable, UnicodeTableDouble])
+def test_same_layout(cls):
+    """Test that every border character is one column wide and rows are smaller than UnixTable's.
+
+    :param cls: Table class.
+    """
+    table_data = [['Name', 'Color\nmulti-line'], ['Avocado', u'蓝色'], []]
+    table = cls(table_data, 'Title')
+    actual = table.table
+    assert '\033' not in actual
+    ascii_table = AsciiTable(table_data, 'Title').table
+    assert [len(line) for line in actual.splitlines()] == [len(line) for line in ascii_table.splitlines()]
+    unix = UnixTable(table_data, 'Title').table
+    assert RE_ESCAPE_CODES.sub('', unix).count('\n') == actual.count('\n')
+    assert len(actual.splitlines()[1].encode('utf-8')) < len(unix.splitlines()[1].encode('utf-8'))
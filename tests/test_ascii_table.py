@@ -3,6 +3,7 @@
 import pytest
 
 from terminaltables.other_tables import AsciiTable
+from terminaltables.width_and_alignment import CompactTableMetrics
 
 SINGLE_LINE = (
     ('Name', 'Color', 'Type'),
@@ -106,3 +107,44 @@ def test_table_width(table_data, expected):
     table = AsciiTable(table_data)
     actual = table.table_width
     assert actual == expected
+
+
+def test_prepare(monkeypatch):
+    """Test measuring once and answering everything from the prepared table.
+
+    :param monkeypatch: pytest fixture.
+    """
+    calls = list()
+    monkeypatch.setattr('terminaltables.base_table.CompactTableMetrics',
+                        lambda t, f: calls.append(t) or CompactTableMetrics(t, f))
+
+    table = AsciiTable([list(r) for r in SINGLE_LINE])
+    expected = table.table
+    assert len(calls) == 1
+
+    prepared = table.prepare()
+    assert prepared.ok is True
+    assert prepared.column_max_width(0) == 55
+    assert prepared.column_widths == [7, 5, 9]
+    assert prepared.table_width == 31
+    assert prepared.table == expected
+    assert len(calls) == 2
+
+    # Padding and borders are read live.
+    table.padding_left = 2
+    table.outer_border = False
+    assert prepared.table_width == 32
+    assert prepared.table == table.table
+    assert len(calls) == 3
+
+    # In-place changes need invalidate().
+    table.table_data[1][0] = 'Avocado Avocado'
+    assert prepared.column_widths == [7, 5, 9]
+    prepared.invalidate()
+    assert prepared.column_widths == [15, 5, 9]
+    assert len(calls) == 4
+
+    # New table data is detected.
+    table.table_data = [['a']]
+    assert prepared.column_widths == [1]
+    assert len(calls) == 5
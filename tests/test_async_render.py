@@ -0,0 +1,102 @@
+# coding: utf-8
+"""Test rendering with asyncio."""
+
+import sys
+
+import pytest
+
+from terminaltables import AsciiTable
+from terminaltables.table_data import TableData
+
+asyncio = pytest.importorskip('asyncio')  # Python 3.4+.
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 6), reason='Async generators require Python 3.6.')
+
+TABLE_DATA = [['Name', 'Color'], ['Avocado', u'蓝色'], ['Tomato', 'red\ngreen'], ['Lettuce'], ['', 'x']]
+
+
+class Writer(object):
+    """Like asyncio.StreamWriter."""
+
+    def __init__(self):
+        """Constructor."""
+        self.data = list()
+        self.drains = 0
+
+    def write(self, data):
+        """Buffer data.
+
+        :param bytes data: Data to write.
+        """
+        self.data.append(data)
+
+    def drain(self):
+        """Wait for the buffer to drain."""
+        self.drains += 1
+        return asyncio.sleep(0)
+
+
+def collect(async_iterator, loop):
+    """Read every item of an async iterator.
+
+    :param async_iterator: Async iterator.
+    :param loop: Event loop.
+
+    :return: Items.
+    :rtype: list
+    """
+    items, iterator = list(), async_iterator.__aiter__()
+    while True:
+        try:
+            items.append(loop.run_until_complete(iterator.__anext__()))
+        except StopAsyncIteration:  # pylint: disable=undefined-variable
+            return items
+
+
+@pytest.fixture
+def loop():
+    """New event loop."""
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 2, 5, 100])
+@pytest.mark.parametrize('table_data', [TABLE_DATA, TableData(TABLE_DATA), []])
+def test_arender(loop, chunk_rows, table_data):  # pylint: disable=redefined-outer-name
+    """Test that joined chunks equal the table property.
+
+    :param loop: Event loop.
+    :param int chunk_rows: Rows per chunk.
+    :param table_data: Table data.
+    """
+    table = AsciiTable(table_data, 'Title')
+    table.inner_footing_row_border = True
+    table.max_widths[1] = 3
+    chunks = collect(table.arender(chunk_rows), loop)
+    assert ''.join(chunks) == table.table
+    assert len(chunks) == max((len(table_data) + chunk_rows - 1) // chunk_rows, 1)
+
+
+def test_awrite(loop):  # pylint: disable=redefined-outer-name
+    """Test writing with backpressure while other tasks keep running."""
+    table = AsciiTable(TABLE_DATA * 20)
+    writer, ticks = Writer(), list()
+    future = asyncio.ensure_future(table.awrite(writer, chunk_rows=10), loop=loop)
+
+    def tick():
+        """Count event loop iterations until rendering finishes."""
+        ticks.append(1)
+        if not future.done():
+            loop.call_soon(tick)
+
+    loop.call_soon(tick)
+    assert loop.run_until_complete(future) == len(table.table)
+    assert b''.join(writer.data).decode('utf-8') == table.table
+    assert writer.drains == len(writer.data) == 10
+    assert len(ticks) >= 20  # The loop ran between measuring and rendering chunks.
+
+
+def test_bad_chunk_rows(loop):  # pylint: disable=redefined-outer-name
+    """Test invalid chunk size."""
+    with pytest.raises(ValueError):
+        collect(AsciiTable([['a']]).arender(0), loop)
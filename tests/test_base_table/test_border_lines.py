@@ -0,0 +1,57 @@
+"""Test method in BaseTable class."""
+
+from terminaltables import AsciiTable, GithubFlavoredMarkdownTable
+
+
+class CountingTable(AsciiTable):
+    """Count calls to horizontal_border()."""
+
+    calls = 0
+
+    def horizontal_border(self, style, outer_widths):
+        """Count calls.
+
+        :param str style: Type of border to return.
+        :param iter outer_widths: List of widths (with padding) for each column.
+        """
+        self.calls += 1
+        return super(CountingTable, self).horizontal_border(style, outer_widths)
+
+
+def test_built_once():
+    """Test that each border is built once per render and reused by later renders."""
+    table = CountingTable([['Row {0}'.format(i), 'x'] for i in range(100)])
+    table.inner_row_border = True
+    expected = AsciiTable(table.table_data)
+    expected.inner_row_border = True
+    assert table.table == expected.table
+    assert table.calls == 4  # Top, heading, row, bottom.
+    assert table.table == expected.table
+    assert table.calls == 4
+
+
+def test_changes():
+    """Test that layout changes build new borders."""
+    table = AsciiTable([['Name', 'Color'], ['Avocado', 'green']])
+    before = table.table
+    assert table.border_lines([9, 7]) is table.border_lines([9, 7])
+
+    table.title = 'Fruit'
+    assert table.table.startswith('+Fruit----+')
+    table.CHAR_OUTER_TOP_HORIZONTAL = '='
+    assert table.table.startswith('+Fruit====+')
+    table.inner_column_border = False
+    assert table.table.startswith('+Fruit===========+')
+    table.title, table.inner_column_border = None, True
+    del table.CHAR_OUTER_TOP_HORIZONTAL
+    assert table.table == before
+    table.table_data[1][0] = 'Watermelon'
+    assert table.table.startswith('+------------+')
+
+
+def test_github():
+    """Test that GitHub's justification markers follow justify_columns."""
+    table = GithubFlavoredMarkdownTable([['Name', 'Color'], ['Avocado', 'green']])
+    assert table.table.split('\n')[1] == '|---------|-------|'
+    table.justify_columns[1] = 'right'
+    assert table.table.split('\n')[1] == '|---------|------:|'
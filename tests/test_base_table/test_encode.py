@@ -0,0 +1,86 @@
+# coding: utf-8
+"""Test methods in BaseTable class."""
+
+import io
+
+import pytest
+
+from terminaltables import AsciiTable, DoubleTable, SingleTable
+from terminaltables.other_tables import UnicodeTable, UnixTable, WindowsTable
+
+TABLE_DATA = [
+    ['Name', 'Color', 'Type'],
+    ['Avocado', 'green', 'nut'],
+    ['Tomato', 'red\n蓝色', 'fruit'],
+    ['Lettuce', 'green', 'vegetable'],
+    ['Watermelon', 'green'],
+]
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, DoubleTable, SingleTable, UnicodeTable, UnixTable])
+@pytest.mark.parametrize('chunk_size', [1, 30, 65536])
+def test_same_as_table(cls, chunk_size):
+    """Test that encoded output is the table property encoded.
+
+    :param cls: Table class.
+    :param int chunk_size: Chunk size.
+    """
+    table = cls(TABLE_DATA)
+    table.title = 'Example'
+    expected = table.table.encode('utf-8')
+    assert table.encode() == expected
+
+    stream = io.BytesIO()
+    assert table.write_encoded(stream, chunk_size=chunk_size) == len(expected)
+    assert stream.getvalue() == expected
+
+
+def test_encoding():
+    """Test other encodings and error handlers."""
+    table = WindowsTable([['a', 'b'], ['c', 'd']])
+    assert table.encode('cp437') == table.table.encode('cp437')
+
+    table = AsciiTable(TABLE_DATA)
+    with pytest.raises(UnicodeEncodeError):
+        table.encode('ascii')
+    assert table.encode('ascii', 'replace') == table.table.encode('ascii', 'replace')
+
+
+def test_borders_encoded_once():
+    """Test each border is encoded once per render, even when repeated between every row."""
+    table = AsciiTable([['a', 'b']] * 5)
+    table.inner_row_border = True
+    lines = list(table.prepare().gen_encoded_lines())
+    separators = lines[4:-1:2]  # Row separators after the heading separator.
+    assert len(separators) == 3
+    assert all(s is separators[0] for s in separators)
+    assert lines[1] is not lines[3]
+    assert b'\n'.join(lines) == table.table.encode('utf-8')
+
+
+def test_row_range():
+    """Test encoding part of a prepared table."""
+    table = AsciiTable(TABLE_DATA)
+    prepared = table.prepare()
+    expected = [line.encode('utf-8') for line in prepared.gen_lines(row_range=(1, 3))]
+    assert list(prepared.gen_encoded_lines(row_range=(1, 3))) == expected
+
+
+def test_peak_memory():
+    """Test that writing bytes keeps about one batch in memory, not measurements of every cell."""
+    tracemalloc = pytest.importorskip('tracemalloc')
+    table = AsciiTable([[u'蓝色', 'Row {0}'.format(i), i, 'a\nb' if i % 3 else ''] for i in range(5000)])
+    size = len(table.encode())
+
+    class Sink(object):
+        """Binary file-like object that drops everything."""
+
+        write = staticmethod(len)
+
+    tracemalloc.start()
+    try:
+        assert table.write_encoded(Sink(), chunk_size=1024) == size
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < size // 2
@@ -0,0 +1,99 @@
+# coding: utf-8
+"""Test methods in BaseTable class."""
+
+import itertools
+import random
+
+import pytest
+from colorclass import Color
+
+from terminaltables import AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, PorcelainTable, SingleTable
+from terminaltables.base_table import BaseTable
+from terminaltables.other_tables import UnixTable
+
+CELLS = ['', 'a', 'Avocado', 'One\nTwo', 'Three\n\n', u'蓝色', Color('{red}Red{/red}'), 123, '\033[1mBold\033[0m']
+
+
+def random_table(rng, rows):
+    """Generate random table data with ragged rows.
+
+    :param random.Random rng: Random number generator.
+    :param int rows: Number of rows.
+
+    :return: Table data.
+    :rtype: list
+    """
+    return [[rng.choice(CELLS) for _ in range(rng.randint(0, 4))] for _ in range(rows)]
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, PorcelainTable, SingleTable,
+                                 UnixTable])
+@pytest.mark.parametrize('seed', range(5))
+def test_same_as_components(cls, seed):
+    """Test byte-identical output with both renderers and many settings.
+
+    :param cls: Table class.
+    :param int seed: Random seed.
+    """
+    rng = random.Random(seed)
+    table = cls(random_table(rng, rng.randint(0, 8)))
+    for flags in itertools.product([True, False], repeat=5):
+        table.outer_border, table.inner_column_border, table.inner_heading_row_border = flags[:3]
+        table.inner_footing_row_border, table.inner_row_border = flags[3:]
+        table.padding_left, table.padding_right = rng.randint(0, 2), rng.randint(0, 2)
+        table.justify_columns = {i: rng.choice(['left', 'right', 'center']) for i in range(4)}
+        if cls is not GithubFlavoredMarkdownTable:
+            table.title = rng.choice([None, 'Title', u'蓝色 Title'])
+
+        table.renderer = 'components'
+        expected = table.table
+        table.renderer = 'flat'
+        assert table.table == expected
+
+        # Raw table data.
+        dimensions = table.prepare()
+        dimensions = dimensions.inner_widths, dimensions.inner_heights, dimensions.outer_widths
+        expected = [''.join(line) for line in table.gen_table(*dimensions)]
+        assert list(table.gen_flat_lines(*dimensions)) == expected
+
+
+def test_use_flat_renderer():
+    """Test automatically choosing a renderer."""
+    class CustomRows(AsciiTable):
+        """Override component API."""
+
+        def gen_row_lines(self, row, style, inner_widths, height):
+            """Upper case all rows."""
+            for line in super(CustomRows, self).gen_row_lines(row, style, inner_widths, height):
+                yield [str(p).upper() for p in line]
+
+    assert AsciiTable([]).use_flat_renderer()
+    assert UnixTable([]).use_flat_renderer()
+    assert BaseTable([]).use_flat_renderer()
+
+    table = CustomRows([['a', 'b']])
+    assert not table.use_flat_renderer()
+    assert table.table == '+---+---+\n| A | B |\n+---+---+'
+    table.renderer = 'flat'
+    assert table.use_flat_renderer()
+    table.renderer = 'components'
+    assert not table.use_flat_renderer()
+    assert table.table == '+---+---+\n| A | B |\n+---+---+'
+
+
+def test_gen_row_lines_cells():
+    """Test overrides of gen_row_lines() get cells, not measurements, also when rows are fitted or streamed."""
+    class Upper(AsciiTable):
+        """Override changing cells before calling the base implementation."""
+
+        def gen_row_lines(self, row, style, inner_widths, height):
+            """Upper case all cells."""
+            return super(Upper, self).gen_row_lines([c.upper() for c in row], style, inner_widths, height)
+
+    table_data = [['Name', 'Color'], ['Avocado', 'green\nyellow'], ['Tomato', 'red']]
+    table = Upper(table_data)
+    expected = AsciiTable([[c.upper() for c in r] for r in table_data])
+    assert table.table == expected.table
+    assert list(table.stream(iter(table.table_data))) == list(expected.stream(iter(expected.table_data)))
+    table.max_widths[1] = expected.max_widths[1] = 3
+    assert table.table == expected.table
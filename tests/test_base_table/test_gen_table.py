@@ -2,6 +2,7 @@
 
 import pytest
 
+from terminaltables import AsciiTable
 from terminaltables.base_table import BaseTable
 from terminaltables.build import flatten
 from terminaltables.width_and_alignment import max_dimensions
@@ -223,3 +224,33 @@ def test_one_no_rows(mode, bare):
             )
 
     assert actual == expected
+
+
+def test_original_signature():
+    """Test overrides of gen_table() with the original three argument signature still work."""
+    class Legacy(AsciiTable):
+        """Override with the original signature, reading table_data."""
+
+        def gen_table(self, inner_widths, inner_heights, outer_widths):
+            """Upper case all lines."""
+            assert all(isinstance(c, str) for row in self.table_data for c in row)
+            for line in super(Legacy, self).gen_table(inner_widths, inner_heights, outer_widths):
+                yield [p.upper() for p in line]
+
+    table_data = [['Name', 'Color'], ['Avocado', 'green\nyellow'], ['Tomato', 'red'], ['Lettuce', 'green']]
+    table, expected = Legacy(table_data), AsciiTable(table_data)
+    for t in (table, expected):
+        t.inner_footing_row_border = True
+    assert table.legacy_gen_table()
+    assert table.table == expected.table.upper()
+    for row_range in ((0, 1), (1, 3), (2, 4), (0, 4)):
+        lines = list(table.prepare().gen_lines(row_range))
+        assert lines == [line.upper() for line in expected.prepare().gen_lines(row_range)]
+
+    # Rows fitted to max_widths or streamed are rebuilt as strings.
+    table.max_widths[1] = expected.max_widths[1] = 3
+    assert table.table == expected.table.upper()
+    assert list(table.stream(iter(table_data), prefix_rows=2)) == [
+        line.upper() for line in expected.stream(iter(table_data), prefix_rows=2)
+    ]
+    assert table.render_parallel(chunk_rows=2) == expected.table.upper()
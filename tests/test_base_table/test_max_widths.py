@@ -0,0 +1,115 @@
+# coding: utf-8
+"""Test max_widths and overflow_columns."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from terminaltables.base_table import BaseTable
+from terminaltables.table_data import TableData
+
+TABLE_DATA = [
+    ['Name', 'Description'],
+    ['Avocado', u'A green 蓝色 fruit, also called alligator pear'],
+    ['Tomato', '\033[31mred\033[39m and round'],
+]
+
+
+@pytest.mark.parametrize('overflow,expected', [
+    (None, [
+        '+---------+------------+',
+        '| Name    | Descriptio |',
+        '|         | n          |',
+        '+---------+------------+',
+        u'| Avocado | A green    |',
+        u'|         | 蓝色       |',
+        u'|         | fruit,     |',
+        u'|         | also       |',
+        u'|         | called     |',
+        u'|         | alligator  |',
+        u'|         | pear       |',
+        '| Tomato  | \033[31mred\033[39m and    |',
+        '|         | round      |',
+        '+---------+------------+',
+    ]),
+    ('truncate', [
+        '+---------+------------+',
+        '| Name    | Descriptio |',
+        '+---------+------------+',
+        u'| Avocado | A green 蓝 |',
+        '| Tomato  | \033[31mred\033[39m and ro |',
+        '+---------+------------+',
+    ]),
+    ('ellipsis', [
+        '+---------+------------+',
+        '| Name    | Descrip... |',
+        '+---------+------------+',
+        u'| Avocado | A green... |',
+        '| Tomato  | \033[31mred\033[39m and... |',
+        '+---------+------------+',
+    ]),
+])
+def test_overflow(overflow, expected):
+    """Test each overflow mode with plain lists and TableData.
+
+    :param str overflow: Value for overflow_columns or None for the default.
+    :param list expected: Expected lines.
+    """
+    table = BaseTable(TABLE_DATA)
+    table.max_widths[1] = 10
+    if overflow:
+        table.overflow_columns[1] = overflow
+    assert table.table.splitlines() == expected
+
+    table.table_data = TableData(TABLE_DATA)
+    assert table.table.splitlines() == expected
+
+    with ThreadPoolExecutor(2) as executor:
+        assert table.render_parallel(executor, 1).splitlines() == expected
+
+    assert list(table.stream(TABLE_DATA)) == expected
+
+
+def test_changes_detected():
+    """Test that changing max_widths or overflow_columns re-measures a prepared table."""
+    table = BaseTable([['Avocado', 'green']])
+    prepared = table.prepare()
+    assert prepared.inner_widths == [7, 5]
+
+    table.max_widths[0] = 4
+    assert prepared.inner_widths == [4, 5]
+    assert prepared.inner_heights == [2]
+
+    table.overflow_columns[0] = 'ellipsis'
+    assert prepared.inner_widths == [4, 5]
+    assert prepared.inner_heights == [1]
+    assert prepared.table_metrics[0][0].lines == ['A...']
+
+    del table.max_widths[0]
+    assert prepared.inner_widths == [7, 5]
+
+
+def test_bad_overflow():
+    """Test unknown overflow modes."""
+    table = BaseTable([['Avocado']])
+    table.max_widths[0] = 3
+    table.overflow_columns[0] = 'hide'
+    with pytest.raises(ValueError):
+        table.table  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize('renderer', ['flat', 'components'])
+def test_wrap_colors(renderer):
+    """Test colors of wrapped lines don't leak into padding and borders, and continue on the next line.
+
+    :param str renderer: Renderer to use.
+    """
+    table = BaseTable([['\033[31mhello world\033[0m', 'x']])
+    table.renderer = renderer
+    table.max_widths[0] = 5
+    assert table.table.splitlines() == [
+        '+-------+---+',
+        '| \033[31mhello\033[0m | x |',
+        '| \033[31mworld\033[0m |   |',
+        '+-------+---+',
+    ]
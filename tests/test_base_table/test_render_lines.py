@@ -0,0 +1,63 @@
+# coding: utf-8
+"""Test methods in PreparedTable class."""
+
+import itertools
+
+import pytest
+
+from terminaltables import AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, TableData
+from terminaltables.other_tables import UnixTable
+
+TABLE_DATA = [
+    ['Name', 'Color', 'Type'],
+    ['Avocado', 'green', 'nut'],
+    ['Tomato', 'red\n蓝色', 'fruit'],
+    ['', '', ''],
+    ['Lettuce', 'green', 'vegetable\n\n'],
+    ['Watermelon', 'green'],
+]
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, UnixTable])
+@pytest.mark.parametrize('rows', [0, 1, 2, 6])
+@pytest.mark.parametrize('flags', list(itertools.product([True, False], repeat=4)))
+def test_same_as_table(cls, rows, flags):
+    """Test every slice against slicing the whole table.
+
+    :param cls: Table class.
+    :param int rows: Number of rows to use.
+    :param tuple flags: Outer, heading, footing, and row borders.
+    """
+    table = cls(TABLE_DATA[:rows])
+    table.outer_border, table.inner_heading_row_border, table.inner_footing_row_border, table.inner_row_border = flags
+    expected = table.table.split('\n') if table.table else []
+    prepared = table.prepare()
+    assert prepared.line_index()[1] == len(expected)
+
+    for start in range(-2, len(expected) + 2):
+        for stop in list(range(-2, len(expected) + 2)) + [None]:
+            assert prepared.render_lines(start, stop) == expected[start:stop]
+
+
+def test_row_at_line():
+    """Test mapping lines back to rows."""
+    table = AsciiTable(TABLE_DATA)
+    table.inner_footing_row_border = True
+    prepared = table.prepare()
+    assert prepared.line_index() == ([1, 2, 4, 6, 7, 10, 12], 13)
+    expected = [None, 0, 1, 1, 2, 2, 3, 4, 4, 4, 5, 5, None]  # Borders before a row belong to it.
+    assert [prepared.row_at_line(i) for i in range(13)] == expected
+    with pytest.raises(IndexError):
+        prepared.row_at_line(13)
+
+
+def test_changes():
+    """Test that the index is rebuilt when data or border settings change."""
+    table = AsciiTable(TableData(TABLE_DATA[:2]))
+    prepared = table.prepare()
+    assert prepared.render_lines(-2) == ['| Avocado | green | nut  |', '+---------+-------+------+']
+
+    table.inner_row_border = True
+    table.table_data.append(['Lettuce', 'green', 'vegetable'])
+    assert prepared.line_index() == ([1, 2, 4, 6], 7)
+    assert prepared.render_lines(4, 6) == ['+---------+-------+-----------+', '| Lettuce | green | vegetable |']
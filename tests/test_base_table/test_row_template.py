@@ -0,0 +1,93 @@
+# coding: utf-8
+"""Test method in BaseTable class."""
+
+import itertools
+
+import pytest
+from colorclass import Color
+
+from terminaltables.base_table import BaseTable
+from terminaltables.width_and_alignment import max_dimensions, measure_cell
+
+CELLS = ['', 'a', 'Avocado', 'Watermelon', 123]
+
+
+@pytest.mark.parametrize('style', ['heading', 'footing', 'row'])
+@pytest.mark.parametrize('outer_border,inner_column_border', list(itertools.product([True, False], repeat=2)))
+@pytest.mark.parametrize('padding', [(0, 0), (1, 1), (2, 0)])
+def test_same_as_gen_row_lines(style, outer_border, inner_column_border, padding):
+    """Test that compiled templates give the same output as gen_row_lines().
+
+    :param str style: Type of border characters to use.
+    :param bool outer_border: Show outer borders.
+    :param bool inner_column_border: Show column dividers.
+    :param tuple padding: Left and right padding.
+    """
+    table = BaseTable(None)
+    table.outer_border, table.inner_column_border = outer_border, inner_column_border
+    table.padding_left, table.padding_right = padding
+    table.justify_columns = {1: 'right', 2: 'center'}
+    inner_widths = [10, 10, 11, 12]
+    template = table.row_template(style, inner_widths)
+
+    for row in itertools.product(CELLS, repeat=3):
+        metrics = [measure_cell(c) for c in row]
+        expected = [''.join(line) for line in table.gen_row_lines(metrics, style, inner_widths, 1)]
+        assert [template(metrics)] == expected
+
+
+@pytest.mark.parametrize('cell', ['One\nTwo', u'蓝色', '\033[31mRed\033[39m', 'Watermelon!'])
+def test_not_simple(cell):
+    """Test rows that need the general path.
+
+    :param cell: Cell that isn't simple.
+    """
+    template = BaseTable(None).row_template('row', [10, 10])
+    assert template([measure_cell('a'), measure_cell(cell)]) is None
+    assert template([measure_cell('a')] * 3) is None  # More cells than columns.
+
+
+def test_color():
+    """Test colorclass cells, which are simple since their length excludes escape codes."""
+    table = BaseTable(None)
+    table.justify_columns = {0: 'center'}
+    row = [measure_cell(Color('{red}Red{/red}')), measure_cell('x')]
+    expected = ''.join(next(table.gen_row_lines(row, 'row', [6, 2], 1)))
+    assert table.row_template('row', [6, 2])(row) == expected
+
+
+def test_gen_table():
+    """Test that tables mixing simple and multi-line rows render the same with and without table_metrics."""
+    table_data = [['Name', 'Color'], ['Avocado', u'蓝色'], ['Tomato', 'red\ngreen'], ['', 'x'], ['Lettuce']]
+    table = BaseTable(table_data)
+    table.justify_columns[1] = 'right'
+    inner_widths, inner_heights, outer_widths = max_dimensions(table_data, 1, 1)[:3]
+    expected = [''.join(line) for line in table.gen_table(inner_widths, inner_heights, outer_widths)]
+    table_metrics = [[measure_cell(c) for c in row] for row in table_data]
+    lines = table.gen_table(inner_widths, inner_heights, outer_widths, table_metrics)
+    actual = [(''.join(line), line) for line in lines]
+    assert [line for line, _ in actual] == expected
+    assert [line for line, parts in actual if line[0] == '|' and isinstance(parts, tuple) and len(parts) == 1] == [
+        '| Name    | Color |',
+        '|         |     x |',
+        '| Lettuce |       |',
+    ]  # Simple rows are yielded in one piece.
+
+
+@pytest.mark.parametrize('table_data,expected', [
+    ([[]], '++\n||\n++'),
+    ([[], []], '++\n||\n++\n||\n++'),
+])
+@pytest.mark.parametrize('renderer', ['flat', 'components'])
+def test_no_columns(table_data, expected, renderer):
+    """Test rows without cells aren't padded, they're as wide as the borders.
+
+    :param list table_data: Rows without cells.
+    :param str expected: Expected output.
+    :param str renderer: Renderer to use.
+    """
+    table = BaseTable(table_data)
+    table.padding_left = table.padding_right = 2
+    assert table.row_template('row', [])([]) == '||'
+    table.renderer = renderer
+    assert table.table == expected
@@ -0,0 +1,198 @@
+# coding: utf-8
+"""Test method in BaseTable class."""
+
+import pytest
+
+from terminaltables import AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, PorcelainTable, SingleTable
+from terminaltables.other_tables import UnixTable
+
+TABLE_DATA = [
+    ['Name', 'Color', 'Type'],
+    ['Avocado', 'green', 'nut'],
+    ['Tomato', 'red\n蓝色', 'fruit'],
+    ['Lettuce', 'green', 'vegetable'],
+    ['Watermelon', 'green'],
+]
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, PorcelainTable, SingleTable,
+                                 UnixTable])
+@pytest.mark.parametrize('rows', [0, 1, 2, 3, 5])
+@pytest.mark.parametrize('flags', [(True, True, True), (False, True, False), (True, False, True), (False,) * 3])
+def test_same_as_table(cls, rows, flags):
+    """Test that streaming a generator gives the same output as the table property.
+
+    :param cls: Table class.
+    :param int rows: Number of rows to use.
+    :param tuple flags: Heading, footing, and row borders.
+    """
+    table = cls(TABLE_DATA[:rows])
+    table.inner_heading_row_border, table.inner_footing_row_border, table.inner_row_border = flags
+    expected = table.table
+
+    generator = (row for row in TABLE_DATA[:rows])
+    assert '\n'.join(table.stream(generator)) == expected
+
+
+def test_widths():
+    """Test fixed widths and widths measured from a prefix."""
+    table = AsciiTable(None)
+    actual = list(table.stream(iter(TABLE_DATA[:2]), inner_widths=[8, 5, 3]))
+    assert actual == [
+        '+----------+-------+-----+',
+        '| Name     | Color | Type|',  # Wider than the fixed width.
+        '+----------+-------+-----+',
+        '| Avocado  | green | nut |',
+        '+----------+-------+-----+',
+    ]
+
+    table.outer_border = False
+    actual = list(table.stream(iter(TABLE_DATA), prefix_rows=2))
+    assert actual[:3] == [
+        ' Name    | Color | Type ',
+        '---------+-------+------',
+        ' Avocado | green | nut  ',
+    ]
+    assert actual[-1] == ' Watermelon| green |      '  # Wider than the prefix.
+
+
+def test_lazy():
+    """Test that lines are yielded before all rows are read."""
+    consumed = list()
+
+    def rows():
+        """Yield rows and record how many were read."""
+        for row in TABLE_DATA:
+            consumed.append(row)
+            yield row
+
+    lines = AsciiTable(None).stream(rows(), inner_widths=[10, 5, 9])
+    assert next(lines).startswith('+---')
+    assert next(lines).startswith('| Name ')
+    assert len(consumed) == 2  # One row of lookahead.
+
+
+@pytest.mark.parametrize('overflow,expected', [
+    ('truncate', [
+        '| Avocado | green | nut  |',
+        '| Tomato  | red   | frui |',
+        '|         | 蓝色  |      |',
+        '| Lettuce | green | vege |',
+    ]),
+    ('ellipsis', [
+        '| Avocado | green | nut  |',
+        '| Tomato  | red   | f... |',
+        '|         | 蓝色  |      |',
+        '| Lettuce | green | v... |',
+    ]),
+    ('wrap', [
+        '| Avocado | green | nut  |',
+        '| Tomato  | red   | frui |',
+        '|         | 蓝色  | t    |',
+        '| Lettuce | green | vege |',
+        '|         |       | tabl |',
+        '|         |       | e    |',
+    ]),
+])
+def test_overflow(overflow, expected):
+    """Test truncating (with or without an ellipsis) and wrapping cells wider than the fixed widths.
+
+    :param str overflow: Overflow policy.
+    :param list expected: Expected body lines.
+    """
+    table = AsciiTable(None)
+    actual = list(table.stream(iter(TABLE_DATA[:4]), inner_widths=[7, 5, 4], overflow=overflow))
+    assert actual[0] == '+---------+-------+------+'
+    assert actual[1] == '| Name    | Color | Type |'
+    assert actual[3:-1] == expected
+
+
+@pytest.mark.parametrize('overflow', [None, 'truncate', 'ellipsis', 'wrap'])
+@pytest.mark.parametrize('renderer', ['flat', 'components'])
+def test_extra_columns(overflow, renderer):
+    """Test rows with more columns than the estimate are printed as they are, not dropped.
+
+    :param str overflow: Overflow policy.
+    :param str renderer: Renderer to use.
+    """
+    table = AsciiTable(None)
+    table.renderer = renderer
+    rows = [['a', 'b'], ['c', 'd'], ['e', 'f', 'g\nhh'], ['i', 'j', 'k']]
+    assert list(table.stream(iter(rows), prefix_rows=2, overflow=overflow)) == [
+        '+---+---+',
+        '| a | b |',
+        '+---+---+',
+        '| c | d |',
+        '| e | f | g  |',
+        '|   |   | hh |',
+        '| i | j | k |',
+        '+---+---+',
+    ]
+
+
+def test_expand():
+    """Test starting a new table with wider columns and the heading repeated."""
+    table = AsciiTable(None)
+    table.inner_footing_row_border = True
+    actual = list(table.stream(iter(TABLE_DATA), prefix_rows=2, overflow='expand'))
+    assert actual == [
+        '+---------+-------+------+',
+        '| Name    | Color | Type |',
+        '+---------+-------+------+',
+        '| Avocado | green | nut  |',  # Not a footer, the table was ended early.
+        '+---------+-------+------+',
+        '+---------+-------+-------+',
+        '| Name    | Color | Type  |',
+        '+---------+-------+-------+',
+        '| Tomato  | red   | fruit |',
+        '|         | 蓝色  |       |',
+        '+---------+-------+-------+',
+        '+---------+-------+-----------+',
+        '| Name    | Color | Type      |',
+        '+---------+-------+-----------+',
+        '| Lettuce | green | vegetable |',
+        '+---------+-------+-----------+',
+        '+------------+-------+-----------+',
+        '| Name       | Color | Type      |',
+        '+------------+-------+-----------+',
+        '| Watermelon | green |           |',
+        '+------------+-------+-----------+',
+    ]
+
+    # Expanding a UnixTable still merges escape sequences.
+    actual = '\n'.join(UnixTable(None).stream(iter(TABLE_DATA), prefix_rows=2, overflow='expand'))
+    assert '\033(B\033(0' not in actual
+    assert actual.count('Name') == 4
+
+
+def test_expand_fits():
+    """Test that nothing is repeated when every row fits, and that the first row widens fixed widths."""
+    table = AsciiTable(TABLE_DATA)
+    actual = list(table.stream(iter(TABLE_DATA), inner_widths=[10, 5, 9], overflow='expand'))
+    assert '\n'.join(actual) == table.table
+    actual = list(table.stream(iter(TABLE_DATA[:1]), inner_widths=[1, 1, 1], overflow='expand'))
+    assert '\n'.join(actual) == AsciiTable(TABLE_DATA[:1]).table
+    assert list(table.stream(iter([]), overflow='expand')) == list(table.stream([]))
+
+
+def test_sample_random():
+    """Test estimating widths from random rows of a sequence."""
+    rows = TABLE_DATA[:1] + [['Avocado', 'green', 'nut']] * 50 + [['Watermelon', 'green', 'melon']]
+    table = AsciiTable(rows)
+    assert '\n'.join(table.stream(rows, prefix_rows=len(rows), sample='random')) == table.table
+    actual = list(table.stream(rows, prefix_rows=5, sample='random', overflow='ellipsis'))
+    assert actual[1] == '| Name    | Color | Type |'
+    assert actual[-2] == '| Wate... | green | m... |'
+    assert list(table.stream([], sample='random')) == list(table.stream([]))
+
+
+def test_bad_overflow():
+    """Test unknown overflow policy."""
+    with pytest.raises(ValueError):
+        list(AsciiTable(None).stream([], overflow='hide'))
+
+
+def test_bad_sample():
+    """Test unknown sample mode."""
+    with pytest.raises(ValueError):
+        list(AsciiTable(None).stream([], sample='tail'))
@@ -0,0 +1,99 @@
+# coding: utf-8
+"""Test method in BaseTable class."""
+
+import io
+
+import pytest
+
+from terminaltables import AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, PorcelainTable, SingleTable
+from terminaltables.other_tables import UnixTable
+from terminaltables.table_data import TableData
+
+TABLE_DATA = [
+    ['Name', 'Color', 'Type'],
+    ['Avocado', 'green', 'nut'],
+    ['Tomato', 'red\n蓝色', 'fruit'],
+    ['Lettuce', 'green', 'vegetable'],
+    ['Watermelon', 'green'],
+]
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, DoubleTable, GithubFlavoredMarkdownTable, PorcelainTable, SingleTable,
+                                 UnixTable])
+@pytest.mark.parametrize('chunk_size', [1, 30, 65536])
+def test_same_as_table(cls, chunk_size):
+    """Test that writing to a stream gives the same output as the table property.
+
+    :param cls: Table class.
+    :param int chunk_size: Chunk size.
+    """
+    table = cls(TABLE_DATA)
+    table.title = 'Example'
+    stream = io.StringIO()
+    assert table.write(stream, chunk_size) == len(table.table)
+    assert stream.getvalue() == table.table
+    assert '\033(B\033(0' not in stream.getvalue()
+
+
+def test_prepared():
+    """Test writing a prepared table with bounded chunks."""
+    table = AsciiTable([['Row {0}'.format(i), 'x' * 20] for i in range(200)])
+    chunks = list()
+
+    class Recorder(object):
+        """File-like object that keeps every write separately."""
+
+        write = staticmethod(chunks.append)
+
+    table.prepare().write(Recorder(), 512)
+    assert ''.join(chunks) == table.table
+    assert len(chunks) > 10
+    assert max(len(c) for c in chunks) < 512 + 40
+
+
+def test_empty_lines():
+    """Test a table whose lines are all empty."""
+    table = AsciiTable([[''], [''], ['']])
+    table.outer_border = table.inner_heading_row_border = False
+    table.padding_left = table.padding_right = 0
+    stream = io.StringIO()
+    assert table.write(stream) == 2
+    assert stream.getvalue() == table.table == '\n\n'
+
+
+@pytest.mark.parametrize('table_data', [list, TableData])
+@pytest.mark.parametrize('max_widths', [{}, {0: 4, 1: 2}])
+def test_measure_widths(table_data, max_widths):
+    """Test writing without preparing the table, with table data types and max_widths.
+
+    :param table_data: Type of table data.
+    :param dict max_widths: Maximum widths.
+    """
+    table = AsciiTable(table_data(TABLE_DATA))
+    table.max_widths = max_widths
+    inner_widths, inner_heights = table.measure_widths()[:2]
+    assert inner_widths == table.prepare().inner_widths
+    assert inner_heights == (None if table_data is list or max_widths else table.prepare().inner_heights)
+    stream = io.StringIO()
+    table.write(stream)
+    assert stream.getvalue() == table.table
+
+
+def test_peak_memory():
+    """Test that writing keeps about one chunk in memory, not measurements of every cell."""
+    tracemalloc = pytest.importorskip('tracemalloc')
+    table = AsciiTable([[u'蓝色', 'Row {0}'.format(i), i, 'a\nb' if i % 3 else ''] for i in range(5000)])
+    size = len(table.table)
+
+    class Sink(object):
+        """File-like object that drops everything."""
+
+        write = staticmethod(len)
+
+    tracemalloc.start()
+    try:
+        assert table.write(Sink(), 1024) == size
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < size // 2
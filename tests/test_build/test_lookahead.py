@@ -0,0 +1,21 @@
+"""Test function in module."""
+
+import pytest
+
+from terminaltables.build import lookahead
+
+
+@pytest.mark.parametrize('iterable,expected', [
+    ([], []),
+    ([1], [(1, True)]),
+    ([1, 2, 3], [(1, False), (2, False), (3, True)]),
+    (iter([None, None]), [(None, False), (None, True)]),
+    ((i for i in range(2)), [(0, False), (1, True)]),
+])
+def test(iterable, expected):
+    """Test function.
+
+    :param iter iterable: Input.
+    :param list expected: Expected output.
+    """
+    assert list(lookahead(iterable)) == expected
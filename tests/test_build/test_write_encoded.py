@@ -0,0 +1,149 @@
+# coding: utf-8
+"""Test functions in module."""
+
+import io
+import os
+import socket
+import threading
+
+import pytest
+
+from terminaltables import build
+from terminaltables.build import send_all, write_encoded
+
+
+class Recorder(object):
+    """Binary file-like object that keeps every write separately."""
+
+    def __init__(self):
+        """Constructor."""
+        self.chunks = list()
+
+    def write(self, data):
+        """Record data.
+
+        :param bytes data: Written data.
+        """
+        self.chunks.append(data)
+
+
+def read_all(read):
+    """Read until end of file in a thread, so writers don't block on a full pipe or socket buffer.
+
+    :param read: Function reading up to n bytes.
+
+    :return: Thread and list the data is appended to when done.
+    :rtype: tuple
+    """
+    result = list()
+    thread = threading.Thread(target=lambda: result.append(b''.join(iter(lambda: read(65536), b''))))
+    thread.start()
+    return thread, result
+
+
+@pytest.mark.parametrize('lines', [
+    [],
+    [b''],
+    [b'', b''],
+    [b'one'],
+    [b'one', b'', b'three'],
+    [b'+-----+', b'| abc |', b'+-----+'],
+])
+@pytest.mark.parametrize('chunk_size', [0, 1, 4, 65536])
+def test(lines, chunk_size):
+    """Test output matches joined lines for any chunk size.
+
+    :param list lines: Input.
+    :param int chunk_size: Chunk size.
+    """
+    stream = Recorder()
+    written = write_encoded(iter(lines), stream, chunk_size)
+    assert b''.join(stream.chunks) == b'\n'.join(lines)
+    assert written == len(b'\n'.join(lines))
+
+
+def test_chunks(monkeypatch):
+    """Test batches are bounded by chunk_size and IOV_MAX.
+
+    :param monkeypatch: pytest fixture.
+    """
+    stream = Recorder()
+    write_encoded((b'x' * 10 for _ in range(100)), stream, 50)
+    assert len(stream.chunks) == 20
+    assert all(len(c) <= 50 + 10 for c in stream.chunks)
+
+    monkeypatch.setattr(build, 'IOV_MAX', 16)
+    stream = Recorder()
+    write_encoded((b'x' for _ in range(100)), stream, 65536)
+    assert b''.join(stream.chunks) == b'\n'.join([b'x'] * 100)
+    assert len(stream.chunks) == 13  # 8 lines (15 or 16 buffers) per batch.
+
+
+def test_send_all():
+    """Test partial writes are resumed where they stopped, including in the middle of a buffer."""
+    received = list()
+
+    def send(buffers):
+        data = b''.join(bytes(b) for b in buffers)[:3]
+        received.append(data)
+        return len(data)
+
+    send_all(send, [b'ab', b'\n', b'cdefg', b'', b'\n', b'h'])
+    assert b''.join(received) == b'ab\ncdefg\nh'
+    assert received[1] == b'cde'
+
+
+@pytest.mark.skipif(not hasattr(os, 'pipe'), reason='Requires pipes.')
+def test_fd():
+    """Test writing to a file descriptor, more than a pipe buffer to exercise partial writes."""
+    lines = [u'{0} 世界'.format(i).encode('utf-8') for i in range(50000)]
+    read_fd, write_fd = os.pipe()
+    thread, result = read_all(lambda n: os.read(read_fd, n))
+    try:
+        written = write_encoded(iter(lines), write_fd, 4096)
+    finally:
+        os.close(write_fd)
+        thread.join()
+        os.close(read_fd)
+    assert result == [b'\n'.join(lines)]
+    assert written == len(result[0])
+
+
+@pytest.mark.skipif(not hasattr(socket, 'socketpair') or not hasattr(socket.socket, 'sendmsg'),
+                    reason='Requires socketpair() and sendmsg().')
+def test_socket():
+    """Test sending to a socket."""
+    lines = [b'| row %d |' % i for i in range(20000)]
+    sender, receiver = socket.socketpair()
+    thread, result = read_all(receiver.recv)
+    try:
+        written = write_encoded(iter(lines), sender)
+        sender.shutdown(socket.SHUT_WR)
+    finally:
+        thread.join()
+        sender.close()
+        receiver.close()
+    assert result == [b'\n'.join(lines)]
+    assert written == len(result[0])
+
+
+def test_sendall():
+    """Test sending to a socket without sendmsg() (Windows)."""
+    sent = list()
+
+    class Socket(object):
+        """Socket-like object with sendall() only."""
+
+        sendall = staticmethod(sent.append)
+
+    lines = [b'| row %d |' % i for i in range(2000)]
+    assert write_encoded(iter(lines), Socket(), 4096) == len(b'\n'.join(lines))
+    assert b''.join(sent) == b'\n'.join(lines)
+    assert len(sent) > 1
+
+
+def test_bytes_io():
+    """Test writing to a binary file object."""
+    stream = io.BytesIO()
+    assert write_encoded([u'世界'.encode('utf-8'), b'abc'], stream, 2) == 10
+    assert stream.getvalue() == u'世界\nabc'.encode('utf-8')
@@ -0,0 +1,69 @@
+"""Test function in module."""
+
+import io
+import os
+
+import pytest
+
+from terminaltables.build import flatten, write_lines
+
+
+class Recorder(object):
+    """File-like object that keeps every write separately."""
+
+    def __init__(self):
+        """Constructor."""
+        self.chunks = list()
+
+    def write(self, data):
+        """Record data.
+
+        :param str data: Written data.
+        """
+        self.chunks.append(data)
+
+
+@pytest.mark.parametrize('lines', [
+    [],
+    [''],
+    ['', ''],
+    ['', '', ''],
+    ['one'],
+    ['one', '', 'three'],
+    ['+-----+', '| abc |', '+-----+'],
+])
+@pytest.mark.parametrize('chunk_size', [0, 1, 4, 65536])
+def test(lines, chunk_size):
+    """Test output matches flatten() for any chunk size.
+
+    :param list lines: Input.
+    :param int chunk_size: Chunk size.
+    """
+    stream = Recorder()
+    written = write_lines(iter(lines), stream, chunk_size)
+    expected = flatten([[line] for line in lines])
+    assert ''.join(stream.chunks) == expected
+    assert written == len(expected)
+
+
+def test_chunks():
+    """Test lines are buffered into chunks of about chunk_size."""
+    stream = Recorder()
+    write_lines(('x' * 10 for _ in range(100)), stream, 50)
+    assert len(stream.chunks) == 20
+    assert all(len(c) <= 50 + 10 for c in stream.chunks)
+
+
+def test_fd(tmpdir):
+    """Test writing to a file descriptor.
+
+    :param tmpdir: pytest fixture.
+    """
+    path = str(tmpdir.join('out.txt'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+    try:
+        assert write_lines([u'世界', u'abc'], fd, 2) == 6
+    finally:
+        os.close(fd)
+    with io.open(path, encoding='utf-8') as handle:
+        assert handle.read() == u'世界\nabc'
@@ -0,0 +1,102 @@
+# coding: utf-8
+"""Test ColumnData class."""
+
+from array import array
+from collections import OrderedDict
+
+import pytest
+
+from terminaltables import AsciiTable, ColumnData, SingleTable
+from terminaltables.table_data import ColumnRow, measure_column
+from terminaltables.width_and_alignment import max_dimensions, measure_cell
+
+NAMES = ['Avocado', 'Tomato', 'Lettuce\n蓝色', '']
+COUNTS = array('i', [3, -120, 7, 0])
+PRICES = array('d', [1.5, 0.25, 10.0, float('inf')])
+
+
+def rows_of(columns, heading=None):
+    """Transpose columns into a list of lists.
+
+    :param list columns: Columns.
+    :param list heading: Optional first row.
+
+    :return: Rows.
+    :rtype: list
+    """
+    rows = [list(r) for r in zip(*columns)]
+    return [list(heading)] + rows if heading is not None else rows
+
+
+def test_dimensions():
+    """Test widths and heights match measuring the transposed rows."""
+    table_data = ColumnData(OrderedDict([('Name', NAMES), ('Count', COUNTS), ('Price', PRICES)]))
+    plain = rows_of([NAMES, COUNTS, PRICES], ['Name', 'Count', 'Price'])
+    assert [list(r) for r in table_data] == plain
+    inner_widths, inner_heights = max_dimensions(plain)[:2]
+    assert table_data.inner_widths == inner_widths == [7, 5, 5]
+    assert table_data.inner_heights == inner_heights == [1, 1, 1, 2, 1]
+    assert [list(r) for r in table_data.table_metrics] == [[measure_cell(c) for c in r] for r in plain]
+
+
+def test_measure_column():
+    """Test numeric arrays are measured like any other column."""
+    for column in (COUNTS, PRICES, array('B', [255, 0]), NAMES):
+        assert measure_column(column) == [measure_cell(c) for c in column]
+
+
+def test_sequence():
+    """Test indexing rows and cells."""
+    table_data = ColumnData([NAMES, COUNTS], heading=['Name', 'Count'])
+    assert len(table_data) == 5
+    assert table_data[0] == ['Name', 'Count']
+    assert isinstance(table_data[1], ColumnRow)
+    assert list(table_data[1]) == ['Avocado', 3]
+    assert list(table_data[-1]) == ['', 0]
+    assert table_data[2][1] == -120
+    assert table_data[2][-1:] == [-120]
+    assert [list(r) for r in table_data[3:]] == [['Lettuce\n蓝色', 7], ['', 0]]
+    with pytest.raises(IndexError):
+        table_data[5]  # pylint: disable=pointless-statement
+
+    assert len(ColumnData([NAMES, COUNTS])) == 4
+    assert len(ColumnData([])) == 0
+    assert ColumnData([]).inner_widths == []
+
+
+def test_errors():
+    """Test columns of different lengths and wrong headings."""
+    with pytest.raises(ValueError):
+        ColumnData([NAMES, [1, 2]])
+    with pytest.raises(ValueError):
+        ColumnData([NAMES, COUNTS], heading=['Name'])
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, SingleTable])
+def test_same_as_rows(cls):
+    """Test rendering is identical to the transposed table data.
+
+    :param cls: Table class.
+    """
+    heading = ['Name', 'Count', 'Price']
+    expected = cls(rows_of([NAMES, COUNTS, PRICES], heading))
+    table = cls(ColumnData([NAMES, COUNTS, PRICES], heading))
+    for t in (expected, table):
+        t.inner_footing_row_border = True
+        t.justify_columns[1] = 'right'
+    assert table.table == expected.table
+    assert table.prepare().render_lines(2, 5) == expected.prepare().render_lines(2, 5)
+
+    # Fitted to max widths.
+    table.max_widths[0] = expected.max_widths[0] = 4
+    assert table.table == expected.table
+
+
+def test_parallel():
+    """Test rendering in parallel threads."""
+    pytest.importorskip('concurrent.futures')
+    from concurrent.futures import ThreadPoolExecutor
+    values = array('q', range(-500, 500))
+    table = AsciiTable(ColumnData(OrderedDict([('Value', values), ('Label', [str(v) * 2 for v in values])])))
+    with ThreadPoolExecutor(2) as executor:
+        assert table.render_parallel(executor, chunk_rows=64) == table.table
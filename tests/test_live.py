@@ -0,0 +1,143 @@
+# coding: utf-8
+"""Test live redrawing."""
+
+import random
+import re
+
+import pytest
+
+from terminaltables import AsciiTable
+from terminaltables.live import changed_span, LiveTable, replay
+from terminaltables.other_tables import UnixTable
+from terminaltables.width_and_alignment import RE_ESCAPE_CODES, visible_width
+
+RE_CURSOR = re.compile(r'\033\[(\d*)([ABGJ])')
+
+
+class Screen(object):
+    """Minimal terminal: cursor movement, erasing, wide characters, colors, and charsets."""
+
+    def __init__(self):
+        """Constructor."""
+        self.cells = [[]]
+        self.row = self.column = 0
+        self.sgr, self.charset = (), 'B'
+
+    def feed(self, text):
+        """Process printed text.
+
+        :param str text: Text to process.
+        """
+        position = 0
+        while position < len(text):
+            match = RE_CURSOR.match(text, position)
+            if match:
+                count, command = int(match.group(1) or 1), match.group(2)
+                if command == 'A':
+                    self.row = max(self.row - count, 0)
+                elif command == 'B':
+                    self.row = min(self.row + count, len(self.cells) - 1)
+                elif command == 'G':
+                    self.column = count - 1
+                else:
+                    del self.cells[self.row][self.column:]
+                    del self.cells[self.row + 1:]
+                position = match.end()
+                continue
+            char = text[position]
+            if char == '\033':
+                code = RE_ESCAPE_CODES.match(text, position).group()
+                if code.startswith('\033('):
+                    self.charset = code[2]
+                elif code in ('\033[0m', '\033[m'):
+                    self.sgr = ()
+                else:
+                    self.sgr += (code,)
+                position += len(code)
+                continue
+            if char == '\r':
+                self.column = 0
+            elif char == '\n':
+                self.row += 1
+                self.column = 0
+                if self.row == len(self.cells):
+                    self.cells.append([])
+            else:
+                width = visible_width(char)
+                line = self.cells[self.row]
+                line.extend([None] * (self.column + width - len(line)))
+                line[self.column:self.column + width] = [(char, self.sgr, self.charset)] + [None] * (width - 1)
+                self.column += width
+            position += 1
+
+
+def test_changed_span():
+    """Test rewriting parts of lines."""
+    assert changed_span('| a | b | c |', '| a | x | c |') == '\033[7Gx'
+    assert changed_span('| a | bcd |', '| a | bxd |') == '\033[8Gx'
+    assert changed_span('| 蓝色 | b |', '| 蓝色 | x |') == '\033[10Gx'
+    assert changed_span('\033(0x\033(B a \033(0x\033(B', '\033(0x\033(B b \033(0x\033(B') == '\033[3G\033(Bb\033(B'
+    assert changed_span('ab', 'xy') == '\rxy'  # Shorter.
+    assert changed_span('| \033[31ma\033[0m |', '| \033[31mb\033[0m |') == '\033[3G\033[31mb\033[0m'
+
+
+def test_replay():
+    """Test reducing escape sequences."""
+    assert replay(['\033(0', '\033(B', '\033[31m', '\033[0m', '\033[1m', '\033[4m']) == '\033[0m\033[1m\033[4m\033(B'
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, UnixTable])
+def test_frames(cls):
+    """Test that the screen always shows the latest frame, and that unchanged frames print nothing.
+
+    :param cls: Table class.
+    """
+    rng = random.Random(0)
+    words = ['a', 'b', 'Avocado', u'蓝色', '\033[31mred\033[0m', 'x\ny']
+    table = cls([['Name', 'Value']] + [[rng.choice(words), rng.choice(words)] for _ in range(5)])
+    live, screen = LiveTable(table), Screen()
+    sizes = list()
+    for _ in range(200):
+        action = rng.random()
+        if action < 0.6:
+            row = rng.choice(table.table_data[1:])
+            row[rng.randint(0, 1)] = rng.choice(words)
+        elif action < 0.8:
+            table.table_data.append([rng.choice(words), rng.choice(words)])
+        elif len(table.table_data) > 2:
+            table.table_data.pop(rng.randint(1, len(table.table_data) - 1))
+        update = live.frame()
+        screen.feed(update)
+        expected = Screen()
+        expected.feed(table.table + '\n')
+        assert screen.cells == expected.cells
+        assert (screen.row, screen.column, screen.sgr, screen.charset) == (len(live.lines), 0, (), 'B')
+        assert live.frame() == ''
+        sizes.append(len(update) / float(len(table.table)))
+    assert sorted(sizes)[len(sizes) // 2] < 0.5  # Most updates are much smaller than full redraws.
+
+
+def test_write():
+    """Test writing to a stream."""
+    written = list()
+
+    class Stream(object):
+        """File-like object."""
+
+        write = written.append
+
+        @staticmethod
+        def flush():
+            """Flush."""
+            written.append(None)
+
+    table = AsciiTable([['a']])
+    live = LiveTable(table)
+    assert live.write(Stream()) == len(table.table) + 1
+    assert live.write(Stream()) == 0
+    table.table_data[0][0] = 'b'
+    assert live.write(Stream()) == len('\033[2A\033[3Gb\033[2B\r')
+    assert written == [table.table.replace('b', 'a') + '\n', None, '\033[2A\033[3Gb\033[2B\r', None]
+
+    live.reset()
+    assert live.frame() == table.table + '\n'
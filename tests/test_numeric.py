@@ -0,0 +1,92 @@
+# coding: utf-8
+"""Test functions in module."""
+
+import pytest
+
+from terminaltables import AsciiTable, ColumnData
+from terminaltables import numeric
+from terminaltables.table_data import MeasuredColumn
+from terminaltables.width_and_alignment import measure_cell
+
+
+@pytest.mark.skipif(numeric.numpy is not None, reason='NumPy is installed.')
+def test_without_numpy():
+    """Test a clear error when NumPy isn't installed."""
+    with pytest.raises(ImportError):
+        numeric.format_array([1, 2])
+
+
+@pytest.mark.parametrize('fmt,expected', [
+    ('%.2f', True),
+    ('%+d items', True),
+    (u'%d°', False),
+    ('%d\n', False),
+])
+def test_is_plain(fmt, expected):
+    """Test function.
+
+    :param str fmt: Format.
+    :param bool expected: Expected return value.
+    """
+    assert numeric.is_plain(fmt) is expected
+
+
+def test_measured_column():
+    """Test pre-measured columns are used as they are, without measuring cells again."""
+    cells = ['1', '22', '333']
+    metrics = [measure_cell(c) for c in cells]
+    column = MeasuredColumn(cells, metrics, 3)
+    table_data = ColumnData([column, ['a', 'b', 'c']], heading=['N', 'L'])
+    assert table_data.table_metrics[1][0] is metrics[0]
+    assert table_data.inner_widths == [3, 1]
+    assert AsciiTable(table_data).table == AsciiTable([['N', 'L'], ['1', 'a'], ['22', 'b'], ['333', 'c']]).table
+
+
+@pytest.mark.parametrize('values,fmt', [
+    ([1, -20, 300], None),
+    ([1.5, float('nan'), -1e20, 0.1], None),
+    ([1.5, 2.25], '%.1f'),
+    ([7, 8], '%+05d'),
+    ([True, False], None),
+    ([], None),
+])
+def test_format_array(values, fmt):
+    """Test cells and measurements are what the renderer would compute itself.
+
+    :param list values: Column values.
+    :param str fmt: Format.
+    """
+    numpy = pytest.importorskip('numpy')
+    column = numeric.format_array(numpy.array(values), fmt)
+    assert isinstance(column, MeasuredColumn)
+    expected = [str(v) for v in numpy.array(values)] if fmt is None else [fmt % v for v in values]
+    assert list(column) == expected
+    assert column.metrics == [measure_cell(c) for c in expected]
+    assert column.width == max([len(c) for c in expected] or [0])
+
+
+def test_format_array_other():
+    """Test non-numeric columns and formats that need measuring are returned unchanged."""
+    numpy = pytest.importorskip('numpy')
+    values = numpy.array([u'蓝色', u'a'])
+    assert numeric.format_array(values) is values
+    values = numpy.array([1, 2])
+    assert numeric.format_array(values, u'%d°') is values
+    with pytest.raises(ValueError):
+        numeric.format_array(numpy.zeros((2, 2)))
+
+
+def test_from_dataframe():
+    """Test rendering a DataFrame is identical to rendering its formatted rows."""
+    pytest.importorskip('numpy')
+    pandas = pytest.importorskip('pandas')
+    frame = pandas.DataFrame({'name': ['Avocado', u'蓝色\nx'], 'count': [3, -120], 'price': [1.5, 0.25]},
+                             columns=['name', 'count', 'price'])
+    frame.index.name = 'id'
+    table_data = numeric.from_dataframe(frame, formats={'price': '%.2f'}, index=True)
+    expected = [
+        ['id', 'name', 'count', 'price'],
+        ['0', 'Avocado', '3', '1.50'],
+        ['1', u'蓝色\nx', '-120', '0.25'],
+    ]
+    assert AsciiTable(table_data).table == AsciiTable(expected).table
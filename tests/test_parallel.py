@@ -0,0 +1,99 @@
+# coding: utf-8
+"""Test parallel rendering."""
+
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from terminaltables import AsciiTable, GithubFlavoredMarkdownTable, SingleTable
+from terminaltables.other_tables import UnixTable
+from terminaltables.parallel import gen_chunks
+from terminaltables.table_data import TableData
+from terminaltables.width_and_alignment import WIDTH_CACHE
+
+WORDS = ['', 'a', 'Avocado', u'蓝色', 'One\nTwo', 123, '\033[31mRed\033[39m']
+
+
+def make_table(cls, rows, seed):
+    """Build a table with random ragged rows and random border settings.
+
+    :param cls: Table class.
+    :param int rows: Number of rows.
+    :param int seed: Random seed.
+
+    :return: The table.
+    """
+    rng = random.Random(seed)
+    table = cls([[rng.choice(WORDS) for _ in range(rng.randint(1, 4))] for _ in range(rows)])
+    table.inner_row_border = rng.random() < 0.5
+    table.inner_footing_row_border = rng.random() < 0.5
+    if cls is not GithubFlavoredMarkdownTable:
+        table.title = 'Title'
+    return table
+
+
+@pytest.mark.parametrize('cls', [AsciiTable, GithubFlavoredMarkdownTable, SingleTable, UnixTable])
+@pytest.mark.parametrize('rows', [0, 1, 2, 9])
+def test_threads(cls, rows):
+    """Test that every chunk size gives the same output as the serial render.
+
+    :param cls: Table class.
+    :param int rows: Number of rows.
+    """
+    table = make_table(cls, rows, rows)
+    expected = table.table
+    with ThreadPoolExecutor(3) as executor:
+        for chunk_rows in (1, 2, 4, 100):
+            assert table.render_parallel(executor, chunk_rows) == expected
+        assert len(list(gen_chunks(table, executor, 4))) == max((rows + 3) // 4, 1)
+
+
+def test_threads_width_cache():
+    """Test many threads measuring non-ASCII cells through a small shared width cache while switching often."""
+    rng = random.Random(0)
+    table = AsciiTable([[u'世界{0}'.format(rng.randint(0, 63)) for _ in range(6)] for _ in range(8000)])
+    maxsize, interval = WIDTH_CACHE.maxsize, sys.getswitchinterval()
+    WIDTH_CACHE.clear()
+    WIDTH_CACHE.maxsize = 16
+    sys.setswitchinterval(1e-6)
+    try:
+        expected = table.table
+        with ThreadPoolExecutor(8) as executor:
+            assert table.render_parallel(executor, 500) == expected
+    finally:
+        sys.setswitchinterval(interval)
+        WIDTH_CACHE.maxsize = maxsize
+        WIDTH_CACHE.clear()
+
+
+def test_processes():
+    """Test a process pool, TableData, and writing."""
+    table = make_table(AsciiTable, 25, 1)
+    table.table_data = TableData(table.table_data)
+    expected = table.table
+    with ProcessPoolExecutor(2) as executor:
+        assert table.render_parallel(executor, 4) == expected
+        written = list()
+
+        class Stream(object):
+            """File-like object."""
+
+            write = written.append
+
+        assert table.write_parallel(Stream(), executor, 10) == len(expected)
+    assert len(written) == 3
+    assert ''.join(written) == expected
+
+
+def test_default_executor():
+    """Test the default pool."""
+    table = make_table(AsciiTable, 5, 2)
+    assert table.render_parallel(chunk_rows=2) == table.table
+
+
+def test_bad_chunk_rows():
+    """Test invalid chunk size."""
+    with pytest.raises(ValueError):
+        AsciiTable([['a']]).render_parallel(chunk_rows=0)
@@ -0,0 +1,71 @@
+# coding: utf-8
+"""Test render instrumentation."""
+
+import threading
+
+from terminaltables import AsciiTable
+from terminaltables.stats import active_collectors, RenderStats, StatsCollector
+
+
+def test_collect():
+    """Test timings and counters of a render."""
+    table_data = [['Name', 'Color'], ['Avocado', u'蓝色'], ['Tomato', 'red\ngreen']]
+    expected = AsciiTable(table_data, 'Title').table
+    table = AsciiTable(table_data, 'Title')
+    hooked = list()
+
+    with StatsCollector(hook=hooked.append) as collector:
+        assert active_collectors() == [collector]
+        assert table.table == expected
+    assert not active_collectors()
+    assert table.table == expected  # Not collected.
+
+    assert len(collector.renders) == 1
+    assert hooked == collector.renders
+    stats = collector.renders[0]
+    assert isinstance(stats, RenderStats)
+    assert stats.table_class == 'AsciiTable'
+    assert stats.cells_measured == 6
+    assert stats.lines == len(expected.splitlines()) == 7
+    assert stats.chars == len(expected)
+    assert stats.bytes == len(expected.encode('utf-8')) == stats.chars + 4  # Two 3-byte characters.
+    assert stats.borders_built == 3  # Top (with title), heading, bottom.
+    assert all(getattr(stats, n) >= 0 for n in RenderStats.PHASES)
+    assert abs(stats.total - sum(getattr(stats, n) for n in RenderStats.PHASES)) < 1e-9
+
+    values = stats.as_dict()
+    assert values['lines'] == 7
+    assert values['table_class'] == 'AsciiTable'
+    assert set(values) == set(RenderStats.PHASES + RenderStats.COUNTERS + ('table_class', 'total'))
+
+
+def test_reused_measurements():
+    """Test that rendering a prepared table twice only measures cells and builds borders once."""
+    table = AsciiTable([['a', 'b'], ['c', 'd']])
+    prepared = table.prepare()
+    with StatsCollector() as collector:
+        first, second = table.render(prepared), table.render(prepared)
+    assert first == second
+    assert [s.cells_measured for s in collector.renders] == [4, 0]
+    assert [s.borders_built for s in collector.renders] == [3, 0]
+
+
+def test_nested():
+    """Test that every active collector sees the render."""
+    table = AsciiTable([['a']])
+    with StatsCollector() as outer:
+        with StatsCollector() as inner:
+            table.table  # pylint: disable=pointless-statement
+        table.table  # pylint: disable=pointless-statement
+    assert len(inner.renders) == 1
+    assert len(outer.renders) == 2
+
+
+def test_other_thread():
+    """Test that collectors only see renders in their own thread."""
+    table = AsciiTable([['a']])
+    with StatsCollector() as collector:
+        thread = threading.Thread(target=lambda: table.table)
+        thread.start()
+        thread.join()
+    assert not collector.renders
@@ -0,0 +1,104 @@
+# coding: utf-8
+"""Test TableData class."""
+
+import random
+
+from terminaltables import AsciiTable, TableData
+from terminaltables.width_and_alignment import max_dimensions
+
+
+def assert_dimensions(table_data):
+    """Compare incrementally maintained dimensions with measuring everything from scratch.
+
+    :param TableData table_data: Instance to check.
+    """
+    plain = [list(r) for r in table_data]
+    inner_widths, inner_heights = max_dimensions(plain)[:2]
+    assert table_data.inner_widths == inner_widths
+    assert table_data.inner_heights == inner_heights
+
+
+def test_rows():
+    """Test appending, replacing, and deleting rows."""
+    table_data = TableData([['Name', 'Color'], ['Avocado', 'green']])
+    assert table_data.inner_widths == [7, 5]
+    assert table_data.inner_heights == [1, 1]
+
+    table_data.append(['Watermelon', 'green\n蓝色', 'fruit'])
+    assert table_data.inner_widths == [10, 5, 5]
+    assert table_data.inner_heights == [1, 1, 2]
+
+    # Remove widest cell.
+    del table_data[-1]
+    assert table_data.inner_widths == [7, 5]
+    assert table_data.inner_heights == [1, 1]
+
+    table_data[0] = ['Name']
+    assert table_data.inner_widths == [7, 5]
+    table_data[1:] = []
+    assert table_data.inner_widths == [4]
+    table_data.pop()
+    assert table_data.inner_widths == []
+    assert table_data.inner_heights == []
+
+
+def test_cells():
+    """Test changing cells within rows."""
+    table_data = TableData([['Name', 'Color'], ['Avocado', 'green']])
+    row = table_data[1]
+    row[0] = 'Watermelon'
+    assert table_data.inner_widths == [10, 5]
+    row[0] = ''
+    assert table_data.inner_widths == [4, 5]
+    row.append('One\nTwo')
+    assert table_data.inner_widths == [4, 5, 3]
+    assert table_data.inner_heights == [1, 2]
+    del row[0]
+    assert table_data.inner_widths == [5, 5]  # Remaining cells shifted left.
+    assert list(row) == ['green', 'One\nTwo']
+
+    # Detached rows no longer affect the table.
+    del table_data[1]
+    row[0] = 'Lettuce is a leafy vegetable'
+    assert table_data.inner_widths == [4, 5]
+
+
+def test_random():
+    """Test many random changes against measuring from scratch."""
+    rng = random.Random(0)
+    words = ['', 'a', 'ab', 'abc', '世界', 'one\ntwo', 'Watermelon']
+    table_data = TableData()
+    for _ in range(500):
+        action = rng.randint(0, 5)
+        if action < 2 or not table_data:
+            table_data.insert(rng.randint(0, len(table_data)), [rng.choice(words) for _ in range(rng.randint(0, 4))])
+        elif action == 2:
+            del table_data[rng.randrange(len(table_data))]
+        elif action == 3:
+            row = table_data[rng.randrange(len(table_data))]
+            if row:
+                row[rng.randrange(len(row))] = rng.choice(words)
+        elif action == 4:
+            table_data[rng.randrange(len(table_data))] = [rng.choice(words)]
+        else:
+            row = table_data[rng.randrange(len(table_data))]
+            if row:
+                del row[rng.randrange(len(row))]
+        assert_dimensions(table_data)
+
+
+def test_render():
+    """Test rendering tables and detecting changes without invalidate()."""
+    plain = [['Name', 'Color', 'Type'], ['Avocado', 'green', 'nut'], ['Tomato', 'red', 'fruit']]
+    table_data = TableData(plain)
+    table = AsciiTable(table_data)
+    assert table.table == AsciiTable(plain).table
+
+    prepared = table.prepare()
+    assert prepared.column_widths == [7, 5, 5]
+    table_data.append(['Lettuce', 'green', 'vegetable'])
+    table_data[1][0] = 'Avocado\nPear'
+    plain.append(['Lettuce', 'green', 'vegetable'])
+    plain[1][0] = 'Avocado\nPear'
+    assert prepared.column_widths == [7, 5, 9]
+    assert prepared.table == AsciiTable(plain).table
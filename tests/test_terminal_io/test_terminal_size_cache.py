@@ -0,0 +1,127 @@
+"""Test class in module."""
+
+import os
+import signal
+
+import pytest
+
+from terminaltables.terminal_io import IS_WINDOWS, TerminalSize
+
+
+class Query(object):
+    """Mock terminal_size() that counts calls."""
+
+    def __init__(self):
+        """Constructor."""
+        self.calls = 0
+        self.size = (80, 24)
+
+    def __call__(self):
+        """Return the mocked size."""
+        self.calls += 1
+        return self.size
+
+
+@pytest.fixture
+def restore_sigwinch():
+    """Put back the original SIGWINCH handler after the test."""
+    previous = signal.getsignal(signal.SIGWINCH)
+    yield
+    signal.signal(signal.SIGWINCH, previous)
+
+
+def test_poll(monkeypatch):
+    """Test caching without a signal handler.
+
+    :param monkeypatch: pytest fixture.
+    """
+    now = [100.0]
+    monkeypatch.setattr('terminaltables.terminal_io.clock', lambda: now[0])
+    query = Query()
+    cached = TerminalSize(query, poll_interval=0.5, use_signal=False)
+
+    assert cached() == (80, 24)
+    assert cached() == (80, 24)
+    assert query.calls == 1
+
+    query.size = (100, 30)
+    now[0] += 0.4
+    assert cached() == (80, 24)
+    now[0] += 0.1
+    assert cached() == (100, 30)
+    assert query.calls == 2
+
+    cached.invalidate()
+    assert cached() == (100, 30)
+    assert query.calls == 3
+    assert not cached.watching
+
+
+def test_pinned():
+    """Test pinning a size."""
+    query = Query()
+    cached = TerminalSize(query, use_signal=False)
+    cached.pinned = (120, 40)
+    assert cached() == (120, 40)
+    assert query.calls == 0
+    cached.pinned = None
+    assert cached() == (80, 24)
+
+
+@pytest.mark.skipif(str(IS_WINDOWS))
+@pytest.mark.usefixtures('restore_sigwinch')
+def test_sigwinch():
+    """Test resizing the terminal."""
+    received = list()
+    signal.signal(signal.SIGWINCH, lambda signum, _: received.append(signum))
+    query = Query()
+    cached = TerminalSize(query, poll_interval=0, use_signal=True)
+
+    assert cached() == (80, 24)
+    assert cached.watching
+    assert cached() == (80, 24)
+    assert query.calls == 1  # No polling once the handler is installed.
+
+    query.size = (100, 30)
+    os.kill(os.getpid(), signal.SIGWINCH)
+    assert cached() == (100, 30)
+    assert query.calls == 2
+    assert received == [signal.SIGWINCH]  # Previous handler still called.
+
+
+@pytest.mark.skipif(str(IS_WINDOWS))
+@pytest.mark.usefixtures('restore_sigwinch')
+def test_opt_in():
+    """Test no handler is installed unless asked for."""
+    previous = signal.getsignal(signal.SIGWINCH)
+    cached = TerminalSize(Query())
+    assert cached() == (80, 24)
+    assert not cached.watching
+    assert signal.getsignal(signal.SIGWINCH) is previous
+
+
+@pytest.mark.skipif(str(IS_WINDOWS))
+@pytest.mark.usefixtures('restore_sigwinch')
+def test_handler_replaced(monkeypatch):
+    """Test polling resumes when another SIGWINCH handler replaces ours.
+
+    :param monkeypatch: pytest fixture.
+    """
+    now = [100.0]
+    monkeypatch.setattr('terminaltables.terminal_io.clock', lambda: now[0])
+    query = Query()
+    cached = TerminalSize(query, poll_interval=0.5)
+    assert cached.watch()
+    assert cached() == (80, 24)
+    assert query.calls == 1
+
+    signal.signal(signal.SIGWINCH, signal.SIG_DFL)  # E.g. curses.
+    query.size = (100, 30)
+    assert cached() == (100, 30)  # Queried again, a resize may have been missed.
+    assert not cached.watching
+    assert query.calls == 2
+
+    now[0] += 0.5
+    query.size = (90, 20)
+    assert cached() == (90, 20)
+    assert signal.getsignal(signal.SIGWINCH) == signal.SIG_DFL  # Not reinstalled.
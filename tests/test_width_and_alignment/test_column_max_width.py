@@ -2,6 +2,7 @@
 
 import pytest
 
+from terminaltables.terminal_io import TERMINAL_SIZE
 from terminaltables.width_and_alignment import column_max_width, max_dimensions
 
 
@@ -105,3 +106,13 @@ def test_multi_line(monkeypatch):
     monkeypatch.setattr('terminaltables.width_and_alignment.terminal_size', lambda: (100, 24))
     assert column_max_width(inner_widths, 0, outer, inner, padding) == 10
     assert column_max_width(inner_widths, 1, outer, inner, padding) == 83
+
+
+def test_pinned(monkeypatch):
+    """Test that the cached terminal size is used and can be pinned.
+
+    :param monkeypatch: pytest fixture.
+    """
+    monkeypatch.undo()
+    monkeypatch.setattr(TERMINAL_SIZE, 'pinned', (100, 24))
+    assert column_max_width(max_dimensions([['']])[0], 0, 0, 0, 0) == 100
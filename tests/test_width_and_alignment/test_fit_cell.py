@@ -0,0 +1,113 @@
+# coding: utf-8
+"""Test functions in module."""
+
+import pytest
+from colorclass import Color
+
+from terminaltables.width_and_alignment import fit_cell, measure_cell, open_escapes, split_line, wrap_line
+
+
+@pytest.mark.parametrize('line,width,expected', [
+    ('abcdef', 3, ('abc', 'def')),
+    ('abc', 5, ('abc', '')),
+    ('abc', 0, ('', 'abc')),
+    (u'蓝色abc', 3, (u'蓝', u'色abc')),
+    (u'蓝色abc', 4, (u'蓝色', u'abc')),
+    ('\033[31mabc\033[39mdef', 3, ('\033[31mabc\033[39m', 'def')),
+    ('\033]8;;http://x\033\\link\033]8;;\033\\', 2, ('\033]8;;http://x\033\\li', 'nk\033]8;;\033\\')),
+])
+def test_split_line(line, width, expected):
+    """Test function.
+
+    :param str line: Input line.
+    :param int width: Maximum width of head.
+    :param tuple expected: Expected head and rest.
+    """
+    assert split_line(line, width) == expected
+
+
+@pytest.mark.parametrize('line,width,expected', [
+    ('', 3, [('', 0)]),
+    ('abcdefg', 3, [('abc', 3), ('def', 3), ('g', 1)]),
+    ('ab cd ef', 5, [('ab cd', 5), ('ef', 2)]),
+    ('ab cdef', 4, [('ab', 2), ('cdef', 4)]),
+    ('abc def', 3, [('abc', 3), ('def', 3)]),
+    ('a bcdefgh', 4, [('a', 1), ('bcde', 4), ('fgh', 3)]),
+    ('abc', 0, [('a', 1), ('b', 1), ('c', 1)]),
+    (u'蓝色 蓝色', 5, [(u'蓝色', 4), (u'蓝色', 4)]),
+    (u'蓝色蓝', 3, [(u'蓝', 2), (u'色', 2), (u'蓝', 2)]),
+    ('\033[31mab cd\033[39m', 2, [('\033[31mab\033[0m', 2), ('\033[31mcd\033[39m', 2)]),
+    (Color('{red}ab cd{/red}'), 3, [('\033[31mab\033[0m', 2), ('\033[31mcd\033[39m', 2)]),
+    ('\033[31mhello world\033[0m', 5, [('\033[31mhello\033[0m', 5), ('\033[31mworld\033[0m', 5)]),
+    ('\033[31mab\033[39m cd', 2, [('\033[31mab\033[39m', 2), ('cd', 2)]),
+    ('\033(0qqqq qq\033(B', 4, [('\033(0qqqq\033(B', 4), ('\033(0qq\033(B', 2)]),
+])
+def test_wrap_line(line, width, expected):
+    """Test function.
+
+    :param str line: Input line.
+    :param int width: Maximum width of pieces.
+    :param list expected: Expected pieces and widths.
+    """
+    assert wrap_line(line, width) == expected
+
+
+@pytest.mark.parametrize('codes,expected', [
+    ([], ('', '')),
+    (['\033[31m', '\033[1m'], ('\033[31m\033[1m', '\033[0m')),
+    (['\033[31m', '\033[0m', '\033[4m'], ('\033[4m', '\033[0m')),
+    (['\033[31m', '\033[1m', '\033[39m'], ('\033[1m', '\033[0m')),
+    (['\033[38;5;9m', '\033[39m'], ('', '')),
+    (['\033[1;31m', '\033[22m'], ('\033[1;31m\033[22m', '\033[0m')),
+    (['\033(0', '\033)0', '\033)B'], ('\033(0', '\033(B')),
+    (['\033(0', '\033(B'], ('', '')),
+])
+def test_open_escapes(codes, expected):
+    """Test function.
+
+    :param list codes: Escape sequences.
+    :param tuple expected: Expected restore and reset sequences.
+    """
+    assert open_escapes(codes) == expected
+
+
+@pytest.mark.parametrize('cell,width,overflow,lines', [
+    ('abc', 3, 'ellipsis', ['abc']),
+    ('abcdef', 5, 'ellipsis', ['ab...']),
+    ('abcdef', 2, 'ellipsis', ['..']),
+    ('abc\nabcdef', 4, 'ellipsis', ['abc', 'a...']),
+    (u'蓝色蓝色', 6, 'ellipsis', [u'蓝...']),
+    (Color('{red}abcdef{/red}'), 5, 'ellipsis', ['\033[31mab...\033[39m']),
+    ('abcdef', 5, 'truncate', ['abcde']),
+    ('abc\nabcdef', 2, 'truncate', ['ab', 'ab']),
+    (u'蓝色蓝色', 5, 'truncate', [u'蓝色']),
+    (Color('{red}abcdef{/red}'), 4, 'truncate', ['\033[31mabcd\033[39m']),
+    ('abcdef', 4, 'wrap', ['abcd', 'ef']),
+    ('abcdef', 3, 'wrap', ['abc', 'def']),
+    ('ab\nabcdef', 4, 'wrap', ['ab', 'abcd', 'ef']),
+    (u'蓝色蓝', 3, 'wrap', [u'蓝', u'色', u'蓝']),
+    (u'蓝色', 1, 'wrap', [u'蓝', u'色']),
+    ('ab cd\nx', 3, 'wrap', ['ab', 'cd', 'x']),
+])
+def test_fit_cell(cell, width, overflow, lines):
+    """Test function.
+
+    :param str cell: Input cell.
+    :param int width: Maximum width.
+    :param str overflow: Overflow policy.
+    :param list lines: Expected lines.
+    """
+    metrics = fit_cell(measure_cell(cell), width, overflow)
+    assert metrics.lines == lines
+    assert metrics.widths == [measure_cell(line).width for line in lines]
+    assert metrics.width == max(metrics.widths)
+    assert metrics.height == len(lines)
+    assert metrics.width <= width or width < 2
+
+
+def test_fits():
+    """Test that cells that already fit are returned unchanged."""
+    metrics = measure_cell('abc\nd')
+    assert fit_cell(metrics, 3, 'wrap') is metrics
+    assert fit_cell(metrics, 3, 'truncate') is metrics
+    assert fit_cell(metrics, 3, 'ellipsis') is metrics
@@ -0,0 +1,78 @@
+# coding: utf-8
+"""Test functions in module."""
+
+import pytest
+from colorclass import Color
+
+from terminaltables.width_and_alignment import align_and_pad_cell, CompactTableMetrics, fit_cell, max_dimensions
+from terminaltables.width_and_alignment import measure_cell, measure_table
+
+
+@pytest.mark.parametrize('cell,lines,widths,height', [
+    ('', [''], [0], 0),
+    ('Test', ['Test'], [4], 1),
+    (123, ['123'], [3], 1),
+    (None, ['None'], [4], 1),
+    ('蓝色', ['蓝色'], [4], 1),
+    (Color('{blue}Test{/blue}'), ['\x1b[34mTest\x1b[39m'], [4], 1),
+    ('One\nThree', ['One', 'Three'], [3, 5], 2),
+    ('One\n', ['One', ''], [3, 0], 2),
+    ('\n', ['', ''], [0, 0], 2),
+])
+def test_measure_cell(cell, lines, widths, height):
+    """Test function.
+
+    :param cell: Input cell.
+    :param list lines: Expected lines.
+    :param list widths: Expected widths of each line.
+    :param int height: Expected height.
+    """
+    actual = measure_cell(cell)
+    assert actual.lines == lines
+    assert actual.widths == widths
+    assert actual.width == max(widths)
+    assert actual.height == height
+
+
+def test_measure_table():
+    """Test that measured cells give the same results as raw cells."""
+    table_data = [
+        ['Name', 'Color', 'Type'],
+        ['Avocado', 'green\n蓝色', 'nut'],
+        ['Watermelon', ''],
+    ]
+    table_metrics = measure_table(table_data)
+    assert [len(r) for r in table_metrics] == [3, 3, 2]
+
+    expected = max_dimensions(table_data, 1, 2, 3, 4)
+    assert max_dimensions(table_data, 1, 2, 3, 4, table_metrics=table_metrics) == expected
+
+    for row, metrics_row in zip(table_data, table_metrics):
+        for cell, metrics in zip(row, metrics_row):
+            for align in ('left', 'center', 'right', 'top', 'middle', 'bottom'):
+                expected = align_and_pad_cell(cell, (align,), (12, 3), (1, 2, 1, 1))
+                assert align_and_pad_cell(metrics, (align,), (12, 3), (1, 2, 1, 1)) == expected
+
+
+def test_compact_table_metrics():
+    """Test that compactly stored measurements read back the same as measure_table(), also after fitting."""
+    table_data = [
+        ['Name', 123, None, ''],
+        [u'蓝色', Color('{blue}Test{/blue}'), 'One\nThree', 'One\n'],
+        ['Watermelon'],
+    ]
+    table_metrics = measure_table(table_data)
+    compact = CompactTableMetrics(table_data)
+    assert len(compact) == 3
+    assert list(compact) == table_metrics
+    assert [compact[i] for i in (0, 1, 2, -1)] == table_metrics + table_metrics[-1:]
+    assert [compact.inner_widths, compact.inner_heights] == list(max_dimensions(table_data)[:2])
+
+    def fit(row):
+        """Truncate the first column."""
+        return [fit_cell(row[0], 4, 'ellipsis')] + row[1:]
+
+    compact = CompactTableMetrics(table_data, fit)
+    assert list(compact) == [fit(r) for r in table_metrics]
+    assert compact[2][0].lines == ['W...']
+    assert compact.inner_widths[0] == 4
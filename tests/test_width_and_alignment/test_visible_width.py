@@ -1,12 +1,16 @@
 # coding: utf-8
 """Test function in module."""
 
+import sys
+import unicodedata
+
 import pytest
 from colorama import Fore
 from colorclass import Color
 from termcolor import colored
 
-from terminaltables.width_and_alignment import visible_width
+from terminaltables.width_and_alignment import build_wide_boundaries, CharWidths, CHR, visible_width
+from terminaltables.width_table import UNIDATA_VERSION, WIDE_BOUNDARIES
 
 
 @pytest.mark.parametrize('string,expected', [
@@ -57,3 +61,53 @@ def test(string, expected):
     :param int expected: Expected visible width of string (some characters are len() == 1 but take up 2 spaces).
     """
     assert visible_width(string) == expected
+
+
+@pytest.mark.parametrize('string,expected', [
+    ('\x1b[mhello\x1b[0m', 5),  # SGR without parameters.
+    ('\x1b[38:2::255:0:0mred\x1b[39m', 3),  # Colon separated SGR parameters.
+    ('\x1b[1;4;38;5;208m世界\x1b[0m', 4),
+    ('\x1b(0qqq\x1b(B', 3),  # DEC special graphics charset from UnixTable.
+    ('\x1b(0\x71\x1b(B\x1b(0\x6e\x1b(B', 2),
+    ('\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\', 4),  # OSC 8 hyperlink terminated by ST.
+    ('\x1b]8;;https://例子.测试\x07世界\x1b]8;;\x07', 4),  # Terminated by BEL, CJK in URL.
+    ('\x1b]0;title\x1b[31mred', 3),  # OSC aborted by another escape.
+    ('\x1bP+q544e\x1b\\abc', 3),  # DCS.
+    ('\x1b7abc\x1b8', 3),  # Save/restore cursor.
+    ('abc\x1b', 3),  # Incomplete.
+    ('abc\x1b[', 3),
+    ('abc\x1b]8;;https://example.com', 3),
+])
+def test_escape_codes(string, expected):
+    """Test other kinds of escape sequences.
+
+    :param str string: Input string to measure.
+    :param int expected: Expected visible width of string.
+    """
+    assert visible_width(string) == expected
+
+
+def test_lookup_table():
+    """Test that every code point (except escape) measures the same as unicodedata.east_asian_width() does."""
+    code_points = [c for c in range(sys.maxunicode + 1) if c != 0x1b]
+    expected = [2 if unicodedata.east_asian_width(CHR(c)) in ('F', 'W') else 1 for c in code_points]
+    actual = [visible_width(CHR(c)) for c in code_points]
+    assert actual == expected
+
+
+def test_shipped_table():
+    """Test that the shipped table is current or that it's ignored."""
+    if UNIDATA_VERSION != unicodedata.unidata_version:
+        pytest.skip('Shipped table generated for another unicodedata version.')
+    assert WIDE_BOUNDARIES == build_wide_boundaries()
+
+
+def test_table_fallback(monkeypatch):
+    """Test building the table lazily when the shipped one doesn't match the running Python.
+
+    :param monkeypatch: pytest fixture.
+    """
+    monkeypatch.setattr('terminaltables.width_and_alignment.WIDE', list())
+    monkeypatch.setattr('terminaltables.width_and_alignment.CHAR_WIDTHS', CharWidths())
+    assert visible_width('hello 世界') == 10
+    assert visible_width('') == 0
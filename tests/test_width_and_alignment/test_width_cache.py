@@ -0,0 +1,110 @@
+# coding: utf-8
+"""Test class in module."""
+
+import random
+import sys
+import threading
+
+from colorclass import Color
+
+from terminaltables.width_and_alignment import WidthCache
+
+
+def test_counters():
+    """Test hits, misses, and evictions."""
+    cache = WidthCache(maxsize=2)
+    assert cache.width('世界') == 4
+    assert cache.width('世界') == 4
+    assert (cache.hits, cache.misses, cache.evictions, len(cache)) == (1, 1, 0, 1)
+
+    assert cache.width(Color('{red}OK{/red}')) == 2
+    assert cache.width('蓝色') == 4
+    assert (cache.hits, cache.misses, cache.evictions, len(cache)) == (1, 3, 1, 2)
+
+    # Least recently used was evicted.
+    assert cache.width(Color('{red}OK{/red}')) == 2
+    assert cache.width('世界') == 4
+    assert (cache.hits, cache.misses, cache.evictions, len(cache)) == (2, 4, 2, 2)
+
+
+def test_ascii_bypass():
+    """Test that plain ASCII strings aren't cached."""
+    cache = WidthCache()
+    assert cache.width('OK') == 2
+    assert cache.width('') == 0
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_disable_and_clear():
+    """Test maxsize of 0 and clear()."""
+    cache = WidthCache(maxsize=0)
+    assert cache.width('世界') == 4
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+    cache.maxsize = 10
+    assert cache.width('世界') == 4
+    assert cache.width('世界') == 4
+    cache.clear()
+    assert (cache.hits, cache.misses, cache.evictions, len(cache)) == (0, 0, 0, 0)
+
+
+def test_shrink():
+    """Test lowering maxsize on a populated cache."""
+    cache = WidthCache(maxsize=10)
+    for string in ('世', '界', '你', '好'):
+        cache.width(string)
+    cache.maxsize = 2
+    cache.width('蓝')
+    assert (cache.evictions, len(cache)) == (3, 2)
+
+
+def test_lru_order():
+    """Test evictions follow least recently used order against a list-based model, also after clear()."""
+    rng = random.Random(0)
+    cache, model = WidthCache(maxsize=5), list()
+    strings = [u'蓝{0}'.format(i) for i in range(12)]
+    for i in range(2000):
+        if i == 1000:
+            cache.clear()
+            del model[:]
+        string = rng.choice(strings)
+        hits = cache.hits
+        assert cache.width(string) == len(string) + 1
+        assert (cache.hits > hits) is (string in model)
+        if string in model:
+            model.remove(string)
+        elif len(model) == 5:
+            model.pop(0)
+        model.append(string)
+        assert len(cache) == len(model)
+
+
+def test_threads():
+    """Test that threads sharing a small cache don't corrupt its linked list."""
+    cache, errors = WidthCache(maxsize=4), list()
+    strings = [u'世界{0}'.format(i) for i in range(16)]
+
+    def worker(seed):
+        """Look up random strings."""
+        rng = random.Random(seed)
+        try:
+            for _ in range(20000):
+                string = rng.choice(strings)
+                assert cache.width(string) == len(string) + 2
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors
+    assert len(cache) <= 4
+    assert cache.hits + cache.misses == 8 * 20000